@@ -10,6 +10,15 @@ import os
 import sys
 from datetime import datetime
 
+from cache_utils import normalize_failed
+
+# Use orjson for faster parsing when available
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Paths
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 PROJECT_ROOT = os.path.dirname(SCRIPT_DIR)
@@ -23,22 +32,39 @@ def load_target_schools(path: str = TARGET_SCHOOLS_PATH) -> dict:
         print(f"Error: Target schools file not found: {path}")
         sys.exit(1)
 
-    with open(path, "r") as f:
-        return json.load(f)
+    with open(path, "rb") as f:
+        raw = f.read()
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
 
 
 def load_progress() -> dict | None:
     """Load existing progress file if it exists."""
     if os.path.exists(PROGRESS_PATH):
-        with open(PROGRESS_PATH, "r") as f:
-            return json.load(f)
+        with open(PROGRESS_PATH, "rb") as f:
+            raw = f.read()
+        if ORJSON_AVAILABLE:
+            progress = orjson.loads(raw)
+        else:
+            progress = json.loads(raw)
+        return normalize_failed(progress)
     return None
 
 
 def save_progress(progress: dict) -> None:
     """Save progress to file."""
-    with open(PROGRESS_PATH, "w") as f:
-        json.dump(progress, f, indent=2)
+    # Always a full snapshot - the batch loop and launch_batch.sh read this
+    # file directly - but swapped in atomically so an interrupted save
+    # can't leave it truncated
+    if ORJSON_AVAILABLE:
+        data = orjson.dumps(progress, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(progress, indent=2).encode("utf-8")
+    tmp_path = PROGRESS_PATH + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, PROGRESS_PATH)
     print(f"Progress saved to: {PROGRESS_PATH}")
 
 
@@ -52,12 +78,14 @@ def create_fresh_progress(schools_data: dict) -> dict:
     # Extract just the school names for pending list
     pending = [s["name"] for s in sorted_schools]
 
+    now = datetime.now().isoformat()
+
     return {
         "batch_name": schools_data.get("batch_name", "Unnamed Batch"),
         "source_file": TARGET_SCHOOLS_PATH,
         "total_schools": len(pending),
-        "started": datetime.now().isoformat(),
-        "last_updated": datetime.now().isoformat(),
+        "started": now,
+        "last_updated": now,
         "current_school": None,
         "completed": [],
         "failed": [],
@@ -72,26 +100,28 @@ def show_status(progress: dict) -> None:
     failed = len(progress["failed"])
     pending = len(progress["pending"])
 
-    print(f"\n{'='*50}")
-    print(f"Batch: {progress['batch_name']}")
-    print(f"{'='*50}")
-    print(f"Total schools:  {total}")
-    print(f"Completed:      {completed} ({100*completed/total:.1f}%)" if total > 0 else "Completed:      0")
-    print(f"Failed:         {failed}")
-    print(f"Pending:        {pending}")
+    # Buffer all lines and emit them with a single write
+    lines = []
+
+    lines.append(f"\n{'='*50}")
+    lines.append(f"Batch: {progress['batch_name']}")
+    lines.append(f"{'='*50}")
+    lines.append(f"Total schools:  {total}")
+    lines.append(f"Completed:      {completed} ({100*completed/total:.1f}%)" if total > 0 else "Completed:      0")
+    lines.append(f"Failed:         {failed}")
+    lines.append(f"Pending:        {pending}")
 
     if progress["current_school"]:
-        print(f"\nCurrently processing: {progress['current_school']}")
+        lines.append(f"\nCurrently processing: {progress['current_school']}")
 
     if progress["failed"]:
-        print(f"\nFailed schools:")
+        lines.append(f"\nFailed schools:")
         for item in progress["failed"]:
-            if isinstance(item, dict):
-                print(f"  - {item['name']}: {item.get('reason', 'Unknown error')}")
-            else:
-                print(f"  - {item}")
+            lines.append(f"  - {item['name']}: {item['reason']}")
+
+    lines.append(f"{'='*50}\n")
 
-    print(f"{'='*50}\n")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def main():
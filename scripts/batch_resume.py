@@ -10,6 +10,15 @@ import os
 import sys
 from datetime import datetime
 
+from cache_utils import normalize_failed
+
+# Use orjson for faster parsing when available
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Paths
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 PROJECT_ROOT = os.path.dirname(SCRIPT_DIR)
@@ -19,16 +28,30 @@ PROGRESS_PATH = os.path.join(PROJECT_ROOT, "batch_progress.json")
 def load_progress() -> dict | None:
     """Load progress file if it exists."""
     if os.path.exists(PROGRESS_PATH):
-        with open(PROGRESS_PATH, "r") as f:
-            return json.load(f)
+        with open(PROGRESS_PATH, "rb") as f:
+            raw = f.read()
+        if ORJSON_AVAILABLE:
+            progress = orjson.loads(raw)
+        else:
+            progress = json.loads(raw)
+        return normalize_failed(progress)
     return None
 
 
 def save_progress(progress: dict) -> None:
     """Save progress to file."""
     progress["last_updated"] = datetime.now().isoformat()
-    with open(PROGRESS_PATH, "w") as f:
-        json.dump(progress, f, indent=2)
+    # Always a full snapshot - the batch loop and launch_batch.sh read this
+    # file directly - but swapped in atomically so an interrupted save
+    # can't leave it truncated
+    if ORJSON_AVAILABLE:
+        data = orjson.dumps(progress, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(progress, indent=2).encode("utf-8")
+    tmp_path = PROGRESS_PATH + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, PROGRESS_PATH)
 
 
 def reset_current_school(progress: dict) -> bool:
@@ -59,46 +82,70 @@ def retry_failed(progress: dict, school_name: str = None) -> bool:
         return False
 
     if school_name:
-        # Find specific school in failed list
-        found = None
-        for i, item in enumerate(progress["failed"]):
-            name = item["name"] if isinstance(item, dict) else item
-            if name.lower() == school_name.lower():
-                found = i
-                break
-
-        if found is None:
+        moved = retry_failed_many(progress, [school_name])
+
+        if not moved:
             print(f"School '{school_name}' not found in failed list.")
             return False
 
-        item = progress["failed"].pop(found)
-        name = item["name"] if isinstance(item, dict) else item
-        progress["pending"].insert(0, name)
-        save_progress(progress)
-        print(f"'{name}' moved from failed to pending.")
+        print(f"'{moved[0]}' moved from failed to pending.")
         return True
     else:
         # Move all failed schools back to pending
-        count = 0
-        while progress["failed"]:
-            item = progress["failed"].pop(0)
-            name = item["name"] if isinstance(item, dict) else item
-            progress["pending"].append(name)
-            count += 1
+        count = len(progress["failed"])
+        progress["pending"].extend(item["name"] for item in progress["failed"])
+        progress["failed"].clear()
 
         save_progress(progress)
         print(f"Moved {count} failed schools back to pending.")
         return True
 
 
+def retry_failed_many(progress: dict, school_names: list[str]) -> list[str]:
+    """
+    Move several failed schools back to the front of the pending queue.
+
+    Matching is case-insensitive and done in a single pass over the failed
+    list, so retrying K schools costs O(N + K) rather than O(N * K).
+
+    Args:
+        progress: Batch progress dictionary
+        school_names: Names of failed schools to retry
+
+    Returns:
+        Names of the schools that were moved (empty if none matched)
+    """
+    wanted = {name.lower() for name in school_names}
+
+    moved = []
+    still_failed = []
+    for item in progress["failed"]:
+        if item["name"].lower() in wanted:
+            moved.append(item["name"])
+        else:
+            still_failed.append(item)
+
+    if moved:
+        progress["failed"] = still_failed
+        progress["pending"][:0] = moved
+        save_progress(progress)
+
+    return moved
+
+
 def show_status(progress: dict) -> None:
     """Show brief status."""
-    print(f"\nBatch: {progress['batch_name']}")
-    print(f"Current school: {progress['current_school'] or 'None'}")
-    print(f"Completed: {len(progress['completed'])}")
-    print(f"Failed: {len(progress['failed'])}")
-    print(f"Pending: {len(progress['pending'])}")
-    print()
+    # Buffer all lines and emit them with a single write
+    lines = []
+
+    lines.append(f"\nBatch: {progress['batch_name']}")
+    lines.append(f"Current school: {progress['current_school'] or 'None'}")
+    lines.append(f"Completed: {len(progress['completed'])}")
+    lines.append(f"Failed: {len(progress['failed'])}")
+    lines.append(f"Pending: {len(progress['pending'])}")
+    lines.append("")
+
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def main():
@@ -8,8 +8,18 @@ Shows current progress of batch processing.
 import json
 import os
 import sys
+import time
 from datetime import datetime
 
+from cache_utils import normalize_failed
+
+# Use orjson for faster parsing when available
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Paths
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 PROJECT_ROOT = os.path.dirname(SCRIPT_DIR)
@@ -19,8 +29,13 @@ PROGRESS_PATH = os.path.join(PROJECT_ROOT, "batch_progress.json")
 def load_progress() -> dict | None:
     """Load progress file if it exists."""
     if os.path.exists(PROGRESS_PATH):
-        with open(PROGRESS_PATH, "r") as f:
-            return json.load(f)
+        with open(PROGRESS_PATH, "rb") as f:
+            raw = f.read()
+        if ORJSON_AVAILABLE:
+            progress = orjson.loads(raw)
+        else:
+            progress = json.loads(raw)
+        return normalize_failed(progress)
     return None
 
 
@@ -28,20 +43,25 @@ def format_duration(start_str: str) -> str:
     """Format duration since start."""
     try:
         start = datetime.fromisoformat(start_str)
-        delta = datetime.now() - start
-        hours = delta.seconds // 3600
-        minutes = (delta.seconds % 3600) // 60
-
-        if delta.days > 0:
-            return f"{delta.days}d {hours}h {minutes}m"
-        elif hours > 0:
-            return f"{hours}h {minutes}m"
-        else:
-            return f"{minutes}m"
+        return format_duration_epoch(start.timestamp())
     except:
         return "unknown"
 
 
+def format_duration_epoch(start_epoch: float) -> str:
+    """Format duration since start, given as epoch seconds."""
+    days, remainder = divmod(int(time.time() - start_epoch), 86400)
+    hours, remainder = divmod(remainder, 3600)
+    minutes = remainder // 60
+
+    if days > 0:
+        return f"{days}d {hours}h {minutes}m"
+    elif hours > 0:
+        return f"{hours}h {minutes}m"
+    else:
+        return f"{minutes}m"
+
+
 def show_detailed_status(progress: dict) -> None:
     """Display detailed progress status."""
     total = progress["total_schools"]
@@ -49,10 +69,13 @@ def show_detailed_status(progress: dict) -> None:
     failed = len(progress["failed"])
     pending = len(progress["pending"])
 
+    # Buffer all lines and emit them with a single write
+    lines = []
+
     # Header
-    print(f"\n{'='*60}")
-    print(f"BATCH STATUS: {progress['batch_name']}")
-    print(f"{'='*60}")
+    lines.append(f"\n{'='*60}")
+    lines.append(f"BATCH STATUS: {progress['batch_name']}")
+    lines.append(f"{'='*60}")
 
     # Progress bar
     if total > 0:
@@ -61,54 +84,51 @@ def show_detailed_status(progress: dict) -> None:
         bar_width = 40
         filled = int(bar_width * pct)
         bar = "█" * filled + "░" * (bar_width - filled)
-        print(f"\n[{bar}] {pct*100:.1f}%")
+        lines.append(f"\n[{bar}] {pct*100:.1f}%")
 
     # Stats
-    print(f"\n{'─'*30}")
-    print(f"Total schools:     {total}")
-    print(f"Completed:         {completed}")
-    print(f"Failed:            {failed}")
-    print(f"Pending:           {pending}")
-    print(f"{'─'*30}")
+    lines.append(f"\n{'─'*30}")
+    lines.append(f"Total schools:     {total}")
+    lines.append(f"Completed:         {completed}")
+    lines.append(f"Failed:            {failed}")
+    lines.append(f"Pending:           {pending}")
+    lines.append(f"{'─'*30}")
 
     # Timing
     if progress.get("started"):
-        print(f"\nStarted:      {progress['started']}")
-        print(f"Running for:  {format_duration(progress['started'])}")
+        lines.append(f"\nStarted:      {progress['started']}")
+        lines.append(f"Running for:  {format_duration(progress['started'])}")
 
     if progress.get("last_updated"):
-        print(f"Last update:  {progress['last_updated']}")
+        lines.append(f"Last update:  {progress['last_updated']}")
 
     # Current school
     if progress["current_school"]:
-        print(f"\n>>> Currently processing: {progress['current_school']}")
+        lines.append(f"\n>>> Currently processing: {progress['current_school']}")
 
     # Completed schools
     if progress["completed"]:
-        print(f"\nCompleted ({len(progress['completed'])}):")
+        lines.append(f"\nCompleted ({len(progress['completed'])}):")
         for school in progress["completed"][-10:]:  # Show last 10
-            print(f"  ✓ {school}")
+            lines.append(f"  ✓ {school}")
         if len(progress["completed"]) > 10:
-            print(f"  ... and {len(progress['completed']) - 10} more")
+            lines.append(f"  ... and {len(progress['completed']) - 10} more")
 
     # Failed schools
     if progress["failed"]:
-        print(f"\nFailed ({len(progress['failed'])}):")
+        lines.append(f"\nFailed ({len(progress['failed'])}):")
         for item in progress["failed"]:
-            if isinstance(item, dict):
-                print(f"  ✗ {item['name']}: {item.get('reason', 'Unknown error')}")
-            else:
-                print(f"  ✗ {item}")
+            lines.append(f"  ✗ {item['name']}: {item['reason']}")
 
     # Next up
     if progress["pending"]:
-        print(f"\nNext up:")
+        lines.append(f"\nNext up:")
         for school in progress["pending"][:5]:
-            print(f"  → {school}")
+            lines.append(f"  → {school}")
         if len(progress["pending"]) > 5:
-            print(f"  ... and {len(progress['pending']) - 5} more")
+            lines.append(f"  ... and {len(progress['pending']) - 5} more")
 
-    print(f"\n{'='*60}\n")
+    lines.append(f"\n{'='*60}\n")
 
     # Estimate completion
     if completed > 0 and pending > 0:
@@ -118,11 +138,13 @@ def show_detailed_status(progress: dict) -> None:
             avg_per_school = elapsed / (completed + failed)
             remaining_seconds = avg_per_school * pending
             remaining_hours = remaining_seconds / 3600
-            print(f"Estimated time remaining: {remaining_hours:.1f} hours")
-            print(f"(based on {avg_per_school/60:.1f} min avg per school)")
+            lines.append(f"Estimated time remaining: {remaining_hours:.1f} hours")
+            lines.append(f"(based on {avg_per_school/60:.1f} min avg per school)")
         except:
             pass
 
+    sys.stdout.write("\n".join(lines) + "\n")
+
 
 def show_json(progress: dict) -> None:
     """Output progress as JSON."""
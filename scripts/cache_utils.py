@@ -6,17 +6,48 @@ Used by the orchestrator to determine when to refresh data.
 """
 
 import json
+import mmap
 import os
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
 
+# Use orjson for faster parsing when available
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Files at or above this size are parsed straight from a read-only mmap
+# (orjson only); below it the mapping overhead outweighs the saved copy.
+MMAP_THRESHOLD_BYTES = 16 * 1024
+
+# Default paths, resolved once at import time
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_CONFIG_PATH = os.path.normpath(os.path.join(SCRIPT_DIR, "..", "config.json"))
+DEFAULT_CACHE_DIR = os.path.normpath(os.path.join(SCRIPT_DIR, "..", "cache"))
+
+# Translation tables for single-pass name normalization
+_DIR_NAME_TABLE = str.maketrans({" ": "_", "-": "_"})
+_COACH_NAME_TABLE = str.maketrans({" ": "_", "-": "_", "'": None})
+
 
 def load_json_file(filepath: str) -> Optional[Dict]:
     """Load a JSON file and return its contents, or None if not found."""
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        with open(filepath, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            if ORJSON_AVAILABLE and size >= MMAP_THRESHOLD_BYTES:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    with memoryview(mm) as view:
+                        return orjson.loads(view)
+            raw = f.read()
+        if ORJSON_AVAILABLE:
+            return orjson.loads(raw)
+        return json.loads(raw)
     except (FileNotFoundError, json.JSONDecodeError):
         return None
 
@@ -24,8 +55,7 @@ def load_json_file(filepath: str) -> Optional[Dict]:
 def load_config(config_path: str = None) -> Dict:
     """Load configuration file with defaults."""
     if config_path is None:
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        config_path = os.path.join(script_dir, "..", "config.json")
+        config_path = DEFAULT_CONFIG_PATH
 
     config = load_json_file(config_path)
     if config is None:
@@ -37,16 +67,33 @@ def load_config(config_path: str = None) -> Dict:
     return config
 
 
+def normalize_failed(progress: dict) -> dict:
+    """Normalize failed entries (bare names or dicts) to {"name", "reason"} dicts.
+
+    Used by the batch_* scripts when loading batch_progress.json.
+    """
+    progress["failed"] = [
+        {**item, "reason": item.get("reason", "Unknown error")} if isinstance(item, dict)
+        else {"name": item, "reason": "Unknown error"}
+        for item in progress.get("failed", [])
+    ]
+    return progress
+
+
 def normalize_school_dir_name(school_name: str) -> str:
     """Convert school name to directory name format."""
-    return school_name.lower().replace(" ", "_").replace("-", "_")
+    return school_name.lower().translate(_DIR_NAME_TABLE)
+
+
+def normalize_coach_name(name: str) -> str:
+    """Convert coach name to the coach file naming convention."""
+    return name.lower().translate(_COACH_NAME_TABLE)
 
 
 def get_cache_path(school_name: str, cache_base_dir: str = None) -> str:
     """Get the cache directory path for a school."""
     if cache_base_dir is None:
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        cache_base_dir = os.path.join(script_dir, "..", "cache")
+        cache_base_dir = DEFAULT_CACHE_DIR
 
     school_dir = normalize_school_dir_name(school_name)
     return os.path.join(cache_base_dir, school_dir)
@@ -82,7 +129,11 @@ def get_cache_age_days(roster_path: str) -> Optional[int]:
     Returns:
         Number of days since data was fetched, or None if cannot determine
     """
-    roster = load_json_file(roster_path)
+    return _age_days_from_roster(load_json_file(roster_path))
+
+
+def _age_days_from_roster(roster: Optional[Dict]) -> Optional[int]:
+    """Get the cache age in days from an already-parsed roster dict."""
     if roster is None:
         return None
 
@@ -109,7 +160,33 @@ def is_cache_stale(roster_path: str, staleness_days: int = 30) -> bool:
     Returns:
         True if cache is stale or doesn't exist, False if fresh
     """
-    age = get_cache_age_days(roster_path)
+    return _is_age_stale(get_cache_age_days(roster_path), staleness_days)
+
+
+def is_cache_stale_fast(roster_path: str, staleness_days: int = 30) -> bool:
+    """
+    Approximate staleness check using roster.json's mtime instead of parsing it.
+
+    The roster is written when it is fetched, so its mtime tracks
+    fetched_date closely. Use this for bulk sweeps that only need a yes/no
+    answer; use is_cache_stale when the logical fetched_date matters.
+
+    Args:
+        roster_path: Path to roster.json file
+        staleness_days: Number of days after which cache is considered stale
+
+    Returns:
+        True if cache is stale or doesn't exist, False if fresh
+    """
+    try:
+        mtime = os.stat(roster_path).st_mtime
+    except OSError:
+        return True
+    return (time.time() - mtime) > staleness_days * 86400
+
+
+def _is_age_stale(age: Optional[int], staleness_days: int) -> bool:
+    """Apply the staleness rule to an already-computed cache age."""
     if age is None:
         return True  # No cache or invalid date = stale
     return age > staleness_days
@@ -143,27 +220,95 @@ def get_cached_coaches(school_name: str, cache_base_dir: str = None) -> List[Dic
     coaches = []
 
     # Check for combined all_coaches.json file first
+    # (load_json_file returns None if missing, so no separate exists() stat)
     all_coaches_path = os.path.join(coaches_dir, "all_coaches.json")
-    if os.path.exists(all_coaches_path):
-        data = load_json_file(all_coaches_path)
-        if data and isinstance(data, list):
-            return data
+    data = load_json_file(all_coaches_path)
+    if data and isinstance(data, list):
+        return data
 
     # Otherwise, load individual coach files
-    for filename in os.listdir(coaches_dir):
-        if filename.endswith(".json") and filename != "all_coaches.json":
-            filepath = os.path.join(coaches_dir, filename)
-            coach_data = load_json_file(filepath)
-            if coach_data and isinstance(coach_data, dict):
-                coaches.append(coach_data)
+    with os.scandir(coaches_dir) as entries:
+        for entry in entries:
+            if entry.name.endswith(".json") and entry.name != "all_coaches.json" and entry.is_file():
+                coach_data = load_json_file(entry.path)
+                if coach_data and isinstance(coach_data, dict):
+                    coaches.append(coach_data)
 
     return coaches
 
 
+def get_coach_index_path(school_name: str, cache_base_dir: str = None) -> str:
+    """Get the coach_index.json path for a school (sidecar list of cached coach names)."""
+    cache_path = get_cache_path(school_name, cache_base_dir)
+    return os.path.join(cache_path, "coach_index.json")
+
+
+def _coaches_dir_signature(coaches_dir: str) -> Optional[List]:
+    """
+    Get [name, mtime_ns, size] for every coach JSON file in a coaches directory.
+
+    Any added, removed, renamed or rewritten coach file changes the
+    signature. Returns None if the directory doesn't exist.
+    """
+    try:
+        with os.scandir(coaches_dir) as entries:
+            signature = []
+            for entry in entries:
+                if entry.name.endswith(".json") and entry.is_file():
+                    stat = entry.stat()
+                    signature.append([entry.name, stat.st_mtime_ns, stat.st_size])
+    except OSError:
+        return None
+    signature.sort()
+    return signature
+
+
+def _scan_cached_coach_names(school_name: str, cache_base_dir: str = None) -> List[str]:
+    """Build the normalized coach name list by loading every cached coach file."""
+    coaches = get_cached_coaches(school_name, cache_base_dir)
+    names = []
+    for coach in coaches:
+        name = coach.get("name", "")
+        if name:
+            # Normalize to match file naming convention
+            names.append(normalize_coach_name(name))
+    return names
+
+
+def write_coach_index(school_name: str, cache_base_dir: str = None) -> Optional[str]:
+    """
+    Rebuild a school's coach_index.json from its coaches directory.
+
+    This is the only function that writes the index. Run it after saving
+    a school's coach files (``python cache_utils.py --write-index <school>``).
+
+    Args:
+        school_name: Name of the school
+        cache_base_dir: Base cache directory
+
+    Returns:
+        Path to the index file, or None if the school has no coaches directory
+    """
+    signature = _coaches_dir_signature(get_coaches_dir(school_name, cache_base_dir))
+    if signature is None:
+        return None
+
+    index_path = get_coach_index_path(school_name, cache_base_dir)
+    names = _scan_cached_coach_names(school_name, cache_base_dir)
+    with open(index_path, 'w', encoding='utf-8') as f:
+        json.dump({"signature": signature, "names": names}, f)
+    return index_path
+
+
 def get_cached_coach_names(school_name: str, cache_base_dir: str = None) -> List[str]:
     """
     Get list of coach names with cached career data.
 
+    Reads coach_index.json (see write_coach_index) when its signature
+    still matches every coach file's mtime and size, so a check costs one
+    stat() per file instead of parsing each one. Otherwise loads the coach
+    files; the index is never written here.
+
     Args:
         school_name: Name of the school
         cache_base_dir: Base cache directory
@@ -171,15 +316,16 @@ def get_cached_coach_names(school_name: str, cache_base_dir: str = None) -> List
     Returns:
         List of coach names (normalized to lowercase with underscores)
     """
-    coaches = get_cached_coaches(school_name, cache_base_dir)
-    names = []
-    for coach in coaches:
-        name = coach.get("name", "")
-        if name:
-            # Normalize to match file naming convention
-            normalized = name.lower().replace(" ", "_").replace("'", "").replace("-", "_")
-            names.append(normalized)
-    return names
+    signature = _coaches_dir_signature(get_coaches_dir(school_name, cache_base_dir))
+    if signature is None:
+        return []
+
+    index_path = get_coach_index_path(school_name, cache_base_dir)
+    index = load_json_file(index_path)
+    if isinstance(index, dict) and index.get("signature") == signature:
+        return index.get("names", [])
+
+    return _scan_cached_coach_names(school_name, cache_base_dir)
 
 
 def get_roster_coaches(school_name: str, cache_base_dir: str = None) -> List[Dict]:
@@ -200,13 +346,14 @@ def get_roster_coaches(school_name: str, cache_base_dir: str = None) -> List[Dic
     return roster.get("coaches", [])
 
 
-def get_cache_completeness(school_name: str, cache_base_dir: str = None) -> Dict:
+def get_cache_completeness(school_name: str, cache_base_dir: str = None, roster: Dict = None) -> Dict:
     """
     Check how complete the cache is for a school.
 
     Args:
         school_name: Name of the school
         cache_base_dir: Base cache directory
+        roster: Already-parsed roster.json (optional, will load if not provided)
 
     Returns:
         Dictionary with completeness information:
@@ -216,19 +363,20 @@ def get_cache_completeness(school_name: str, cache_base_dir: str = None) -> Dict
         - missing_coaches: list of coach names without career data
         - completion_percentage: float (0-100)
     """
-    roster_coaches = get_roster_coaches(school_name, cache_base_dir)
+    if roster is None:
+        roster_coaches = get_roster_coaches(school_name, cache_base_dir)
+    else:
+        roster_coaches = roster.get("coaches", [])
     cached_coach_names = set(get_cached_coach_names(school_name, cache_base_dir))
 
     # Normalize roster coach names to match file naming convention
-    def normalize_name(name: str) -> str:
-        return name.lower().replace(" ", "_").replace("'", "").replace("-", "_")
-
-    roster_names = {normalize_name(c.get("name", "")): c.get("name", "") for c in roster_coaches}
+    roster_names = {normalize_coach_name(c.get("name", "")): c.get("name", "") for c in roster_coaches}
 
+    # Set difference finds the missing keys; walk roster_names to keep roster order
+    missing_keys = roster_names.keys() - cached_coach_names
     missing = []
-    for normalized, original in roster_names.items():
-        if normalized not in cached_coach_names:
-            missing.append(original)
+    if missing_keys:
+        missing = [original for normalized, original in roster_names.items() if normalized in missing_keys]
 
     roster_count = len(roster_coaches)
     cached_count = len(cached_coach_names)
@@ -298,11 +446,12 @@ def get_cache_status(school_name: str, cache_base_dir: str = None, config: Dict
             "recommendation": "no_cache"
         }
 
+    # Parse roster.json once and share it with the age/completeness checks
     roster = load_json_file(roster_path)
     fetched_date = roster.get("fetched_date") if roster else None
-    age_days = get_cache_age_days(roster_path)
-    is_stale = is_cache_stale(roster_path, staleness_days)
-    completeness = get_cache_completeness(school_name, cache_base_dir)
+    age_days = _age_days_from_roster(roster)
+    is_stale = _is_age_stale(age_days, staleness_days)
+    completeness = get_cache_completeness(school_name, cache_base_dir, roster=roster or {})
 
     # Determine recommendation
     if is_stale:
@@ -325,6 +474,42 @@ def get_cache_status(school_name: str, cache_base_dir: str = None, config: Dict
     }
 
 
+def get_cache_status_many(
+    school_names: List[str],
+    cache_base_dir: str = None,
+    config: Dict = None,
+    max_workers: int = 16
+) -> Dict[str, Dict]:
+    """
+    Get cache status for many schools at once (e.g. a batch's pending list).
+
+    Each status check is independent and dominated by file I/O, so schools
+    are checked concurrently on a thread pool.
+
+    Args:
+        school_names: Names of the schools to check
+        cache_base_dir: Base cache directory
+        config: Configuration dictionary (optional, loaded once if not provided)
+        max_workers: Maximum number of worker threads
+
+    Returns:
+        Dictionary mapping each school name to its get_cache_status() result
+    """
+    if config is None:
+        config = load_config()
+
+    if not school_names:
+        return {}
+
+    workers = min(max_workers, len(school_names))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        statuses = executor.map(
+            lambda name: get_cache_status(name, cache_base_dir, config),
+            school_names
+        )
+        return dict(zip(school_names, statuses))
+
+
 def format_cache_status(status: Dict) -> str:
     """
     Format cache status as human-readable string.
@@ -376,21 +561,35 @@ def format_cache_status(status: Dict) -> str:
 
 
 if __name__ == "__main__":
-    """CLI usage: python cache_utils.py <school_name> [cache_dir]"""
+    """CLI usage: python cache_utils.py [--write-index] <school_name> [cache_dir]"""
+
+    write_index = len(sys.argv) > 1 and sys.argv[1] == "--write-index"
+    if write_index:
+        del sys.argv[1]
 
     if len(sys.argv) < 2:
-        print("Usage: python cache_utils.py <school_name> [cache_dir]")
+        print("Usage: python cache_utils.py [--write-index] <school_name> [cache_dir]")
         print("  school_name: Name of school to check cache for")
         print("  cache_dir: Base cache directory (default: ../cache)")
+        print("  --write-index: Rebuild coach_index.json after saving coach files")
         print()
         print("Examples:")
         print("  python cache_utils.py 'University of Oregon'")
         print("  python cache_utils.py 'CU Boulder'")
+        print("  python cache_utils.py --write-index 'University of Oregon'")
         sys.exit(1)
 
     school_name = sys.argv[1]
     cache_dir = sys.argv[2] if len(sys.argv) > 2 else None
 
+    if write_index:
+        index_path = write_coach_index(school_name, cache_dir)
+        if index_path is None:
+            print(f"No coaches directory for {school_name}")
+            sys.exit(2)
+        print(f"Wrote {index_path}")
+        sys.exit(0)
+
     status = get_cache_status(school_name, cache_dir)
     print(format_cache_status(status))
 
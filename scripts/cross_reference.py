@@ -6,11 +6,17 @@ the NMDP GITG database to find overlaps where a coach was at a school
 during the same academic year NMDP ran a program there.
 """
 
+import bisect
+import functools
 import json
+import logging
+import multiprocessing
 import re
 import sys
 import os
-from typing import Dict, List, Set, Optional, Tuple
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, FrozenSet, Iterator, List, Set, Optional, Tuple
 from datetime import datetime
 
 # Import normalizer
@@ -18,11 +24,25 @@ from normalize import SchoolNormalizer, normalize_school_name
 
 # Import logger (optional - may not be set up when running standalone)
 try:
-    from logger import get_logger
+    from logger import get_logger, setup_logger
     _has_logger = True
 except ImportError:
     _has_logger = False
 
+# Use orjson for faster parsing and serialization when available
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Import ijson (optional - streams combined coach arrays when available)
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
 
 def _log(level: str, message: str):
     """Log a message if logger is available."""
@@ -43,10 +63,62 @@ def _log_warning(message: str):
     _log("warning", message)
 
 
+# Year-range patterns, compiled once at import
+_RE_PRESENT = re.compile(r"(\d{4})\s*-\s*present")
+_RE_RANGE = re.compile(r"(\d{4})\s*-\s*(\d{4})")
+_RE_YEAR = re.compile(r"(\d{4})")
+
+
 def load_json_file(filepath: str) -> Dict:
     """Load a JSON file and return its contents."""
-    with open(filepath, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    with open(filepath, 'rb') as f:
+        raw = f.read()
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _starts_with_array(f) -> bool:
+    """Peek at the first non-whitespace byte of a binary file, then rewind."""
+    while True:
+        chunk = f.read(64)
+        if not chunk:
+            f.seek(0)
+            return False
+        stripped = chunk.lstrip()
+        if stripped:
+            f.seek(0)
+            return stripped[:1] == b"["
+
+
+def iter_coach_file(filepath: str):
+    """
+    Yield the coach records in a coach JSON file.
+
+    Combined files (all_coaches.json) hold a JSON array; with ijson installed
+    they are streamed one coach at a time instead of loaded whole.
+
+    Args:
+        filepath: Path to an individual or combined coach JSON file
+
+    Yields:
+        Tuple of (coach_data, is_combined)
+    """
+    if IJSON_AVAILABLE:
+        with open(filepath, "rb") as f:
+            if _starts_with_array(f):
+                for coach in ijson.items(f, "item", use_float=True):
+                    yield coach, True
+                return
+
+    coach_data = load_json_file(filepath)
+
+    # Handle all_coaches.json (array format)
+    if isinstance(coach_data, list):
+        for coach in coach_data:
+            yield coach, True
+    else:
+        yield coach_data, False
 
 
 def parse_year_range(years_str: str, current_year: int = None) -> List[int]:
@@ -83,32 +155,64 @@ def parse_year_range(years_str: str, current_year: int = None) -> List[int]:
     if current_year is None:
         current_year = datetime.now().year
 
+    return list(_parse_year_range_cached(years_str, current_year))
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_year_range_cached(years_str: str, current_year: int) -> Tuple[int, ...]:
+    """
+    Memoized core of parse_year_range.
+
+    Career stints repeat the same handful of spans ("2020-2022",
+    "2024-present") across coaches, so results are cached. Returns an
+    immutable tuple so cached values can't be mutated by callers.
+    """
     years_str = years_str.strip().lower()
 
+    # Fast path: split on the first dash instead of running the regexes.
+    # Anything that isn't a plain "YYYY", "YYYY-YYYY..." or "YYYY-present"
+    # falls through to the regex parsing below.
+    start_tok, dash, end_tok = years_str.partition("-")
+    start_tok = start_tok.rstrip()
+    if len(start_tok) == 4 and start_tok.isdecimal():
+        start_year = int(start_tok)
+        has_present = "present" in years_str
+        if dash:
+            end_tok = end_tok.lstrip()
+            if end_tok.startswith("present"):
+                return tuple(range(start_year, current_year))
+            if has_present:
+                return ()
+            if end_tok[:4].isdecimal() and len(end_tok) >= 4:
+                return tuple(range(start_year, int(end_tok[:4]) + 1))
+            return (start_year,)
+        if not has_present:
+            return (start_year,)
+
     # Handle "present"
     if "present" in years_str:
-        match = re.match(r"(\d{4})\s*-\s*present", years_str)
+        match = _RE_PRESENT.match(years_str)
         if match:
             start_year = int(match.group(1))
             # Include years up to current year - 1
             # (current season is still in progress, academic year not complete)
-            return list(range(start_year, current_year))
-        return []
+            return tuple(range(start_year, current_year))
+        return ()
 
     # Handle standard year range (end year is INCLUSIVE)
-    match = re.match(r"(\d{4})\s*-\s*(\d{4})", years_str)
+    match = _RE_RANGE.match(years_str)
     if match:
         start_year = int(match.group(1))
         end_year = int(match.group(2))
         # "2020-2022" means seasons 2020, 2021, 2022 (end year inclusive)
-        return list(range(start_year, end_year + 1))
+        return tuple(range(start_year, end_year + 1))
 
     # Handle single year
-    match = re.match(r"(\d{4})", years_str)
+    match = _RE_YEAR.match(years_str)
     if match:
-        return [int(match.group(1))]
+        return (int(match.group(1)),)
 
-    return []
+    return ()
 
 
 def year_to_academic_year(year: int) -> str:
@@ -121,7 +225,76 @@ def year_to_academic_year(year: int) -> str:
     Returns:
         Academic year string (e.g., "2020-2021")
     """
-    return f"{year}-{year + 1}"
+    academic_year = _ACADEMIC_YEARS.get(year)
+    if academic_year is None:
+        academic_year = f"{year}-{year + 1}"
+    return academic_year
+
+
+# Academic year strings for every plausible season, built once at import
+_ACADEMIC_YEARS = {year: f"{year}-{year + 1}" for year in range(1950, 2100)}
+
+
+def academic_years_to_start_years(academic_years: List[str]) -> FrozenSet[int]:
+    """
+    Convert NMDP academic year strings to their starting calendar years.
+
+    Only well-formed entries (exactly what year_to_academic_year produces)
+    are kept, so integer matching gives the same results as string matching.
+
+    Args:
+        academic_years: List like ["2020-2021", "2022-2023"]
+
+    Returns:
+        Frozenset of starting years, e.g. frozenset({2020, 2022})
+    """
+    start_years = set()
+    for academic_year in academic_years:
+        start = academic_year[:4]
+        if start.isdigit() and academic_year == year_to_academic_year(int(start)):
+            start_years.add(int(start))
+    return frozenset(start_years)
+
+
+def build_nmdp_year_index(nmdp_db: Dict[str, List[str]]) -> Dict[str, Tuple[int, ...]]:
+    """
+    Precompute school -> starting calendar years for integer overlap checks.
+
+    Args:
+        nmdp_db: NMDP database (school -> [academic years])
+
+    Returns:
+        Dict mapping each school to a sorted tuple of program start years
+    """
+    return {school: tuple(sorted(academic_years_to_start_years(years))) for school, years in nmdp_db.items()}
+
+
+# Key under which build_nmdp_year_bounds stores the bounds across all schools
+# (never a real school - stints with an empty school are skipped)
+ALL_SCHOOLS_KEY = ""
+
+
+def build_nmdp_year_bounds(nmdp_year_index: Dict[str, Tuple[int, ...]]) -> Dict[str, Tuple[int, int]]:
+    """
+    Precompute (min, max) program start years per school and overall.
+
+    Lets find_overlaps_for_coach skip stints whose years cannot touch any
+    NMDP program before normalizing the school or intersecting years.
+
+    Args:
+        nmdp_year_index: Output of build_nmdp_year_index(nmdp_db)
+
+    Returns:
+        Dict mapping each school with programs to (min_year, max_year), plus
+        the overall bounds under ALL_SCHOOLS_KEY (absent if there are none)
+    """
+    bounds = {school: (min(years), max(years)) for school, years in nmdp_year_index.items() if years}
+    if bounds:
+        bounds[ALL_SCHOOLS_KEY] = (
+            min(lo for lo, _ in bounds.values()),
+            max(hi for _, hi in bounds.values())
+        )
+    return bounds
 
 
 def find_overlaps_for_coach(
@@ -129,7 +302,9 @@ def find_overlaps_for_coach(
     nmdp_db: Dict[str, List[str]],
     normalizer: SchoolNormalizer,
     year_range_start: int = 2020,
-    year_range_end: int = 2026
+    year_range_end: int = 2026,
+    nmdp_year_index: Dict[str, Tuple[int, ...]] = None,
+    nmdp_year_bounds: Dict[str, Tuple[int, int]] = None
 ) -> List[Dict]:
     """
     Find NMDP program overlaps for a single coach's career history.
@@ -140,52 +315,90 @@ def find_overlaps_for_coach(
         normalizer: SchoolNormalizer instance
         year_range_start: Earliest year to consider
         year_range_end: Latest year to consider
+        nmdp_year_index: Output of build_nmdp_year_index(nmdp_db) (optional,
+            computed per school if not provided)
+        nmdp_year_bounds: Output of build_nmdp_year_bounds(nmdp_year_index)
+            (optional, enables the out-of-range pre-checks)
 
     Returns:
         List of overlap dictionaries with school, academic_year, coach_position
     """
     overlaps = []
 
+    # Only years inside both the configured range and some NMDP program can match
+    window_start, window_end = year_range_start, year_range_end - 1
+    if nmdp_year_bounds is not None:
+        if ALL_SCHOOLS_KEY not in nmdp_year_bounds:
+            return overlaps
+        all_min, all_max = nmdp_year_bounds[ALL_SCHOOLS_KEY]
+        window_start, window_end = max(window_start, all_min), min(window_end, all_max)
+
     for stint in career_history:
-        school = stint.get("school", "")
-        years_str = stint.get("years", "")
-        position = stint.get("position", "Unknown")
+        # Skip if missing data (position is only looked up once a stint overlaps)
+        school = stint.get("school")
+        if not school:
+            continue
+        years_str = stint.get("years")
+        if not years_str:
+            continue
 
-        # Skip if missing data
-        if not school or not years_str:
+        # Get the years the coach was at this school (ascending); skip
+        # stints that lie entirely outside every possible overlap
+        coach_years = _parse_year_range_cached(years_str, year_range_end)
+        if not coach_years or coach_years[-1] < window_start or coach_years[0] > window_end:
             continue
 
         # Check if this is an NFL team (skip - no NMDP overlap possible)
         if normalizer.is_nfl_team(school):
             continue
 
-        # Normalize the school name
+        # Normalize the school name (memoized per raw name by the normalizer)
         normalized_school, match_type = normalizer.normalize(school)
 
         # Check if school is in NMDP database
         if normalized_school not in nmdp_db:
             continue
 
-        # Get the years the coach was at this school
-        coach_years = parse_year_range(years_str, year_range_end)
-
-        # Filter to configured year range
-        coach_years = [y for y in coach_years if year_range_start <= y < year_range_end]
-
-        # Get NMDP program years for this school
-        nmdp_years = set(nmdp_db[normalized_school])
+        # Skip schools whose programs ran entirely outside this stint
+        if nmdp_year_bounds is not None:
+            school_bounds = nmdp_year_bounds.get(normalized_school)
+            if school_bounds is None or coach_years[-1] < school_bounds[0] or coach_years[0] > school_bounds[1]:
+                continue
+
+        # Get NMDP program start years for this school
+        if nmdp_year_index is not None and normalized_school in nmdp_year_index:
+            nmdp_years = nmdp_year_index[normalized_school]
+        else:
+            nmdp_years = tuple(sorted(academic_years_to_start_years(nmdp_db[normalized_school])))
+
+        # Find overlaps within the configured year range; academic year
+        # strings are only built for matching years. Parsed stints are always
+        # a contiguous run of seasons, so the overlap is the slice of the
+        # sorted program years that falls inside the clipped span.
+        overlap_years = nmdp_years[
+            bisect.bisect_left(nmdp_years, max(coach_years[0], window_start)):
+            bisect.bisect_right(nmdp_years, min(coach_years[-1], window_end))
+        ]
+        if not overlap_years:
+            continue
 
-        # Find overlaps
-        for year in coach_years:
-            academic_year = year_to_academic_year(year)
-            if academic_year in nmdp_years:
-                overlaps.append({
-                    "school": normalized_school,
-                    "school_original": school,
-                    "academic_year": academic_year,
-                    "coach_position": position,
-                    "match_type": match_type
-                })
+        # Intern strings repeated across many overlap dicts so results share
+        # one object per distinct value (academic years already come shared
+        # from _ACADEMIC_YEARS)
+        normalized_school = sys.intern(normalized_school)
+        match_type = sys.intern(match_type)
+        position = stint.get("position", "Unknown")
+        if isinstance(position, str):
+            position = sys.intern(position)
+
+        for year in overlap_years:
+            overlaps.append({
+                "school": normalized_school,
+                "school_original": school,
+                "academic_year": year_to_academic_year(year),
+                "coach_position": position,
+                "match_type": match_type
+            })
 
     return overlaps
 
@@ -194,7 +407,9 @@ def cross_reference_coach(
     coach_data: Dict,
     nmdp_db: Dict[str, List[str]],
     normalizer: SchoolNormalizer,
-    config: Dict = None
+    config: Dict = None,
+    nmdp_year_index: Dict[str, Tuple[int, ...]] = None,
+    nmdp_year_bounds: Dict[str, Tuple[int, int]] = None
 ) -> Dict:
     """
     Cross-reference a single coach's data against NMDP database.
@@ -204,13 +419,15 @@ def cross_reference_coach(
         nmdp_db: NMDP database
         normalizer: SchoolNormalizer instance
         config: Configuration dict (optional)
+        nmdp_year_index: Output of build_nmdp_year_index(nmdp_db) (optional)
+        nmdp_year_bounds: Output of build_nmdp_year_bounds(nmdp_year_index) (optional)
 
     Returns:
         Result dictionary with coach info and overlap findings
     """
-    config = config or {}
-    year_start = config.get("year_range", {}).get("start", 2020)
-    year_end = config.get("year_range", {}).get("end", 2026)
+    year_range = (config or {}).get("year_range", {})
+    year_start = year_range.get("start", 2020)
+    year_end = year_range.get("end", 2026)
 
     career_history = coach_data.get("career_history", [])
 
@@ -219,7 +436,9 @@ def cross_reference_coach(
         nmdp_db,
         normalizer,
         year_start,
-        year_end
+        year_end,
+        nmdp_year_index,
+        nmdp_year_bounds
     )
 
     return {
@@ -234,23 +453,75 @@ def cross_reference_coach(
     }
 
 
-def cross_reference_all_coaches(
-    coaches_dir: str,
-    nmdp_db_path: str,
-    aliases_path: str,
-    config_path: str = None
-) -> List[Dict]:
+def _cross_reference_file(
+    filepath: str,
+    nmdp_db: Dict[str, List[str]],
+    normalizer: SchoolNormalizer,
+    config: Dict,
+    nmdp_year_index: Dict[str, Tuple[int, ...]],
+    nmdp_year_bounds: Dict[str, Tuple[int, int]]
+) -> Tuple[List[Dict], Optional[int], Optional[str]]:
     """
-    Cross-reference all coaches in a directory against NMDP database.
+    Cross-reference every coach in one coach JSON file.
+
+    Returns:
+        Tuple of (results, combined_count, error):
+        - results: Results for the coaches processed (partial if an error occurred)
+        - combined_count: Number of coaches if the file is an array (all_coaches.json), else None
+        - error: Error message if processing failed, else None
+    """
+    results = []
+    combined_count = None
+    try:
+        for coach, is_combined in iter_coach_file(filepath):
+            if is_combined:
+                combined_count = (combined_count or 0) + 1
+            results.append(cross_reference_coach(
+                coach, nmdp_db, normalizer, config, nmdp_year_index, nmdp_year_bounds
+            ))
+    except Exception as e:
+        return results, combined_count, str(e)
+
+    return results, combined_count, None
+
+
+# Per-process state for parallel cross-referencing (set by _init_worker, in
+# the parent before forking or in each worker otherwise)
+_worker_args: Optional[Tuple] = None
+
+
+def _init_worker(nmdp_db, normalizer, config, nmdp_year_index, nmdp_year_bounds):
+    """Stash shared lookup data once per worker process instead of per task."""
+    global _worker_args
+    _worker_args = (nmdp_db, normalizer, config, nmdp_year_index, nmdp_year_bounds)
+
+
+def _clear_worker():
+    """Drop the shared lookup data stashed in this process by _init_worker."""
+    global _worker_args
+    _worker_args = None
+
+
+def _cross_reference_file_in_worker(filepath: str) -> Tuple[List[Dict], Optional[int], Optional[str]]:
+    """Worker-process entry point for _cross_reference_file."""
+    return _cross_reference_file(filepath, *_worker_args)
+
+
+def load_reference_data(nmdp_db_path: str, aliases_path: str, config_path: str = None) -> Tuple:
+    """
+    Load everything coaches are cross-referenced against.
+
+    Callers cross-referencing several coach directories (e.g. one per school)
+    can load this once and pass it to cross_reference_all_coaches instead of
+    having the NMDP database and aliases re-read for every directory.
 
     Args:
-        coaches_dir: Path to directory containing coach JSON files
         nmdp_db_path: Path to GITG database
         aliases_path: Path to school aliases
         config_path: Path to config.json (optional)
 
     Returns:
-        List of cross-reference results for all coaches
+        Tuple of (nmdp_db, normalizer, config, nmdp_year_index, nmdp_year_bounds)
     """
     _log_info(f"Loading NMDP database from {nmdp_db_path}")
 
@@ -261,6 +532,10 @@ def cross_reference_all_coaches(
 
     _log_info(f"NMDP database contains {len(nmdp_db)} schools")
 
+    # Precompute integer program years once for all coaches
+    nmdp_year_index = build_nmdp_year_index(nmdp_db)
+    nmdp_year_bounds = build_nmdp_year_bounds(nmdp_year_index)
+
     # Load config if provided
     config = {}
     if config_path and os.path.exists(config_path):
@@ -271,41 +546,115 @@ def cross_reference_all_coaches(
     normalizer = SchoolNormalizer(nmdp_db_path, aliases_path)
     _log_info(f"Loaded {len(normalizer.reverse_aliases)} school aliases")
 
-    results = []
+    return nmdp_db, normalizer, config, nmdp_year_index, nmdp_year_bounds
+
+
+def iter_cross_reference_all_coaches(
+    coaches_dir: str,
+    nmdp_db_path: str,
+    aliases_path: str,
+    config_path: str = None,
+    max_workers: int = None,
+    reference_data: Optional[Tuple] = None
+) -> Iterator[Dict]:
+    """
+    Cross-reference all coaches in a directory, yielding each result as it is ready.
+
+    Takes the same arguments as cross_reference_all_coaches; results come out in
+    the same order without the whole list being held in memory.
+
+    Yields:
+        Cross-reference result for each coach
+    """
+    if reference_data is None:
+        reference_data = load_reference_data(nmdp_db_path, aliases_path, config_path)
+    nmdp_db, normalizer, config, nmdp_year_index, nmdp_year_bounds = reference_data
+
+    coaches_processed = 0
     overlaps_found = 0
 
     # Process each coach file
     if os.path.isdir(coaches_dir):
-        files = [f for f in os.listdir(coaches_dir) if f.endswith(".json")]
+        with os.scandir(coaches_dir) as it:
+            entries = [entry for entry in it if entry.name.endswith(".json") and entry.is_file()]
+        files = [entry.name for entry in entries]
+        filepaths = [entry.path for entry in entries]
         _log_info(f"Processing {len(files)} coach files from {coaches_dir}")
 
-        for filename in files:
-            filepath = os.path.join(coaches_dir, filename)
-            try:
-                coach_data = load_json_file(filepath)
-
-                # Handle all_coaches.json (array format)
-                if isinstance(coach_data, list):
-                    _log_debug(f"Processing combined file {filename} with {len(coach_data)} coaches")
-                    for coach in coach_data:
-                        result = cross_reference_coach(coach, nmdp_db, normalizer, config)
-                        results.append(result)
-                        if result["has_overlap"]:
-                            overlaps_found += 1
-                            _log_debug(f"  Found {result['overlap_count']} overlap(s) for {result['coach_name']}")
-                else:
-                    result = cross_reference_coach(coach_data, nmdp_db, normalizer, config)
-                    results.append(result)
+        executor = None
+        if max_workers and max_workers > 1 and len(files) > 1:
+            shared = reference_data
+            if "fork" in multiprocessing.get_all_start_methods():
+                # Forked workers inherit the shared state copy-on-write,
+                # so nothing is pickled per worker or per task
+                _init_worker(*shared)
+                executor = ProcessPoolExecutor(
+                    max_workers=max_workers,
+                    mp_context=multiprocessing.get_context("fork")
+                )
+            else:
+                executor = ProcessPoolExecutor(
+                    max_workers=max_workers,
+                    initializer=_init_worker,
+                    initargs=shared
+                )
+            file_outcomes = executor.map(_cross_reference_file_in_worker, filepaths, chunksize=32)
+        else:
+            file_outcomes = (
+                _cross_reference_file(filepath, nmdp_db, normalizer, config, nmdp_year_index, nmdp_year_bounds)
+                for filepath in filepaths
+            )
+
+        try:
+            for filename, (file_results, combined_count, error) in zip(files, file_outcomes):
+                if combined_count is not None:
+                    _log_debug(f"Processing combined file {filename} with {combined_count} coaches")
+
+                for result in file_results:
+                    coaches_processed += 1
                     if result["has_overlap"]:
                         overlaps_found += 1
                         _log_debug(f"  Found {result['overlap_count']} overlap(s) for {result['coach_name']}")
+                    yield result
 
-            except Exception as e:
-                _log_warning(f"Error processing {filename}: {e}")
+                if error is not None:
+                    _log_warning(f"Error processing {filename}: {error}")
+        finally:
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
+                _clear_worker()
 
-    _log_info(f"Cross-reference complete: {len(results)} coaches, {overlaps_found} with overlaps")
+    _log_info(f"Cross-reference complete: {coaches_processed} coaches, {overlaps_found} with overlaps")
 
-    return results
+
+def cross_reference_all_coaches(
+    coaches_dir: str,
+    nmdp_db_path: str,
+    aliases_path: str,
+    config_path: str = None,
+    max_workers: int = None,
+    reference_data: Optional[Tuple] = None
+) -> List[Dict]:
+    """
+    Cross-reference all coaches in a directory against NMDP database.
+
+    Args:
+        coaches_dir: Path to directory containing coach JSON files
+        nmdp_db_path: Path to GITG database
+        aliases_path: Path to school aliases
+        config_path: Path to config.json (optional)
+        max_workers: Number of worker processes (optional). By default files
+            are processed sequentially, which is fastest for a typical
+            school; set this for very large coach directories.
+        reference_data: Result of load_reference_data (optional). Loaded from
+            the paths above when not given.
+
+    Returns:
+        List of cross-reference results for all coaches
+    """
+    return list(iter_cross_reference_all_coaches(
+        coaches_dir, nmdp_db_path, aliases_path, config_path, max_workers, reference_data
+    ))
 
 
 def format_overlaps_summary(overlaps: List[Dict]) -> str:
@@ -322,35 +671,35 @@ def format_overlaps_summary(overlaps: List[Dict]) -> str:
         return ""
 
     # Group by school
-    by_school = {}
+    by_school = defaultdict(list)
     for overlap in overlaps:
-        school = overlap["school"]
-        year = overlap["academic_year"]
-        if school not in by_school:
-            by_school[school] = []
-        by_school[school].append(year)
+        by_school[overlap["school"]].append(overlap["academic_year"])
 
-    # Format each school
+    # Format each school (a year can repeat across stints at the same school)
     parts = []
     for school, years in by_school.items():
-        years_str = ", ".join(sorted(years))
+        years_str = ", ".join(sorted(set(years)))
         parts.append(f"{school} ({years_str})")
 
     return "; ".join(parts)
 
 
 if __name__ == "__main__":
-    """CLI usage: python cross_reference.py <coaches_dir> [nmdp_db_path] [aliases_path] [config_path]"""
+    """CLI usage: python cross_reference.py <coaches_dir> [nmdp_db_path] [aliases_path] [config_path] [--ndjson]"""
+
+    ndjson = "--ndjson" in sys.argv
+    args = [arg for arg in sys.argv if arg != "--ndjson"]
 
-    if len(sys.argv) < 2:
-        print("Usage: python cross_reference.py <coaches_dir> [nmdp_db_path] [aliases_path] [config_path]")
+    if len(args) < 2:
+        print("Usage: python cross_reference.py <coaches_dir> [nmdp_db_path] [aliases_path] [config_path] [--ndjson]")
         print("  coaches_dir: Directory containing coach JSON files")
         print("  nmdp_db_path: Path to gitg_school_years.json")
         print("  aliases_path: Path to school_aliases.json")
         print("  config_path: Path to config.json")
+        print("  --ndjson: Stream one JSON result per line to stdout (summary goes to stderr)")
         sys.exit(1)
 
-    coaches_dir = sys.argv[1]
+    coaches_dir = args[1]
 
     # Default paths
     script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -358,16 +707,42 @@ if __name__ == "__main__":
     default_aliases_path = os.path.join(script_dir, "..", "data", "school_aliases.json")
     default_config_path = os.path.join(script_dir, "..", "config.json")
 
-    nmdp_path = sys.argv[2] if len(sys.argv) > 2 else default_nmdp_path
-    aliases_path = sys.argv[3] if len(sys.argv) > 3 else default_aliases_path
-    config_path = sys.argv[4] if len(sys.argv) > 4 else default_config_path
+    nmdp_path = args[2] if len(args) > 2 else default_nmdp_path
+    aliases_path = args[3] if len(args) > 3 else default_aliases_path
+    config_path = args[4] if len(args) > 4 else default_config_path
 
     try:
-        results = cross_reference_all_coaches(coaches_dir, nmdp_path, aliases_path, config_path)
+        if ndjson:
+            # Keep stdout pure NDJSON - console logging shares stdout
+            if _has_logger:
+                setup_logger(console_level=logging.CRITICAL + 1)
+
+            total_coaches = 0
+            coaches_with_overlap = 0
+            for result in iter_cross_reference_all_coaches(coaches_dir, nmdp_path, aliases_path, config_path):
+                if ORJSON_AVAILABLE:
+                    sys.stdout.write(orjson.dumps(result).decode() + "\n")
+                else:
+                    sys.stdout.write(json.dumps(result) + "\n")
+                total_coaches += 1
+                if result["has_overlap"]:
+                    coaches_with_overlap += 1
+
+            print(f"Total coaches processed: {total_coaches}", file=sys.stderr)
+            print(f"Coaches with NMDP overlap: {coaches_with_overlap}", file=sys.stderr)
+            sys.exit(0)
+
+        # Collect results and the coaches with overlaps in a single pass
+        results = []
+        overlapping = []
+        for result in iter_cross_reference_all_coaches(coaches_dir, nmdp_path, aliases_path, config_path):
+            results.append(result)
+            if result["has_overlap"]:
+                overlapping.append(result)
 
         # Print summary
         total_coaches = len(results)
-        coaches_with_overlap = sum(1 for r in results if r["has_overlap"])
+        coaches_with_overlap = len(overlapping)
 
         print(f"\nCross-Reference Results")
         print(f"=" * 50)
@@ -377,16 +752,18 @@ if __name__ == "__main__":
 
         if coaches_with_overlap > 0:
             print("Overlaps found:")
-            for result in results:
-                if result["has_overlap"]:
-                    print(f"\n  {result['coach_name']} ({result['current_position']})")
-                    for overlap in result["overlaps"]:
-                        print(f"    - {overlap['school']}, {overlap['academic_year']}")
-                        print(f"      Position at time: {overlap['coach_position']}")
+            for result in overlapping:
+                print(f"\n  {result['coach_name']} ({result['current_position']})")
+                for overlap in result["overlaps"]:
+                    print(f"    - {overlap['school']}, {overlap['academic_year']}")
+                    print(f"      Position at time: {overlap['coach_position']}")
 
         # Output as JSON
         print("\n\nJSON Output:")
-        print(json.dumps(results, indent=2))
+        if ORJSON_AVAILABLE:
+            print(orjson.dumps(results, option=orjson.OPT_INDENT_2).decode())
+        else:
+            print(json.dumps(results, indent=2))
 
     except FileNotFoundError as e:
         print(f"Error: {e}")
@@ -6,11 +6,18 @@ Excel output includes clickable hyperlinks in the career history columns.
 """
 
 import csv
+import functools
 import json
+import math
 import os
+import re
 import sys
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+from itertools import compress, repeat
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from xml.sax.saxutils import escape as xml_escape, quoteattr as xml_quoteattr
 
 from cross_reference import (
     cross_reference_all_coaches,
@@ -22,12 +29,88 @@ from logger import setup_logger, get_logger, log_section, log_summary, get_log_f
 # Try to import openpyxl for Excel support
 try:
     from openpyxl import Workbook
-    from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Font, PatternFill, Alignment, Border, Side, NamedStyle
+    from openpyxl.styles.fonts import DEFAULT_FONT
     from openpyxl.utils import get_column_letter
     EXCEL_AVAILABLE = True
 except ImportError:
     EXCEL_AVAILABLE = False
 
+# Try to import xlsxwriter (optional - faster, constant-memory Excel writer)
+try:
+    import xlsxwriter
+    XLSXWRITER_AVAILABLE = True
+except ImportError:
+    XLSXWRITER_AVAILABLE = False
+
+# Try to import polars (optional - compiled CSV writer for large reports)
+try:
+    import polars as pl
+    POLARS_AVAILABLE = True
+except ImportError:
+    POLARS_AVAILABLE = False
+
+# Write buffer for report files (CSV and direct XLSX), so a report is
+# flushed in a few large writes
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Reports with more rows than this use polars for the CSV when installed
+POLARS_CSV_ROW_THRESHOLD = 5000
+
+
+def _ensure_dir(path: str):
+    """Create a report's output directory if needed ("" means the current directory)."""
+    if path and not os.path.isdir(path):
+        os.makedirs(path, exist_ok=True)
+
+
+# Shared default for missing career_history/overlaps, so lookups don't allocate a list
+_EMPTY = ()
+
+# Canonical stint years: "2020-2022" or "2024-present" (any case)
+_YEARS_RE = re.compile(r"(\d{4})-(\d{4}|[Pp][Rr][Ee][Ss][Ee][Nn][Tt])")
+
+
+@functools.lru_cache(maxsize=4096)
+def _years_in_range(years: str, year_start: int) -> bool:
+    """
+    Check whether a stint's years string reaches year_start or later.
+
+    Stint year strings repeat heavily across coaches ("2022-present"), so
+    results are cached. Unparseable strings are included.
+    """
+    # Well-formed "YYYY-YYYY" / "YYYY-present" is decided without exceptions
+    match = _YEARS_RE.fullmatch(years) if isinstance(years, str) else None
+    if match:
+        start, end = match.groups()
+        return int(start) >= year_start or not end.isdigit() or int(end) >= year_start
+
+    # Anything else keeps the original lenient parsing
+    try:
+        start_year = int(years.split("-")[0])
+        if start_year < year_start:
+            # Check end year
+            end_part = years.split("-")[1]
+            if end_part.lower() == "present":
+                return True
+            if int(end_part) < year_start:
+                return False
+    except (ValueError, IndexError):
+        pass  # Include if we can't parse
+
+    return True
+
+
+def _recent_stints(career_history: List[Dict], year_start: int) -> Iterator[Tuple[str, str, Dict]]:
+    """Yield (school, years, stint) for each stint that reaches year_start."""
+    # Build the keep-mask with map() over the cached predicate, then filter
+    # with compress() so the per-stint test doesn't run in a Python loop
+    years_column = [stint.get("years", "Unknown") for stint in career_history]
+    keep = map(_years_in_range, years_column, repeat(year_start))
+    for stint, years in compress(zip(career_history, years_column), keep):
+        yield stint.get("school", "Unknown"), years, stint
+
 
 def format_career_history(career_history: List[Dict], year_start: int = 2020) -> str:
     """
@@ -43,27 +126,7 @@ def format_career_history(career_history: List[Dict], year_start: int = 2020) ->
     if not career_history:
         return "No career history found"
 
-    parts = []
-    for stint in career_history:
-        school = stint.get("school", "Unknown")
-        years = stint.get("years", "Unknown")
-
-        # Try to extract start year to filter
-        try:
-            start_year = int(years.split("-")[0])
-            if start_year < year_start:
-                # Check end year
-                end_part = years.split("-")[1]
-                if end_part.lower() == "present":
-                    pass  # Include it
-                else:
-                    end_year = int(end_part)
-                    if end_year < year_start:
-                        continue  # Skip entirely
-        except (ValueError, IndexError):
-            pass  # Include if we can't parse
-
-        parts.append(f"{school} ({years})")
+    parts = [f"{school} ({years})" for school, years, _ in _recent_stints(career_history, year_start)]
 
     return ", ".join(parts) if parts else "No recent career history"
 
@@ -76,15 +139,15 @@ def format_source_urls(career_history: List[Dict]) -> str:
         career_history: List of career stint dictionaries
 
     Returns:
-        Pipe-separated list of unique source URLs
+        Pipe-separated list of unique source URLs, in career history order
     """
-    urls = set()
-    for stint in career_history:
-        url = stint.get("source_url")
-        if url:
-            urls.add(url)
+    if not career_history:
+        return ""
+
+    # dict.fromkeys dedupes while keeping first-seen order
+    urls = dict.fromkeys(stint["source_url"] for stint in career_history if stint.get("source_url"))
 
-    return " | ".join(sorted(urls)) if urls else ""
+    return " | ".join(urls) if urls else ""
 
 
 def determine_data_quality(career_history: List[Dict], research_status: str) -> str:
@@ -116,6 +179,60 @@ def determine_data_quality(career_history: List[Dict], research_status: str) ->
         return "UNVERIFIED"
 
 
+def _result_quality(result: Dict) -> str:
+    """Data quality for a result, using the value cached by annotate_data_quality if present."""
+    quality = result.get("_quality")
+    if quality is None:
+        quality = determine_data_quality(result.get("career_history", _EMPTY), result.get("research_status", ""))
+    return quality
+
+
+def annotate_data_quality(results: List[Dict]) -> List[Dict]:
+    """
+    Compute each result's data quality once and cache it on the result.
+
+    The CSV, Excel and summary paths all read the cached "_quality" value
+    instead of re-walking the career history.
+
+    Args:
+        results: List of cross-reference result dictionaries (updated in place)
+
+    Returns:
+        The same results list
+    """
+    for result in results:
+        result["_quality"] = determine_data_quality(
+            result.get("career_history", _EMPTY), result.get("research_status", "")
+        )
+    return results
+
+
+def _result_overlap_summary(result: Dict) -> str:
+    """Overlap summary for a result, using the value cached by annotate_overlap_summaries if present."""
+    summary = result.get("_overlap_summary")
+    if summary is None:
+        summary = format_overlaps_summary(result.get("overlaps", _EMPTY))
+    return summary
+
+
+def annotate_overlap_summaries(results: List[Dict]) -> List[Dict]:
+    """
+    Format each result's overlap summary once and cache it on the result.
+
+    The CSV and Excel paths both read the cached "_overlap_summary" value
+    instead of re-formatting the overlap list.
+
+    Args:
+        results: List of cross-reference result dictionaries (updated in place)
+
+    Returns:
+        The same results list
+    """
+    for result in results:
+        result["_overlap_summary"] = format_overlaps_summary(result.get("overlaps", _EMPTY))
+    return results
+
+
 def get_career_entries_with_urls(career_history: List[Dict], year_start: int = 2020) -> List[Tuple[str, str]]:
     """
     Extract career entries with their source URLs for Excel hyperlinks.
@@ -130,30 +247,435 @@ def get_career_entries_with_urls(career_history: List[Dict], year_start: int = 2
     if not career_history:
         return []
 
-    entries = []
-    for stint in career_history:
-        school = stint.get("school", "Unknown")
-        years = stint.get("years", "Unknown")
-        source_url = stint.get("source_url", "")
+    return [
+        (f"{school} ({years})", stint.get("source_url", ""))
+        for school, years, stint in _recent_stints(career_history, year_start)
+    ]
+
+
+def _build_excel_rows(results: List[Dict], year_start: int) -> Tuple[List[str], List[Tuple[List, bool]], List[int]]:
+    """
+    Assemble Excel report headers, row values and column widths.
+
+    Args:
+        results: List of cross-reference result dictionaries
+        year_start: Earliest career year to include
+
+    Returns:
+        Tuple of (headers, rows, col_widths) where each row is a
+        ([(value, hyperlink_or_None), ...], has_overlap) pair and col_widths
+        holds the longest value length per column (headers included)
+    """
+    # Extract career entries once per coach, then size the career columns
+    prepared = [
+        (result, get_career_entries_with_urls(result.get("career_history", _EMPTY), year_start))
+        for result in results
+    ]
+    max_career_entries = max((len(entries) for _, entries in prepared), default=0)
+
+    # Ensure at least 3 career columns
+    max_career_entries = max(max_career_entries, 3)
+
+    # Build headers
+    headers = ["Coach Name", "Current School", "Current Position"]
+    for i in range(max_career_entries):
+        headers.append(f"Career {i+1}")
+    headers.extend(["NMDP Overlap", "Overlap Details", "Data Quality"])
+
+    # Build data rows as (value, hyperlink) pairs, tracking the widest value
+    # per column as we go; widths must be set before any row is written by
+    # the streaming writers
+    col_widths = [len(header) for header in headers]
+    rows = []
+    # Local aliases for the per-row calls
+    summarize_overlaps = _result_overlap_summary
+    data_quality = _result_quality
+    empty_entry = ("", None)
+
+    for result, career_entries in prepared:
+        get = result.get
+        has_overlap = get("has_overlap", False)
+
+        # Basic info columns
+        row = [
+            (get("coach_name", "Unknown"), None),
+            (get("current_school", "Unknown"), None),
+            (get("current_position", "Unknown"), None)
+        ]
+
+        # Career columns with hyperlinks, padded to the shared column count
+        row.extend(career_entries)
+        row.extend([empty_entry] * (max_career_entries - len(career_entries)))
+
+        # Overlap columns
+        row.append(("YES" if has_overlap else "NO", None))
+        row.append((summarize_overlaps(result), None))
+        row.append((data_quality(result), None))
+
+        for i, (value, _) in enumerate(row):
+            if value:
+                length = len(value) if isinstance(value, str) else len(str(value))
+                if length > col_widths[i]:
+                    col_widths[i] = length
+
+        rows.append((row, has_overlap))
+
+    return headers, rows, col_widths
+
+
+def register_report_styles(wb, prefix: str = "Report") -> Dict:
+    """
+    Register the report's cell styles on a workbook as named styles.
+
+    Every cell then shares one style record instead of carrying its own
+    font/fill/border objects, and is styled by assigning the style's name.
+
+    Args:
+        wb: Workbook to register the styles on
+        prefix: Style name prefix ("Report Header", "Report Cell", ...)
+
+    Returns:
+        Dictionary with the header style name under "header" and the data
+        cell style names under "cells", keyed by (is_link, has_overlap)
+    """
+    # Colors are full ARGB with an opaque alpha; a 6-digit value gets a
+    # transparent 00 alpha from openpyxl
+    header_font = Font(bold=True, color="FFFFFFFF")
+    header_fill = PatternFill(start_color="FF4472C4", end_color="FF4472C4", fill_type="solid")
+    overlap_fill = PatternFill(start_color="FFC6EFCE", end_color="FFC6EFCE", fill_type="solid")  # Light green
+    link_font = Font(color="FF0563C1", underline="single")
+    thin_border = Border(
+        left=Side(style='thin'),
+        right=Side(style='thin'),
+        top=Side(style='thin'),
+        bottom=Side(style='thin')
+    )
+    header_alignment = Alignment(horizontal="center", vertical="center")
+
+    header_style = NamedStyle(
+        name=f"{prefix} Header", font=header_font, fill=header_fill,
+        alignment=header_alignment, border=thin_border
+    )
+    cell_styles = {
+        (False, False): NamedStyle(name=f"{prefix} Cell", border=thin_border, font=DEFAULT_FONT),
+        (False, True): NamedStyle(name=f"{prefix} Overlap", border=thin_border, fill=overlap_fill, font=DEFAULT_FONT),
+        (True, False): NamedStyle(name=f"{prefix} Link", border=thin_border, font=link_font),
+        (True, True): NamedStyle(name=f"{prefix} Overlap Link", border=thin_border, fill=overlap_fill, font=link_font),
+    }
+
+    wb.add_named_style(header_style)
+    for named_style in cell_styles.values():
+        wb.add_named_style(named_style)
+
+    return {
+        "header": header_style.name,
+        "cells": {key: named_style.name for key, named_style in cell_styles.items()},
+    }
+
+
+def build_header_cells(ws, headers: List[str], styles: Dict) -> List:
+    """
+    Build the styled header row.
+
+    The cells only carry a value and a style, so one list can be appended
+    to every sheet of the workbook.
+
+    Args:
+        ws: Write-only worksheet of the workbook the header is for
+        headers: Column headers
+        styles: Cell style names, see register_report_styles
+
+    Returns:
+        List of header WriteOnlyCells
+    """
+    header_cells = []
+    for header in headers:
+        cell = WriteOnlyCell(ws, value=header)
+        cell.style = styles["header"]
+        header_cells.append(cell)
+    return header_cells
+
+
+def build_row_cells(ws, row: Iterable[Tuple], has_overlap: bool, styles: Dict) -> List:
+    """
+    Build one styled data row, with hyperlinks and overlap highlighting.
+
+    Args:
+        ws: Write-only worksheet the row is for
+        row: (value, hyperlink_or_None) pairs, one per column
+        has_overlap: Whether the row is highlighted as an NMDP overlap
+        styles: Cell style names, see register_report_styles
+
+    Returns:
+        List of WriteOnlyCells
+    """
+    # Resolve the row's two styles once instead of per cell
+    plain_style = styles["cells"][(False, has_overlap)]
+    link_style = styles["cells"][(True, has_overlap)]
+    row_cells = []
+    for value, source_url in row:
+        cell = WriteOnlyCell(ws, value=value)
+        if source_url:
+            cell.hyperlink = source_url
+            cell.style = link_style
+        else:
+            cell.style = plain_style
+        row_cells.append(cell)
+    return row_cells
+
+
+def _write_excel_openpyxl(output_path: str, headers: List[str], rows: List, col_widths: List[int]):
+    """Write the Excel report with openpyxl's write-only workbook."""
+    # Create a write-only workbook: rows are streamed into the archive
+    # instead of being kept as Cell objects
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Coach NMDP Cross-Reference")
+    styles = register_report_styles(wb)
+
+    # Auto-adjust column widths
+    for col, max_length in enumerate(col_widths, 1):
+        ws.column_dimensions[get_column_letter(col)].width = min(max_length + 2, 50)  # Cap at 50
+
+    # Freeze header row
+    ws.freeze_panes = "A2"
+
+    ws.append(build_header_cells(ws, headers, styles))
+
+    # Write data rows with borders, hyperlinks and overlap highlighting
+    for row, has_overlap in rows:
+        ws.append(build_row_cells(ws, row, has_overlap, styles))
+
+    wb.save(output_path)
+
+
+def _write_excel_xlsxwriter(output_path: str, headers: List[str], rows: List, col_widths: List[int]):
+    """Write the Excel report with xlsxwriter in constant-memory mode."""
+    wb = xlsxwriter.Workbook(output_path, {"constant_memory": True})
+    ws = wb.add_worksheet("Coach NMDP Cross-Reference")
+
+    # Define formats once; every cell reuses one of these
+    header_format = wb.add_format({
+        "bold": True, "font_color": "#FFFFFF", "bg_color": "#4472C4",
+        "align": "center", "valign": "vcenter", "border": 1
+    })
+    overlap_color = "#C6EFCE"  # Light green
+    link_props = {"font_color": "#0563C1", "underline": 1}
+    cell_formats = {
+        # (is_link, has_overlap) -> format
+        (False, False): wb.add_format({"border": 1}),
+        (False, True): wb.add_format({"border": 1, "bg_color": overlap_color}),
+        (True, False): wb.add_format({"border": 1, **link_props}),
+        (True, True): wb.add_format({"border": 1, "bg_color": overlap_color, **link_props}),
+    }
+
+    # Auto-adjust column widths
+    for col, max_length in enumerate(col_widths):
+        ws.set_column(col, col, min(max_length + 2, 50))  # Cap at 50
+
+    # Freeze header row
+    ws.freeze_panes(1, 0)
+
+    # Write headers
+    for col, header in enumerate(headers):
+        ws.write_string(0, col, header, header_format)
+
+    # Write data rows (constant_memory requires strictly row-by-row order)
+    for row_idx, (row, has_overlap) in enumerate(rows, 1):
+        for col, (value, source_url) in enumerate(row):
+            if source_url:
+                cell_format = cell_formats[(True, has_overlap)]
+                # write_url returns a negative code for URLs Excel can't
+                # store (too long, over the per-sheet limit); keep the text
+                if ws.write_url(row_idx, col, source_url, cell_format, value) >= 0:
+                    continue
+            cell_format = cell_formats[(False, has_overlap)]
+            if value is not None and value != "":
+                ws.write(row_idx, col, value, cell_format)
+            else:
+                ws.write_blank(row_idx, col, None, cell_format)
+
+    wb.close()
+
+
+# Reports with more rows than this skip openpyxl and write the sheet XML
+# directly; smaller reports aren't worth bypassing the library for
+DIRECT_XLSX_ROW_THRESHOLD = 5000
 
-        # Try to extract start year to filter
-        try:
-            start_year = int(years.split("-")[0])
-            if start_year < year_start:
-                end_part = years.split("-")[1]
-                if end_part.lower() == "present":
-                    pass  # Include it
-                else:
-                    end_year = int(end_part)
-                    if end_year < year_start:
-                        continue  # Skip entirely
-        except (ValueError, IndexError):
-            pass  # Include if we can't parse
+# Characters XML 1.0 can't carry (openpyxl rejects them too)
+_ILLEGAL_XML_CHARS_RE = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f]")
 
-        display_text = f"{school} ({years})"
-        entries.append((display_text, source_url))
+_XLSX_CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '<Override PartName="/xl/worksheets/sheet1.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+    '<Override PartName="/xl/styles.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+    '</Types>'
+)
+
+_XLSX_ROOT_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="xl/workbook.xml"/>'
+    '</Relationships>'
+)
+
+_XLSX_WORKBOOK = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+    '<sheets><sheet name="Coach NMDP Cross-Reference" sheetId="1" r:id="rId1"/></sheets>'
+    '</workbook>'
+)
+
+_XLSX_WORKBOOK_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" Target="worksheets/sheet1.xml"/>'
+    '<Relationship Id="rId2" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" Target="styles.xml"/>'
+    '</Relationships>'
+)
+
+# Cell formats (cellXfs index): 1 header, 2 cell, 3 overlap, 4 link, 5 overlap link
+_XLSX_STYLES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<styleSheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+    '<fonts count="3">'
+    '<font><sz val="11"/><name val="Calibri"/><family val="2"/></font>'
+    '<font><b/><color rgb="FFFFFFFF"/><sz val="11"/><name val="Calibri"/><family val="2"/></font>'
+    '<font><u/><color rgb="FF0563C1"/><sz val="11"/><name val="Calibri"/><family val="2"/></font>'
+    '</fonts>'
+    '<fills count="4">'
+    '<fill><patternFill/></fill>'
+    '<fill><patternFill patternType="gray125"/></fill>'
+    '<fill><patternFill patternType="solid"><fgColor rgb="FF4472C4"/><bgColor rgb="FF4472C4"/></patternFill></fill>'
+    '<fill><patternFill patternType="solid"><fgColor rgb="FFC6EFCE"/><bgColor rgb="FFC6EFCE"/></patternFill></fill>'
+    '</fills>'
+    '<borders count="2">'
+    '<border><left/><right/><top/><bottom/><diagonal/></border>'
+    '<border><left style="thin"/><right style="thin"/><top style="thin"/><bottom style="thin"/><diagonal/></border>'
+    '</borders>'
+    '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+    '<cellXfs count="6">'
+    '<xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>'
+    '<xf numFmtId="0" fontId="1" fillId="2" borderId="1" xfId="0" applyFont="1" applyFill="1" applyBorder="1" applyAlignment="1">'
+    '<alignment horizontal="center" vertical="center"/></xf>'
+    '<xf numFmtId="0" fontId="0" fillId="0" borderId="1" xfId="0" applyBorder="1"/>'
+    '<xf numFmtId="0" fontId="0" fillId="3" borderId="1" xfId="0" applyFill="1" applyBorder="1"/>'
+    '<xf numFmtId="0" fontId="2" fillId="0" borderId="1" xfId="0" applyFont="1" applyBorder="1"/>'
+    '<xf numFmtId="0" fontId="2" fillId="3" borderId="1" xfId="0" applyFont="1" applyFill="1" applyBorder="1"/>'
+    '</cellXfs>'
+    '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+    '</styleSheet>'
+)
+
+
+def _column_letter(col: int) -> str:
+    """Convert a 1-based column index to its Excel letter (1 -> A, 27 -> AA)."""
+    letters = ""
+    while col:
+        col, remainder = divmod(col - 1, 26)
+        letters = chr(65 + remainder) + letters
+    return letters
+
+
+def _xlsx_cell(ref: str, style: int, value) -> str:
+    """
+    Render one cell of sheet XML, typed as openpyxl would write it.
 
-    return entries
+    Booleans become t="b" cells and finite numbers t="n" cells; anything
+    else, including NaN and infinities (which a numeric cell can't hold),
+    is written as an inline string.
+    """
+    if value is None or value == "":
+        return f'<c r="{ref}" s="{style}"/>'
+    if isinstance(value, bool):
+        return f'<c r="{ref}" s="{style}" t="b"><v>{int(value)}</v></c>'
+    if isinstance(value, int) or (isinstance(value, float) and math.isfinite(value)):
+        return f'<c r="{ref}" s="{style}" t="n"><v>{value!r}</v></c>'
+    text = _ILLEGAL_XML_CHARS_RE.sub("", value if isinstance(value, str) else str(value))
+    space = ' xml:space="preserve"' if text != text.strip() else ""
+    return f'<c r="{ref}" s="{style}" t="inlineStr"><is><t{space}>{xml_escape(text)}</t></is></c>'
+
+
+def _write_excel_direct(output_path: str, headers: List[str], rows: List, col_widths: List[int]):
+    """
+    Write the Excel report by emitting the worksheet XML directly.
+
+    Produces the same layout as _write_excel_openpyxl (styles, hyperlinks,
+    widths, frozen header) without creating a Python object per cell; rows
+    are rendered as strings and streamed into the zip archive.
+    """
+    letters = [_column_letter(col) for col in range(1, len(headers) + 1)]
+    hyperlinks = []
+
+    with open(output_path, "wb", buffering=WRITE_BUFFER_SIZE) as output_file, \
+            zipfile.ZipFile(output_file, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=6) as archive:
+        archive.writestr("[Content_Types].xml", _XLSX_CONTENT_TYPES)
+        archive.writestr("_rels/.rels", _XLSX_ROOT_RELS)
+        archive.writestr("xl/workbook.xml", _XLSX_WORKBOOK)
+        archive.writestr("xl/_rels/workbook.xml.rels", _XLSX_WORKBOOK_RELS)
+        archive.writestr("xl/styles.xml", _XLSX_STYLES)
+
+        with archive.open("xl/worksheets/sheet1.xml", "w") as sheet:
+            cols = "".join(
+                f'<col min="{col}" max="{col}" width="{min(max_length + 2, 50)}" customWidth="1"/>'
+                for col, max_length in enumerate(col_widths, 1)
+            )
+            sheet.write((
+                '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+                '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+                'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+                '<sheetViews><sheetView workbookViewId="0">'
+                '<pane ySplit="1" topLeftCell="A2" activePane="bottomLeft" state="frozen"/>'
+                '<selection pane="bottomLeft" activeCell="A2" sqref="A2"/>'
+                '</sheetView></sheetViews>'
+                f'<sheetFormatPr defaultRowHeight="15"/><cols>{cols}</cols><sheetData>'
+                '<row r="1">'
+                + "".join(_xlsx_cell(f"{letter}1", 1, header) for letter, header in zip(letters, headers))
+                + '</row>'
+            ).encode("utf-8"))
+
+            chunk = []
+            for row_idx, (row, has_overlap) in enumerate(rows, 2):
+                plain_style = 3 if has_overlap else 2
+                cells = []
+                for letter, (value, source_url) in zip(letters, row):
+                    ref = f"{letter}{row_idx}"
+                    if source_url:
+                        hyperlinks.append((ref, source_url))
+                        cells.append(_xlsx_cell(ref, plain_style + 2, value))
+                    else:
+                        cells.append(_xlsx_cell(ref, plain_style, value))
+                chunk.append(f'<row r="{row_idx}">{"".join(cells)}</row>')
+
+                # Flush in batches to keep the pending string small
+                if len(chunk) >= 1000:
+                    sheet.write("".join(chunk).encode("utf-8"))
+                    chunk = []
+
+            tail = "".join(chunk) + "</sheetData>"
+            if hyperlinks:
+                tail += "<hyperlinks>" + "".join(
+                    f'<hyperlink ref="{ref}" r:id="rId{i}"/>' for i, (ref, _) in enumerate(hyperlinks, 1)
+                ) + "</hyperlinks>"
+            tail += "</worksheet>"
+            sheet.write(tail.encode("utf-8"))
+
+        if hyperlinks:
+            archive.writestr("xl/worksheets/_rels/sheet1.xml.rels", (
+                '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+                '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+                + "".join(
+                    f'<Relationship Id="rId{i}" '
+                    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/hyperlink" '
+                    f'Target={xml_quoteattr(_ILLEGAL_XML_CHARS_RE.sub("", url))} TargetMode="External"/>'
+                    for i, (_, url) in enumerate(hyperlinks, 1)
+                )
+                + '</Relationships>'
+            ))
 
 
 def generate_excel_report(
@@ -164,6 +686,11 @@ def generate_excel_report(
     """
     Generate an Excel report with clickable hyperlinks in career history.
 
+    Uses xlsxwriter (constant-memory mode) when installed. Otherwise
+    reports with more than DIRECT_XLSX_ROW_THRESHOLD rows have their sheet
+    XML written directly (_write_excel_direct), and smaller ones use
+    openpyxl's write-only workbook.
+
     Args:
         results: List of cross-reference result dictionaries
         output_path: Path to write Excel file
@@ -172,113 +699,83 @@ def generate_excel_report(
     Returns:
         Path to generated Excel file
     """
-    if not EXCEL_AVAILABLE:
-        raise ImportError("openpyxl is required for Excel output. Install with: pip install openpyxl")
+    if not (XLSXWRITER_AVAILABLE or EXCEL_AVAILABLE):
+        raise ImportError("openpyxl or xlsxwriter is required for Excel output. Install with: pip install openpyxl")
 
     config = config or {}
     year_start = config.get("year_range", {}).get("start", 2020)
 
-    # Determine max career entries across all coaches
-    max_career_entries = 0
-    for result in results:
-        entries = get_career_entries_with_urls(result.get("career_history", []), year_start)
-        max_career_entries = max(max_career_entries, len(entries))
+    headers, rows, col_widths = _build_excel_rows(results, year_start)
 
-    # Ensure at least 3 career columns
-    max_career_entries = max(max_career_entries, 3)
+    # Ensure output directory exists
+    _ensure_dir(os.path.dirname(output_path))
 
-    # Create workbook and worksheet
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Coach NMDP Cross-Reference"
+    # Save workbook
+    if XLSXWRITER_AVAILABLE:
+        _write_excel_xlsxwriter(output_path, headers, rows, col_widths)
+    elif len(rows) > DIRECT_XLSX_ROW_THRESHOLD:
+        _write_excel_direct(output_path, headers, rows, col_widths)
+    else:
+        _write_excel_openpyxl(output_path, headers, rows, col_widths)
 
-    # Define styles
-    header_font = Font(bold=True, color="FFFFFF")
-    header_fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
-    overlap_fill = PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid")  # Light green
-    link_font = Font(color="0563C1", underline="single")
-    thin_border = Border(
-        left=Side(style='thin'),
-        right=Side(style='thin'),
-        top=Side(style='thin'),
-        bottom=Side(style='thin')
-    )
+    return output_path
 
-    # Build headers
-    headers = ["Coach Name", "Current School", "Current Position"]
-    for i in range(max_career_entries):
-        headers.append(f"Career {i+1}")
-    headers.extend(["NMDP Overlap", "Overlap Details", "Data Quality"])
 
-    # Write headers
-    for col, header in enumerate(headers, 1):
-        cell = ws.cell(row=1, column=col, value=header)
-        cell.font = header_font
-        cell.fill = header_fill
-        cell.alignment = Alignment(horizontal="center", vertical="center")
-        cell.border = thin_border
-
-    # Write data rows
-    for row_idx, result in enumerate(results, 2):
-        career_history = result.get("career_history", [])
-        career_entries = get_career_entries_with_urls(career_history, year_start)
-        has_overlap = result.get("has_overlap", False)
+def _csv_row(result: Dict, year_start: int) -> Tuple[str, ...]:
+    """Build one CSV row, in generate_csv_report's column order."""
+    get = result.get
+    career_history = get("career_history", _EMPTY)
+    return (
+        get("coach_name", "Unknown"),
+        get("current_school", "Unknown"),
+        get("current_position", "Unknown"),
+        format_career_history(career_history, year_start),
+        format_source_urls(career_history),
+        "YES" if get("has_overlap") else "NO",
+        _result_overlap_summary(result),
+        _result_quality(result)
+    )
 
-        # Basic info columns
-        ws.cell(row=row_idx, column=1, value=result.get("coach_name", "Unknown"))
-        ws.cell(row=row_idx, column=2, value=result.get("current_school", "Unknown"))
-        ws.cell(row=row_idx, column=3, value=result.get("current_position", "Unknown"))
-
-        # Career columns with hyperlinks
-        for i in range(max_career_entries):
-            col_idx = 4 + i
-            if i < len(career_entries):
-                display_text, source_url = career_entries[i]
-                cell = ws.cell(row=row_idx, column=col_idx, value=display_text)
-                if source_url:
-                    cell.hyperlink = source_url
-                    cell.font = link_font
-            else:
-                ws.cell(row=row_idx, column=col_idx, value="")
 
-        # Overlap columns
-        overlap_col = 4 + max_career_entries
-        ws.cell(row=row_idx, column=overlap_col, value="YES" if has_overlap else "NO")
-        ws.cell(row=row_idx, column=overlap_col + 1, value=format_overlaps_summary(result.get("overlaps", [])))
-        ws.cell(row=row_idx, column=overlap_col + 2, value=determine_data_quality(career_history, result.get("research_status", "")))
-
-        # Apply borders and highlighting to all cells in row
-        for col in range(1, len(headers) + 1):
-            cell = ws.cell(row=row_idx, column=col)
-            cell.border = thin_border
-            if has_overlap:
-                cell.fill = overlap_fill
+def iter_csv_rows(results: Iterable[Dict], year_start: int = 2020) -> Iterator[Tuple[str, ...]]:
+    """
+    Lazily format cross-reference results as CSV data rows.
 
-    # Auto-adjust column widths
-    for col in range(1, len(headers) + 1):
-        max_length = 0
-        column_letter = get_column_letter(col)
-        for row in range(1, len(results) + 2):
-            cell = ws.cell(row=row, column=col)
-            if cell.value:
-                max_length = max(max_length, len(str(cell.value)))
-        adjusted_width = min(max_length + 2, 50)  # Cap at 50
-        ws.column_dimensions[column_letter].width = adjusted_width
+    Args:
+        results: Cross-reference result dictionaries (any iterable, e.g.
+            iter_cross_reference_all_coaches, so results need not be held
+            in memory all at once)
+        year_start: Earliest career year to include
 
-    # Freeze header row
-    ws.freeze_panes = "A2"
+    Yields:
+        One row tuple per result, in generate_csv_report's column order
+    """
+    for result in results:
+        yield _csv_row(result, year_start)
 
-    # Ensure output directory exists
-    os.makedirs(os.path.dirname(output_path), exist_ok=True)
 
-    # Save workbook
-    wb.save(output_path)
+def _write_csv_polars(output_path: str, fieldnames: List[str], results: List[Dict], year_start: int):
+    """
+    Write the CSV report with polars' compiled CSV writer.
 
-    return output_path
+    Columns are built as one list each. Empty values become nulls written as
+    empty fields, so the output matches csv.writer's (CRLF line endings,
+    minimal quoting).
+    """
+    columns = [[] for _ in fieldnames]
+    for row in iter_csv_rows(results, year_start):
+        for column, value in zip(columns, row):
+            column.append(None if value is None or value == "" else str(value))
+
+    df = pl.DataFrame(
+        {name: column for name, column in zip(fieldnames, columns)},
+        schema={name: pl.Utf8 for name in fieldnames}
+    )
+    df.write_csv(output_path, line_terminator="\r\n", null_value="")
 
 
 def generate_csv_report(
-    results: List[Dict],
+    results: Iterable[Dict],
     output_path: str,
     config: Dict = None
 ) -> str:
@@ -286,7 +783,8 @@ def generate_csv_report(
     Generate a CSV report from cross-reference results.
 
     Args:
-        results: List of cross-reference result dictionaries
+        results: Cross-reference result dictionaries (a list or any iterable;
+            rows are written as results are consumed)
         output_path: Path to write CSV file
         config: Configuration dictionary
 
@@ -309,27 +807,18 @@ def generate_csv_report(
     ]
 
     # Ensure output directory exists
-    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    _ensure_dir(os.path.dirname(output_path))
 
-    with open(output_path, 'w', newline='', encoding='utf-8') as csvfile:
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-        writer.writeheader()
+    # Large, already-materialized result lists go through polars' native writer
+    if POLARS_AVAILABLE and isinstance(results, list) and len(results) > POLARS_CSV_ROW_THRESHOLD:
+        _write_csv_polars(output_path, fieldnames, results, year_start)
+        return output_path
 
-        for result in results:
-            career_history = result.get("career_history", [])
+    with open(output_path, 'w', newline='', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(fieldnames)
 
-            row = {
-                "Coach Name": result.get("coach_name", "Unknown"),
-                "Current School": result.get("current_school", "Unknown"),
-                "Current Position": result.get("current_position", "Unknown"),
-                f"Career History ({year_start}-Present)": format_career_history(career_history, year_start),
-                "Source URLs": format_source_urls(career_history),
-                "NMDP Overlap": "YES" if result.get("has_overlap") else "NO",
-                "Overlap Details": format_overlaps_summary(result.get("overlaps", [])),
-                "Data Quality": determine_data_quality(career_history, result.get("research_status", ""))
-            }
-
-            writer.writerow(row)
+        writer.writerows(iter_csv_rows(results, year_start))
 
     return output_path
 
@@ -377,9 +866,11 @@ def generate_report_for_school(
 
     # Load config
     config = {}
-    if os.path.exists(config_path):
+    try:
         config = load_json_file(config_path)
         logger.info(f"Loaded config from {config_path}")
+    except FileNotFoundError:
+        pass
 
     # Run cross-reference
     logger.info("Running cross-reference against NMDP database...")
@@ -391,6 +882,10 @@ def generate_report_for_school(
 
     logger.info(f"Cross-reference complete: {len(results)} coaches processed")
 
+    # Data quality and overlap summaries feed several outputs; compute them once per coach
+    annotate_data_quality(results)
+    annotate_overlap_summaries(results)
+
     # Generate output filenames
     date_str = datetime.now().strftime("%Y-%m-%d")
     csv_filename = f"{school_dir_name}_{date_str}.csv"
@@ -402,7 +897,7 @@ def generate_report_for_school(
 
     # Generate Excel if available
     excel_path = None
-    if EXCEL_AVAILABLE:
+    if EXCEL_AVAILABLE or XLSXWRITER_AVAILABLE:
         excel_filename = f"{school_dir_name}_{date_str}.xlsx"
         excel_path = os.path.join(output_base_dir, excel_filename)
         logger.info(f"Generating Excel report with hyperlinks: {excel_path}")
@@ -445,6 +940,63 @@ def generate_report_for_school(
     return result_path, excel_path if excel_path else result_path
 
 
+def generate_reports_for_schools(
+    school_names: List[str],
+    cache_base_dir: str,
+    output_base_dir: str,
+    nmdp_db_path: str,
+    aliases_path: str,
+    config_path: str,
+    max_workers: int = None
+) -> Dict[str, Optional[Tuple[str, str]]]:
+    """
+    Generate reports for many schools in parallel, one process per school.
+
+    Schools share no state, so each report runs through
+    generate_report_for_school in a worker process. Per-school log files
+    are disabled in workers; worker output goes to the default log.
+
+    Args:
+        school_names: School names (used for directory lookup)
+        cache_base_dir: Base cache directory
+        output_base_dir: Base output directory
+        nmdp_db_path: Path to GITG database
+        aliases_path: Path to school aliases
+        config_path: Path to config file
+        max_workers: Number of worker processes (defaults to CPU count)
+
+    Returns:
+        Dict mapping each school name (in input order) to its
+        generate_report_for_school result, or None if it failed
+    """
+    logger = get_logger()
+    outcomes = {}
+
+    with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+        futures = {
+            executor.submit(
+                generate_report_for_school,
+                school_name,
+                cache_base_dir,
+                output_base_dir,
+                nmdp_db_path,
+                aliases_path,
+                config_path,
+                False
+            ): school_name
+            for school_name in school_names
+        }
+        for future in as_completed(futures):
+            school_name = futures[future]
+            try:
+                outcomes[school_name] = future.result()
+            except Exception as e:
+                logger.error(f"Report generation failed for {school_name}: {e}")
+                outcomes[school_name] = None
+
+    return {school_name: outcomes.get(school_name) for school_name in school_names}
+
+
 def generate_summary_stats(results: List[Dict]) -> Dict:
     """
     Generate summary statistics from results.
@@ -456,19 +1008,25 @@ def generate_summary_stats(results: List[Dict]) -> Dict:
         Dictionary with summary statistics
     """
     total_coaches = len(results)
-    coaches_with_overlap = sum(1 for r in results if r.get("has_overlap"))
-    total_overlaps = sum(r.get("overlap_count", 0) for r in results)
-
-    verified = sum(1 for r in results if determine_data_quality(r.get("career_history", []), r.get("research_status", "")) == "VERIFIED")
-    partial = sum(1 for r in results if determine_data_quality(r.get("career_history", []), r.get("research_status", "")) == "PARTIAL")
-    unverified = sum(1 for r in results if determine_data_quality(r.get("career_history", []), r.get("research_status", "")) == "UNVERIFIED")
-
+    coaches_with_overlap = 0
+    total_overlaps = 0
+    quality_counts = {"VERIFIED": 0, "PARTIAL": 0, "UNVERIFIED": 0}
     # Unique schools with overlaps
     overlap_schools = set()
+
+    # One pass over the results, classifying each coach's data quality once
     for r in results:
-        for overlap in r.get("overlaps", []):
+        if r.get("has_overlap"):
+            coaches_with_overlap += 1
+        total_overlaps += r.get("overlap_count", 0)
+        quality_counts[_result_quality(r)] += 1
+        for overlap in r.get("overlaps", _EMPTY):
             overlap_schools.add(overlap.get("school"))
 
+    verified = quality_counts["VERIFIED"]
+    partial = quality_counts["PARTIAL"]
+    unverified = quality_counts["UNVERIFIED"]
+
     return {
         "total_coaches": total_coaches,
         "coaches_with_overlap": coaches_with_overlap,
@@ -8,27 +8,35 @@ Generates a consolidated Excel workbook with:
 Each row includes state/county and territory columns.
 """
 
+import hashlib
 import json
+import multiprocessing
 import os
 import sys
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple, Set
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple, Set
 
 from cross_reference import (
     cross_reference_all_coaches,
     format_overlaps_summary,
-    load_json_file
+    load_json_file,
+    load_reference_data
 )
 from generate_csv import (
     get_career_entries_with_urls,
     determine_data_quality,
     format_career_history,
+    build_header_cells,
+    build_row_cells,
+    register_report_styles,
+    _EMPTY,
     EXCEL_AVAILABLE
 )
 
 if EXCEL_AVAILABLE:
     from openpyxl import Workbook
-    from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
     from openpyxl.utils import get_column_letter
 
 
@@ -53,13 +61,79 @@ def load_school_aliases(aliases_path: str) -> Dict[str, List[str]]:
     return {}
 
 
-def normalize_school_name_for_lookup(school_name: str, aliases: Dict[str, List[str]]) -> str:
+# Key under which a trie node stores the (priority, canonical) of the alias ending there
+_TRIE_END = None
+
+
+def build_alias_trie(aliases: Dict[str, List[str]]) -> Dict:
+    """
+    Build a character trie of uppercased aliases for substring matching.
+
+    Each alias ending is tagged with its canonical name's position in the
+    aliases file, so a match reports the same canonical as scanning the
+    file in order would.
+
+    Args:
+        aliases: The aliases dictionary
+
+    Returns:
+        Nested dict trie keyed by character
+    """
+    trie = {}
+    priority = 0
+    for canonical, alias_list in aliases.items():
+        if canonical.startswith("_"):
+            continue
+        for alias in alias_list:
+            node = trie
+            for char in alias.upper():
+                node = node.setdefault(char, {})
+            if _TRIE_END not in node:
+                node[_TRIE_END] = (priority, canonical)
+        priority += 1
+    return trie
+
+
+def match_alias_trie(trie: Dict, upper_name: str) -> Optional[str]:
+    """
+    Find the first canonical (in aliases file order) with an alias contained in upper_name.
+
+    Args:
+        trie: Trie from build_alias_trie
+        upper_name: Uppercased school name
+
+    Returns:
+        Canonical name, or None if no alias occurs in the name
+    """
+    best = None
+    for start in range(len(upper_name) + 1):
+        node = trie
+        pos = start
+        while True:
+            end = node.get(_TRIE_END)
+            if end is not None and (best is None or end < best):
+                best = end
+            if pos == len(upper_name):
+                break
+            node = node.get(upper_name[pos])
+            if node is None:
+                break
+            pos += 1
+    return best[1] if best is not None else None
+
+
+def normalize_school_name_for_lookup(
+    school_name: str,
+    aliases: Dict[str, List[str]],
+    alias_trie: Optional[Dict] = None
+) -> str:
     """
     Try to find the canonical NMDP name for a school.
 
     Args:
         school_name: The school name to look up
         aliases: The aliases dictionary
+        alias_trie: Trie from build_alias_trie (built from aliases if needed and not given)
 
     Returns:
         Canonical name if found, otherwise original name uppercased
@@ -69,18 +143,22 @@ def normalize_school_name_for_lookup(school_name: str, aliases: Dict[str, List[s
     if upper_name in aliases:
         return upper_name
 
-    # Check if it matches any alias
-    for canonical, alias_list in aliases.items():
-        if canonical.startswith("_"):
-            continue
-        for alias in alias_list:
-            if alias.upper() == upper_name or alias.upper() in upper_name.upper():
-                return canonical
+    # First canonical (in file order) with an alias equal to or contained in the name
+    if alias_trie is None:
+        alias_trie = build_alias_trie(aliases)
+    canonical = match_alias_trie(alias_trie, upper_name)
+    if canonical is not None:
+        return canonical
 
     return upper_name
 
 
-def get_school_location(school_name: str, locations: Dict, aliases: Dict) -> Tuple[str, str]:
+def get_school_location(
+    school_name: str,
+    locations: Dict,
+    aliases: Dict,
+    alias_trie: Optional[Dict] = None
+) -> Tuple[str, str]:
     """
     Get state and county for a school.
 
@@ -88,6 +166,7 @@ def get_school_location(school_name: str, locations: Dict, aliases: Dict) -> Tup
         school_name: School name (may be canonical or alias)
         locations: Location mapping dictionary
         aliases: School aliases dictionary
+        alias_trie: Trie from build_alias_trie (built from aliases if needed and not given)
 
     Returns:
         Tuple of (state, county) or ("Unknown", "Unknown") if not found
@@ -104,7 +183,7 @@ def get_school_location(school_name: str, locations: Dict, aliases: Dict) -> Tup
         return loc.get("state", "Unknown"), loc.get("county", "Unknown")
 
     # Try canonical name lookup
-    canonical = normalize_school_name_for_lookup(school_name, aliases)
+    canonical = normalize_school_name_for_lookup(school_name, aliases, alias_trie)
     if canonical in locations:
         loc = locations[canonical]
         return loc.get("state", "Unknown"), loc.get("county", "Unknown")
@@ -112,6 +191,25 @@ def get_school_location(school_name: str, locations: Dict, aliases: Dict) -> Tup
     return "Unknown", "Unknown"
 
 
+# States whose territories are assigned per county rather than statewide
+COUNTY_LEVEL_STATES = ("California", "Texas")
+
+
+def _lookup_county_territory(county: str, counties: Dict[str, str]) -> Optional[str]:
+    """Look up a county as given, then without and with a " County" suffix."""
+    # Try exact match first
+    territory = counties.get(county)
+    if territory is not None:
+        return territory
+
+    # Try without, then with, the "County" suffix
+    county_base = county.replace(" County", "").strip()
+    territory = counties.get(county_base)
+    if territory is not None:
+        return territory
+    return counties.get(f"{county_base} County")
+
+
 def get_territory_for_location(state: str, county: str, territories: Dict) -> str:
     """
     Get NMDP territory for a state/county combination.
@@ -131,33 +229,12 @@ def get_territory_for_location(state: str, county: str, territories: Dict) -> st
         return "Unknown"
 
     # Check for county-level mapping (California and Texas)
-    county_territories = territories.get("county_territories", {})
-
-    if state == "California" and "California" in county_territories:
-        ca_counties = county_territories["California"]
-        # Try exact match first
-        if county in ca_counties:
-            return ca_counties[county]
-        # Try without "County" suffix
-        county_base = county.replace(" County", "").strip()
-        if county_base in ca_counties:
-            return ca_counties[county_base]
-        # Try with "County" suffix
-        if f"{county_base} County" in ca_counties:
-            return ca_counties[f"{county_base} County"]
-
-    if state == "Texas" and "Texas" in county_territories:
-        tx_counties = county_territories["Texas"]
-        # Try exact match first
-        if county in tx_counties:
-            return tx_counties[county]
-        # Try without "County" suffix
-        county_base = county.replace(" County", "").strip()
-        if county_base in tx_counties:
-            return tx_counties[county_base]
-        # Try with "County" suffix
-        if f"{county_base} County" in tx_counties:
-            return tx_counties[f"{county_base} County"]
+    if state in COUNTY_LEVEL_STATES:
+        counties = territories.get("county_territories", {}).get(state)
+        if counties:
+            territory = _lookup_county_territory(county, counties)
+            if territory is not None:
+                return territory
 
     # Fall back to state-level mapping
     state_territories = territories.get("state_territories", {})
@@ -178,177 +255,384 @@ def get_all_cached_schools(cache_base_dir: str) -> List[str]:
         List of school directory names
     """
     schools = []
-    if os.path.exists(cache_base_dir):
-        for item in os.listdir(cache_base_dir):
-            item_path = os.path.join(cache_base_dir, item)
-            if os.path.isdir(item_path):
-                coaches_dir = os.path.join(item_path, "coaches")
-                if os.path.exists(coaches_dir):
-                    schools.append(item)
+    if os.path.isdir(cache_base_dir):
+        # scandir reports entry types without a stat() per entry
+        with os.scandir(cache_base_dir) as it:
+            for entry in it:
+                if entry.is_dir() and os.path.exists(os.path.join(entry.path, "coaches")):
+                    schools.append(entry.name)
     return sorted(schools)
 
 
+# Bump when cross-reference output changes so old xref_*.json files are not reused
+XREF_CACHE_VERSION = 1
+XREF_CACHE_PREFIX = "xref_"
+
+
+def _xref_cache_key(coaches_dir: str, nmdp_db_path: str, aliases_path: str, config_path: str) -> Optional[str]:
+    """
+    Hash the inputs of a school's cross-reference: every coach file's name,
+    mtime and size plus the NMDP database, aliases and config mtimes.
+
+    Returns None if the coaches directory doesn't exist.
+    """
+    try:
+        with os.scandir(coaches_dir) as it:
+            coach_files = []
+            for entry in it:
+                if entry.name.endswith(".json") and entry.is_file():
+                    stat = entry.stat()
+                    coach_files.append((entry.name, stat.st_mtime_ns, stat.st_size))
+    except OSError:
+        return None
+
+    input_mtimes = []
+    for path in (nmdp_db_path, aliases_path, config_path):
+        try:
+            input_mtimes.append(os.stat(path).st_mtime_ns)
+        except (OSError, TypeError):
+            input_mtimes.append(None)
+
+    signature = [XREF_CACHE_VERSION, sorted(coach_files), input_mtimes]
+    return hashlib.sha1(json.dumps(signature).encode("utf-8")).hexdigest()
+
+
+def cross_reference_school_cached(
+    coaches_dir: str,
+    nmdp_db_path: str,
+    aliases_path: str,
+    config_path: str,
+    reference_data: Optional[Tuple] = None
+) -> List[Dict]:
+    """
+    Cross-reference a school's coaches, reusing the last results if no input changed.
+
+    Results are stored next to the coaches directory as xref_<key>.json,
+    where the key hashes the coach files and the NMDP database, aliases and
+    config mtimes. Older xref_*.json files for the school are removed after
+    a new one is written.
+
+    Args:
+        coaches_dir: Path to the school's coaches directory
+        nmdp_db_path: Path to GITG database
+        aliases_path: Path to school aliases
+        config_path: Path to config file
+        reference_data: Result of load_reference_data (optional)
+
+    Returns:
+        List of cross-reference results for the school's coaches
+    """
+    key = _xref_cache_key(coaches_dir, nmdp_db_path, aliases_path, config_path)
+    if key is None:
+        return cross_reference_all_coaches(
+            coaches_dir, nmdp_db_path, aliases_path, config_path,
+            reference_data=reference_data
+        )
+
+    school_path = os.path.dirname(coaches_dir)
+    cache_name = f"{XREF_CACHE_PREFIX}{key}.json"
+    cache_path = os.path.join(school_path, cache_name)
+
+    try:
+        cached = load_json_file(cache_path)
+        if isinstance(cached, list):
+            return cached
+    except (OSError, ValueError):
+        pass  # Missing or unreadable; recompute
+
+    results = cross_reference_all_coaches(
+        coaches_dir, nmdp_db_path, aliases_path, config_path,
+        reference_data=reference_data
+    )
+
+    # Write atomically, then drop results cached for older inputs
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(results, f)
+        os.replace(tmp_path, cache_path)
+        for name in os.listdir(school_path):
+            if name.startswith(XREF_CACHE_PREFIX) and name.endswith(".json") and name != cache_name:
+                os.remove(os.path.join(school_path, name))
+    except OSError:
+        pass  # The cache is only a shortcut
+
+    return results
+
+
+# Per-process arguments for _cross_reference_school_in_worker, set by _init_school_worker
+_school_worker_args: Optional[Tuple] = None
+
+
+def _init_school_worker(nmdp_db_path, aliases_path, config_path, reference_data):
+    """Stash the shared cross-reference inputs once per worker process instead of per school."""
+    global _school_worker_args
+    _school_worker_args = (nmdp_db_path, aliases_path, config_path, reference_data)
+
+
+def _clear_school_worker():
+    """Drop the shared cross-reference inputs stashed by _init_school_worker."""
+    global _school_worker_args
+    _school_worker_args = None
+
+
+def _cross_reference_school_in_worker(coaches_dir: str) -> List[Dict]:
+    """Cross-reference one school's coaches using the worker's shared inputs."""
+    nmdp_db_path, aliases_path, config_path, reference_data = _school_worker_args
+    return cross_reference_school_cached(
+        coaches_dir, nmdp_db_path, aliases_path, config_path, reference_data
+    )
+
+
+def iter_school_results(
+    cache_base_dir: str,
+    nmdp_db_path: str,
+    aliases_path: str,
+    config_path: str,
+    locations_path: str,
+    territory_path: str,
+    max_workers: Optional[int] = None,
+    schools: Optional[List[str]] = None
+) -> Iterator[List[Dict]]:
+    """
+    Cross-reference all cached schools, yielding each school's augmented results.
+
+    Takes the same arguments as aggregate_all_results; schools come out in
+    order, so callers can consume one school at a time instead of holding
+    every result in memory.
+
+    Yields:
+        List of one school's result dictionaries (schools without coach data are skipped)
+    """
+    # Load mappings
+    locations = load_school_locations(locations_path)
+    territories = load_territory_mapping(territory_path)
+    aliases = load_school_aliases(aliases_path)
+    alias_trie = build_alias_trie(aliases)
+    config = load_json_file(config_path) if os.path.exists(config_path) else {}
+
+    # NMDP database, aliases and config are shared by every school; load them once
+    reference_data = load_reference_data(nmdp_db_path, aliases_path, config_path)
+
+    if schools is None:
+        schools = get_all_cached_schools(cache_base_dir)
+
+    # school name -> (state, county, territory), resolved once per name
+    school_locations = {}
+
+    print(f"Found {len(schools)} schools with cached data")
+
+    # Cross-reference each school's coaches; schools share no mutable state
+    coaches_dirs = [os.path.join(cache_base_dir, school_dir, "coaches") for school_dir in schools]
+    shared = (nmdp_db_path, aliases_path, config_path, reference_data)
+    max_workers = max_workers or os.cpu_count() or 1
+    executor = None
+    if max_workers > 1 and len(schools) > 1:
+        if "fork" in multiprocessing.get_all_start_methods():
+            # Forked workers inherit the loaded reference data copy-on-write
+            _init_school_worker(*shared)
+            executor = ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context("fork")
+            )
+        else:
+            executor = ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=_init_school_worker,
+                initargs=shared
+            )
+        school_results = executor.map(_cross_reference_school_in_worker, coaches_dirs)
+    else:
+        school_results = (
+            cross_reference_school_cached(
+                coaches_dir, nmdp_db_path, aliases_path, config_path, reference_data
+            )
+            for coaches_dir in coaches_dirs
+        )
+
+    try:
+        for school_dir, results in zip(schools, school_results):
+            if not results:
+                print(f"  {school_dir}: No coach data")
+                continue
+
+            # Get the current school name from first coach (they should all be the same)
+            current_school = sys.intern(results[0].get("current_school", school_dir.replace("_", " ").title()))
+
+            # Look up location and territory; the interned strings are shared
+            # by every result from schools in the same state/county/territory
+            location = school_locations.get(current_school)
+            if location is None:
+                state, county = get_school_location(current_school, locations, aliases, alias_trie)
+                territory = get_territory_for_location(state, county, territories)
+                location = school_locations[current_school] = (
+                    sys.intern(state), sys.intern(county), sys.intern(territory)
+                )
+            state, county, territory = location
+
+            print(f"  {school_dir}: {len(results)} coaches, {state}, {territory}")
+
+            # Augment each result
+            for result in results:
+                result["searched_school"] = current_school
+                result["state"] = state
+                result["county"] = county
+                result["territory"] = territory
+            yield results
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+        _clear_school_worker()
+
+
 def aggregate_all_results(
     cache_base_dir: str,
     nmdp_db_path: str,
     aliases_path: str,
     config_path: str,
     locations_path: str,
-    territory_path: str
+    territory_path: str,
+    max_workers: Optional[int] = None,
+    schools: Optional[List[str]] = None
 ) -> List[Dict]:
     """
     Aggregate cross-reference results from all cached schools.
 
+    Schools are cross-referenced in parallel worker processes (max_workers,
+    defaulting to the CPU count); results are gathered in school order.
+    Pass schools (from get_all_cached_schools) to skip rescanning the cache.
+
     Returns list of result dictionaries, each augmented with:
     - searched_school: The school that was searched
     - state: State of the searched school
     - county: County of the searched school
     - territory: NMDP territory
     """
-    # Load mappings
-    locations = load_school_locations(locations_path)
-    territories = load_territory_mapping(territory_path)
-    aliases = load_school_aliases(aliases_path)
-    config = load_json_file(config_path) if os.path.exists(config_path) else {}
-
     all_results = []
-    schools = get_all_cached_schools(cache_base_dir)
+    for results in iter_school_results(
+        cache_base_dir, nmdp_db_path, aliases_path, config_path,
+        locations_path, territory_path, max_workers, schools
+    ):
+        all_results.extend(results)
+    return all_results
 
-    print(f"Found {len(schools)} schools with cached data")
 
-    for school_dir in schools:
-        coaches_dir = os.path.join(cache_base_dir, school_dir, "coaches")
+class SheetRow(NamedTuple):
+    """One coach's master report row, built once and shared by the Master and territory tabs."""
+    territory: Optional[str]
+    has_overlap: bool
+    cells: List[Tuple[str, Optional[str]]]  # (value, hyperlink) per column, career columns unpadded
+    widths: List[int]  # display width per cell (0 for empty cells)
+    career_count: int  # number of career cells in cells
 
-        # Cross-reference this school's coaches
-        results = cross_reference_all_coaches(
-            coaches_dir, nmdp_db_path, aliases_path, config_path
-        )
 
-        if not results:
-            print(f"  {school_dir}: No coach data")
-            continue
+# Columns before the career columns: school searched, state, county, territory, coach, position
+INFO_COLUMNS = 6
 
-        # Get the current school name from first coach (they should all be the same)
-        current_school = results[0].get("current_school", school_dir.replace("_", " ").title())
 
-        # Look up location and territory
-        state, county = get_school_location(current_school, locations, aliases)
-        territory = get_territory_for_location(state, county, territories)
+def build_sheet_row(result: Dict, year_start: int) -> SheetRow:
+    """
+    Build the sheet row for one aggregated result.
 
-        print(f"  {school_dir}: {len(results)} coaches, {state}, {territory}")
+    Career columns are not padded here, so rows can be built before the
+    report's career column count is known; write_sheet_data pads them.
 
-        # Augment each result
-        for result in results:
-            result["searched_school"] = current_school
-            result["state"] = state
-            result["county"] = county
-            result["territory"] = territory
-            all_results.append(result)
+    Args:
+        result: Aggregated result dictionary
+        year_start: Earliest year for career filtering
 
-    return all_results
+    Returns:
+        SheetRow with the row's cells and their display widths
+    """
+    get = result.get
+    career_history = get("career_history", _EMPTY)
+    career_entries = get_career_entries_with_urls(career_history, year_start)
+    has_overlap = get("has_overlap", False)
+
+    cells = [
+        # School searched, location and coach info
+        (get("searched_school", "Unknown"), None),
+        (get("state", "Unknown"), None),
+        (get("county", "Unknown"), None),
+        (get("territory", "Unknown"), None),
+        (get("coach_name", "Unknown"), None),
+        (get("current_position", "Unknown"), None),
+    ]
+
+    # Career columns with hyperlinks
+    cells.extend(career_entries)
+
+    # Overlap columns; coaches without overlaps or career history (common)
+    # skip the formatting calls
+    overlaps = get("overlaps")
+    cells.append(("YES" if has_overlap else "NO", None))
+    cells.append((format_overlaps_summary(overlaps) if overlaps else "", None))
+    cells.append((
+        determine_data_quality(career_history, get("research_status", "")) if career_history else "UNVERIFIED",
+        None
+    ))
+
+    widths = [
+        (len(value) if isinstance(value, str) else len(str(value))) if value else 0
+        for value, _ in cells
+    ]
+
+    return SheetRow(get("territory"), has_overlap, cells, widths, len(career_entries))
+
+
+def _pad_career_columns(row: SheetRow, values: List, filler, max_career_entries: int) -> List:
+    """Pad a row's per-cell list out to max_career_entries career columns."""
+    split = INFO_COLUMNS + row.career_count
+    return values[:split] + [filler] * (max_career_entries - row.career_count) + values[split:]
 
 
 def write_sheet_data(
     ws,
-    results: List[Dict],
+    rows: List[SheetRow],
     headers: List[str],
     max_career_entries: int,
-    year_start: int,
-    styles: Dict
+    styles: Dict,
+    header_cells: Optional[List] = None
 ):
     """
-    Write data rows to a worksheet.
+    Write data rows to a write-only worksheet.
 
     Args:
-        ws: Worksheet to write to
-        results: List of result dictionaries
+        ws: Write-only worksheet to write to
+        rows: Rows from build_sheet_row
         headers: Column headers
         max_career_entries: Number of career columns
-        year_start: Earliest year for career filtering
-        styles: Dictionary of styles (header_font, header_fill, etc.)
+        styles: Cell style names, see generate_csv.register_report_styles
+        header_cells: Header row from build_header_cells (built for this
+            sheet if not given)
     """
-    # Write headers
-    for col, header in enumerate(headers, 1):
-        cell = ws.cell(row=1, column=col, value=header)
-        cell.font = styles["header_font"]
-        cell.fill = styles["header_fill"]
-        cell.alignment = styles["center_align"]
-        cell.border = styles["thin_border"]
-
-    # Write data rows
-    for row_idx, result in enumerate(results, 2):
-        career_history = result.get("career_history", [])
-        career_entries = get_career_entries_with_urls(career_history, year_start)
-        has_overlap = result.get("has_overlap", False)
-
-        col = 1
-
-        # School searched
-        ws.cell(row=row_idx, column=col, value=result.get("searched_school", "Unknown"))
-        col += 1
-
-        # State
-        ws.cell(row=row_idx, column=col, value=result.get("state", "Unknown"))
-        col += 1
-
-        # County
-        ws.cell(row=row_idx, column=col, value=result.get("county", "Unknown"))
-        col += 1
-
-        # Territory
-        ws.cell(row=row_idx, column=col, value=result.get("territory", "Unknown"))
-        col += 1
-
-        # Coach info
-        ws.cell(row=row_idx, column=col, value=result.get("coach_name", "Unknown"))
-        col += 1
-
-        ws.cell(row=row_idx, column=col, value=result.get("current_position", "Unknown"))
-        col += 1
-
-        # Career columns with hyperlinks
-        for i in range(max_career_entries):
-            if i < len(career_entries):
-                display_text, source_url = career_entries[i]
-                cell = ws.cell(row=row_idx, column=col, value=display_text)
-                if source_url:
-                    cell.hyperlink = source_url
-                    cell.font = styles["link_font"]
-            else:
-                ws.cell(row=row_idx, column=col, value="")
-            col += 1
-
-        # Overlap columns
-        ws.cell(row=row_idx, column=col, value="YES" if has_overlap else "NO")
-        col += 1
-
-        ws.cell(row=row_idx, column=col, value=format_overlaps_summary(result.get("overlaps", [])))
-        col += 1
-
-        ws.cell(row=row_idx, column=col, value=determine_data_quality(career_history, result.get("research_status", "")))
-        col += 1
-
-        # Apply borders and highlighting
-        for c in range(1, len(headers) + 1):
-            cell = ws.cell(row=row_idx, column=c)
-            cell.border = styles["thin_border"]
-            if has_overlap:
-                cell.fill = styles["overlap_fill"]
+    # A write-only sheet needs its column widths before the first row
+    col_widths = [len(header) for header in headers]
+    for row in rows:
+        widths = _pad_career_columns(row, row.widths, 0, max_career_entries)
+        for col, width in enumerate(widths):
+            if width > col_widths[col]:
+                col_widths[col] = width
 
     # Auto-adjust column widths
-    for col in range(1, len(headers) + 1):
-        max_length = 0
-        column_letter = get_column_letter(col)
-        for row in range(1, len(results) + 2):
-            cell = ws.cell(row=row, column=col)
-            if cell.value:
-                max_length = max(max_length, len(str(cell.value)))
-        adjusted_width = min(max_length + 2, 50)
-        ws.column_dimensions[column_letter].width = adjusted_width
+    for col, max_length in enumerate(col_widths, 1):
+        ws.column_dimensions[get_column_letter(col)].width = min(max_length + 2, 50)
 
     # Freeze header row
     ws.freeze_panes = "A2"
 
+    # Write headers
+    if header_cells is None:
+        header_cells = build_header_cells(ws, headers, styles)
+    ws.append(header_cells)
+
+    # Write data rows with borders, hyperlinks and overlap highlighting
+    append_row = ws.append
+    empty_entry = ("", None)
+    for row in rows:
+        cells = _pad_career_columns(row, row.cells, empty_entry, max_career_entries)
+        append_row(build_row_cells(ws, cells, row.has_overlap, styles))
+
 
 def generate_master_report(
     cache_base_dir: str,
@@ -378,27 +662,30 @@ def generate_master_report(
         print("ERROR: openpyxl required. Install with: pip install openpyxl")
         return None
 
+    # Load config for year range
+    config = load_json_file(config_path) if os.path.exists(config_path) else {}
+    year_start = config.get("year_range", {}).get("start", 2020)
+
+    # Turn each school's results into sheet rows as soon as they arrive, so
+    # only the compact rows (not every result dict) are held until writing.
+    # The Master tab and the coach's territory tab write the same row.
     print("Aggregating all cached school data...")
-    all_results = aggregate_all_results(
+    schools = get_all_cached_schools(cache_base_dir)
+    rows = []
+    for results in iter_school_results(
         cache_base_dir, nmdp_db_path, aliases_path, config_path,
-        locations_path, territory_path
-    )
+        locations_path, territory_path, schools=schools
+    ):
+        rows.extend(build_sheet_row(result, year_start) for result in results)
 
-    if not all_results:
+    if not rows:
         print("No results found in cache")
         return None
 
-    print(f"\nTotal coaches across all schools: {len(all_results)}")
-
-    # Load config for year range
-    config = load_json_file(config_path) if os.path.exists(config_path) else {}
-    year_start = config.get("year_range", {}).get("start", 2020)
+    print(f"\nTotal coaches across all schools: {len(rows)}")
 
     # Calculate max career entries
-    max_career_entries = 0
-    for result in all_results:
-        entries = get_career_entries_with_urls(result.get("career_history", []), year_start)
-        max_career_entries = max(max_career_entries, len(entries))
+    max_career_entries = max((row.career_count for row in rows), default=0)
     max_career_entries = max(max_career_entries, 3)
 
     # Build headers
@@ -414,51 +701,32 @@ def generate_master_report(
         headers.append(f"Career {i+1}")
     headers.extend(["NMDP Overlap", "Overlap Details", "Data Quality"])
 
-    # Define styles
-    styles = {
-        "header_font": Font(bold=True, color="FFFFFF"),
-        "header_fill": PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid"),
-        "overlap_fill": PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid"),
-        "link_font": Font(color="0563C1", underline="single"),
-        "center_align": Alignment(horizontal="center", vertical="center"),
-        "thin_border": Border(
-            left=Side(style='thin'),
-            right=Side(style='thin'),
-            top=Side(style='thin'),
-            bottom=Side(style='thin')
-        )
-    }
-
-    # Create workbook
-    wb = Workbook()
+    # Create a write-only workbook: rows are streamed into the archive
+    # instead of being kept as Cell objects
+    wb = Workbook(write_only=True)
+    styles = register_report_styles(wb, "Master")
 
     # Master tab (all results)
-    ws_master = wb.active
-    ws_master.title = "Master - All Results"
-    write_sheet_data(ws_master, all_results, headers, max_career_entries, year_start, styles)
+    ws_master = wb.create_sheet(title="Master - All Results")
+    # One styled header row, appended to the Master and every territory tab
+    header_cells = build_header_cells(ws_master, headers, styles)
+    write_sheet_data(ws_master, rows, headers, max_career_entries, styles, header_cells)
 
-    # Get unique territories
-    territories = set()
-    for result in all_results:
-        territory = result.get("territory", "Unknown")
-        if territory:
-            territories.add(territory)
+    # Group rows by territory in a single pass
+    territories = defaultdict(list)
+    for row in rows:
+        if row.territory:
+            territories[row.territory].append(row)
 
     # Create tab for each territory
-    for territory in sorted(territories):
-        # Filter results for this territory
-        territory_results = [r for r in all_results if r.get("territory") == territory]
-
-        if not territory_results:
-            continue
-
+    for territory, territory_rows in sorted(territories.items()):
         # Create sheet with sanitized name (Excel limits to 31 chars)
         sheet_name = territory[:31].replace("/", "-").replace("\\", "-")
         ws = wb.create_sheet(title=sheet_name)
 
-        write_sheet_data(ws, territory_results, headers, max_career_entries, year_start, styles)
+        write_sheet_data(ws, territory_rows, headers, max_career_entries, styles, header_cells)
 
-        print(f"  {territory}: {len(territory_results)} coaches")
+        print(f"  {territory}: {len(territory_rows)} coaches")
 
     # Ensure output directory exists
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
@@ -470,9 +738,9 @@ def generate_master_report(
     print(f"\n{'='*50}")
     print("MASTER REPORT SUMMARY")
     print(f"{'='*50}")
-    print(f"Total schools: {len(get_all_cached_schools(cache_base_dir))}")
-    print(f"Total coaches: {len(all_results)}")
-    print(f"Coaches with NMDP overlap: {sum(1 for r in all_results if r.get('has_overlap'))}")
+    print(f"Total schools: {len(schools)}")
+    print(f"Total coaches: {len(rows)}")
+    print(f"Coaches with NMDP overlap: {sum(1 for row in rows if row.has_overlap)}")
     print(f"Territories: {len(territories)}")
     print(f"\nReport saved to: {output_path}")
 
@@ -9,11 +9,18 @@ Exports the master report data to a Google Sheet with:
 
 import gspread
 from oauth2client.service_account import ServiceAccountCredentials
-from typing import List, Dict, Optional
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Iterator, List, Dict, Optional, Tuple
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+import hashlib
 import os
+import random
 import sys
 import json
+import threading
 import time
 
 # Load .env file if present
@@ -28,7 +35,8 @@ from cross_reference import load_json_file
 from generate_csv import (
     get_career_entries_with_urls,
     determine_data_quality,
-    format_overlaps_summary
+    format_overlaps_summary,
+    _EMPTY
 )
 from generate_master_report import (
     aggregate_all_results,
@@ -36,6 +44,58 @@ from generate_master_report import (
 )
 
 
+# Header row style for the Master and territory tabs
+HEADER_FORMAT = {
+    "backgroundColor": {"red": 0.27, "green": 0.45, "blue": 0.77},
+    "textFormat": {"bold": True, "foregroundColor": {"red": 1, "green": 1, "blue": 1}},
+    "horizontalAlignment": "CENTER"
+}
+
+# Developer metadata key holding a hash of each data tab's values, so
+# reruns can skip tabs whose contents have not changed
+CONTENT_HASH_KEY = "gitg_content_hash"
+
+# Most rows sent in one values.batchUpdate request, which keeps each
+# request body well under the API's size limit
+UPLOAD_CHUNK_ROWS = 2000
+
+# Sheets API write quota per user (requests per minute)
+WRITE_QUOTA_PER_MINUTE = 60
+
+# Retries for a request rejected with HTTP 429 before giving up
+MAX_RATE_LIMIT_RETRIES = 6
+
+
+class _TokenBucket:
+    """Token bucket rate limiter; acquire() only blocks once the bucket is empty"""
+
+    def __init__(self, rate: int = WRITE_QUOTA_PER_MINUTE, per: float = 60.0):
+        """
+        Initialize the bucket full.
+
+        Args:
+            rate: Number of tokens (requests) allowed per period
+            per: Period length in seconds
+        """
+        self.capacity = rate
+        self.tokens = float(rate)
+        self.fill_rate = rate / per
+        self.updated = time.monotonic()
+        self.condition = threading.Condition()
+
+    def acquire(self):
+        """Take one token, waiting for the bucket to refill if it is empty"""
+        with self.condition:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.fill_rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                self.condition.wait((1 - self.tokens) / self.fill_rate)
+
+
 class GoogleSheetsExporter:
     """Export GITG coach data to Google Sheets"""
 
@@ -51,6 +111,30 @@ class GoogleSheetsExporter:
         self.sheet_id = sheet_id or os.getenv('GITG_SHEET_ID')
         self.client = None
         self.workbook = None
+        self.bucket = _TokenBucket()
+
+    def _call(self, fn, *args, **kwargs):
+        """
+        Make a gspread API call within the write quota.
+
+        Waits for a token from the rate limiter, then retries with
+        exponential backoff if the API still responds with HTTP 429.
+
+        Args:
+            fn: gspread method to call
+            *args, **kwargs: Arguments for fn
+
+        Returns:
+            Result of fn
+        """
+        for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+            self.bucket.acquire()
+            try:
+                return fn(*args, **kwargs)
+            except gspread.exceptions.APIError as e:
+                if e.code != 429 or attempt == MAX_RATE_LIMIT_RETRIES:
+                    raise
+                time.sleep(min(64, 2 ** attempt) + random.random())
 
     def authenticate(self) -> bool:
         """Authenticate with Google Sheets API"""
@@ -64,6 +148,8 @@ class GoogleSheetsExporter:
                 self.creds_path, scope
             )
             self.client = gspread.authorize(creds)
+            # gspread 6 keeps the session on http_client, older versions on the client
+            self._configure_session(getattr(self.client, "http_client", self.client).session)
             self.workbook = self.client.open_by_key(self.sheet_id)
             print(f"[OK] Authenticated with Google Sheets: {self.workbook.title}")
             return True
@@ -72,32 +158,24 @@ class GoogleSheetsExporter:
             print(f"[ERROR] Google Sheets authentication failed: {e}")
             return False
 
-    def _get_or_create_sheet(self, sheet_name: str, rows: int = 1000, cols: int = 20):
-        """Get existing sheet or create new one"""
-        try:
-            return self.workbook.worksheet(sheet_name)
-        except gspread.exceptions.WorksheetNotFound:
-            return self.workbook.add_worksheet(title=sheet_name, rows=rows, cols=cols)
-
-    def _col_letter(self, col_num: int) -> str:
-        """Convert column number to letter (1=A, 2=B, etc.)"""
-        result = ""
-        while col_num > 0:
-            col_num -= 1
-            result = chr(col_num % 26 + 65) + result
-            col_num //= 26
-        return result
-
-    def _apply_overlap_formatting(self, worksheet, row_index: int, num_cols: int, has_overlap: bool):
-        """Apply row highlighting for coaches with NMDP overlap"""
-        if has_overlap:
-            # Light green for overlap rows
-            color = {"red": 0.77, "green": 0.94, "blue": 0.81}
-            end_col = self._col_letter(num_cols)
-            worksheet.format(
-                f"A{row_index}:{end_col}{row_index}",
-                {"backgroundColor": color}
-            )
+    def _configure_session(self, session):
+        """
+        Tune the authorized HTTP session shared by every API call.
+
+        Google APIs only gzip responses when the User-Agent also contains
+        "gzip". The adapter keeps connections alive across calls and
+        retries connection errors and 5xx responses on idempotent
+        requests; 429s are retried by _call.
+
+        Args:
+            session: requests.Session used by the gspread client
+        """
+        session.headers.update({
+            "Accept-Encoding": "gzip",
+            "User-Agent": f"{session.headers.get('User-Agent', 'gitgsearch')} (gzip)"
+        })
+        retry = Retry(total=5, backoff_factor=0.5, status_forcelist=[500, 502, 503, 504])
+        session.mount("https://", HTTPAdapter(pool_connections=8, pool_maxsize=32, max_retries=retry))
 
     def export_results(
         self,
@@ -120,6 +198,10 @@ class GoogleSheetsExporter:
             if not self.authenticate():
                 return False
 
+        # Look up the existing sheets in the background while the rows are built
+        metadata_pool = ThreadPoolExecutor(max_workers=1)
+        existing_future = metadata_pool.submit(self._fetch_existing_sheets)
+
         try:
             # Build headers
             headers = [
@@ -128,79 +210,62 @@ class GoogleSheetsExporter:
             ]
             for i in range(max_career_cols):
                 headers.append(f"Career {i+1}")
-            headers.extend(["NMDP Overlap", "Overlap Details", "Data Quality", "Last Updated"])
+            headers.extend(["NMDP Overlap", "Overlap Details", "Data Quality"])
             num_cols = len(headers)
 
-            # === Master Results Tab ===
-            print("Updating Master Results tab...")
-            master_sheet = self._get_or_create_sheet("Master Results", rows=len(results) + 10, cols=num_cols)
-            master_sheet.clear()
-
-            # Write headers
-            master_sheet.update(values=[headers], range_name='A1')
-            time.sleep(0.5)
-            master_sheet.format('A1:' + self._col_letter(num_cols) + '1', {
-                "backgroundColor": {"red": 0.27, "green": 0.45, "blue": 0.77},
-                "textFormat": {"bold": True, "foregroundColor": {"red": 1, "green": 1, "blue": 1}},
-                "horizontalAlignment": "CENTER"
-            })
-
-            # Write data rows
-            rows_data = self._build_rows(results, year_start, max_career_cols)
-            if rows_data:
-                end_row = len(rows_data) + 1
-                time.sleep(0.5)
-                master_sheet.update(values=rows_data, range_name=f'A2:{self._col_letter(num_cols)}{end_row}')
-
-            # Freeze header row
-            # Note: Overlap highlighting is handled by conditional formatting rules in the sheet
-            master_sheet.freeze(rows=1)
+            # Every tab as (sheet name, values starting at A1, is a data tab,
+            # grid size if the tab has to be created)
+            tabs = []
 
+            # Export time, noted once per tab rather than repeated on every row
+            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M")
+
+            # === Master Results Tab ===
+            print("Preparing Master Results tab...")
+            rows_data = [headers, *self._build_rows(results, year_start, max_career_cols)]
+            tabs.append(("Master Results", rows_data, True, (len(results) + 10, num_cols)))
             print(f"  Master Results: {len(results)} coaches")
 
             # === Territory Tabs ===
-            territories = {}
+            territories = defaultdict(list)
             for result in results:
-                territory = result.get('territory', 'Unknown')
-                if territory not in territories:
-                    territories[territory] = []
-                territories[territory].append(result)
+                territories[result.get('territory', 'Unknown')].append(result)
+            sorted_territories = sorted(territories.items())
 
-            for territory, territory_results in sorted(territories.items()):
+            for territory, territory_results in sorted_territories:
                 # Sanitize sheet name (max 100 chars, no special chars)
                 sheet_name = territory[:100].replace("/", "-").replace("\\", "-")
-                print(f"Updating {sheet_name} tab...")
-
-                territory_sheet = self._get_or_create_sheet(
-                    sheet_name,
-                    rows=len(territory_results) + 10,
-                    cols=num_cols
-                )
-                territory_sheet.clear()
-
-                # Write headers
-                territory_sheet.update(values=[headers], range_name='A1')
-                time.sleep(0.5)
-                territory_sheet.format('A1:' + self._col_letter(num_cols) + '1', {
-                    "backgroundColor": {"red": 0.27, "green": 0.45, "blue": 0.77},
-                    "textFormat": {"bold": True, "foregroundColor": {"red": 1, "green": 1, "blue": 1}},
-                    "horizontalAlignment": "CENTER"
-                })
+                print(f"Preparing {sheet_name} tab...")
 
-                # Write data rows
-                rows_data = self._build_rows(territory_results, year_start, max_career_cols)
-                if rows_data:
-                    end_row = len(rows_data) + 1
-                    time.sleep(0.5)
-                    territory_sheet.update(values=rows_data, range_name=f'A2:{self._col_letter(num_cols)}{end_row}')
-
-                # Freeze header row
-                # Note: Overlap highlighting is handled by conditional formatting rules in the sheet
-                territory_sheet.freeze(rows=1)
+                rows_data = [headers, *self._build_rows(territory_results, year_start, max_career_cols)]
+                tabs.append((sheet_name, rows_data, True, (len(territory_results) + 10, num_cols)))
                 print(f"  {sheet_name}: {len(territory_results)} coaches")
 
             # === Summary Tab ===
-            self._update_summary_tab(results, territories)
+            tabs.append(("Summary", self._build_summary_data(results, sorted_territories, timestamp), False, (50, 10)))
+
+            # Sheet structure, clearing and formatting go out in one
+            # batchUpdate, then every changed tab's values in values.batchUpdate
+            # calls, and the content hashes last, once all values are written
+            sheet_ids, content_hashes = existing_future.result()
+            requests, value_ranges, hash_requests = self._build_batch(
+                tabs, num_cols, sheet_ids, content_hashes, timestamp
+            )
+            total_rows = sum(len(value_range["values"]) for value_range in value_ranges)
+            print(f"Writing {total_rows} rows...")
+            if requests:
+                self._call(self.workbook.batch_update, {"requests": requests})
+            written = 0
+            for batch in self._batch_value_ranges(value_ranges):
+                self._call(self.workbook.values_batch_update, {
+                    "valueInputOption": "RAW",
+                    "includeValuesInResponse": False,
+                    "data": batch
+                })
+                written += sum(len(value_range["values"]) for value_range in batch)
+                print(f"  {written}/{total_rows} rows written")
+            if hash_requests:
+                self._call(self.workbook.batch_update, {"requests": hash_requests})
 
             print(f"\n[OK] Export complete!")
             print(f"    Sheet URL: https://docs.google.com/spreadsheets/d/{self.sheet_id}")
@@ -212,64 +277,68 @@ class GoogleSheetsExporter:
             traceback.print_exc()
             return False
 
+        finally:
+            metadata_pool.shutdown(wait=False)
+
     def _build_rows(
         self,
         results: List[Dict],
         year_start: int,
         max_career_cols: int
-    ) -> List[List]:
-        """Build row data from results"""
-        rows = []
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M")
-
-        for result in results:
-            career_history = result.get("career_history", [])
-            career_entries = get_career_entries_with_urls(career_history, year_start)
-
-            row = [
-                result.get("searched_school", result.get("current_school", "Unknown")),
-                result.get("state", "Unknown"),
-                result.get("county", "Unknown"),
-                result.get("territory", "Unknown"),
-                result.get("coach_name", "Unknown"),
-                result.get("current_position", "Unknown")
+    ) -> Iterator[List]:
+        """Build row data from results, one row at a time"""
+        padding = [""] * max_career_cols
+
+        def make_row(result: Dict) -> List:
+            get = result.get
+            career_history = get("career_history", _EMPTY)
+            career_entries = get("_career_entries")
+            if career_entries is None:
+                career_entries = get_career_entries_with_urls(career_history, year_start)
+
+            # Career columns, padded to max_career_cols
+            career_cells = [display_text for display_text, _ in career_entries[:max_career_cols]]
+            career_cells += padding[len(career_cells):]
+
+            return [
+                get("searched_school", get("current_school", "Unknown")),
+                get("state", "Unknown"),
+                get("county", "Unknown"),
+                get("territory", "Unknown"),
+                get("coach_name", "Unknown"),
+                get("current_position", "Unknown"),
+                *career_cells,
+                # Overlap info
+                "YES" if get("has_overlap") else "NO",
+                format_overlaps_summary(get("overlaps", _EMPTY)),
+                determine_data_quality(career_history, get("research_status", ""))
             ]
 
-            # Career columns
-            for i in range(max_career_cols):
-                if i < len(career_entries):
-                    display_text, _ = career_entries[i]
-                    row.append(display_text)
-                else:
-                    row.append("")
-
-            # Overlap info
-            row.append("YES" if result.get("has_overlap") else "NO")
-            row.append(format_overlaps_summary(result.get("overlaps", [])))
-            row.append(determine_data_quality(career_history, result.get("research_status", "")))
-            row.append(timestamp)
-
-            rows.append(row)
-
-        return rows
+        return map(make_row, results)
 
-    def _update_summary_tab(self, results: List[Dict], territories: Dict[str, List]):
-        """Update summary statistics tab"""
-        summary_sheet = self._get_or_create_sheet("Summary", rows=50, cols=10)
-        summary_sheet.clear()
-        time.sleep(1)  # Rate limit
-
-        # Overall stats
-        total_coaches = len(results)
-        coaches_with_overlap = sum(1 for r in results if r.get('has_overlap'))
-        total_overlaps = sum(r.get('overlap_count', 0) for r in results)
-        unique_schools = len(set(r.get('searched_school', '') for r in results))
+    def _build_summary_data(
+        self,
+        results: List[Dict],
+        sorted_territories: List[Tuple[str, List]],
+        timestamp: str
+    ) -> List[List]:
+        """Build summary statistics tab values from the territory groups in name order"""
+        # Overall stats, in one pass over the results
+        total_coaches = coaches_with_overlap = total_overlaps = 0
+        schools = set()
+        for r in results:
+            total_coaches += 1
+            if r.get('has_overlap'):
+                coaches_with_overlap += 1
+            total_overlaps += r.get('overlap_count', 0)
+            schools.add(r.get('searched_school', ''))
+        unique_schools = len(schools)
 
         # Build all data at once
         all_data = [
             ["GITG Coach Cross-Reference Summary"],
             [""],
-            ["Last Updated", datetime.now().strftime("%Y-%m-%d %H:%M")],
+            ["Last Updated", timestamp],
             ["", ""],
             ["Overall Statistics", ""],
             ["Total Schools Searched", unique_schools],
@@ -282,12 +351,173 @@ class GoogleSheetsExporter:
         ]
 
         # Add territory breakdown
-        for territory, territory_results in sorted(territories.items()):
+        for territory, territory_results in sorted_territories:
             overlaps = sum(1 for r in territory_results if r.get('has_overlap'))
             all_data.append([territory, len(territory_results), overlaps])
 
-        # Single batch update
-        summary_sheet.update(values=all_data, range_name='A1')
+        return all_data
+
+    def _fetch_existing_sheets(self) -> Tuple[Dict[str, int], Dict[str, Tuple[int, str]]]:
+        """
+        Look up the existing sheets with a single metadata request.
+
+        Returns:
+            Tuple of (sheet title -> sheet ID,
+                      sheet title -> (metadata ID, content hash) from the last export)
+        """
+        metadata = self._call(self.workbook.fetch_sheet_metadata)
+        sheet_ids = {}
+        content_hashes = {}
+        for sheet in metadata.get("sheets", []):
+            title = sheet["properties"]["title"]
+            sheet_ids[title] = sheet["properties"]["sheetId"]
+            for entry in sheet.get("developerMetadata", []):
+                if entry.get("metadataKey") == CONTENT_HASH_KEY:
+                    content_hashes[title] = (entry["metadataId"], entry.get("metadataValue", ""))
+        return sheet_ids, content_hashes
+
+    def _build_batch(
+        self,
+        tabs: List[Tuple],
+        num_cols: int,
+        sheet_ids: Dict[str, int],
+        content_hashes: Dict[str, Tuple[int, str]],
+        timestamp: str
+    ) -> Tuple[List[Dict], List[Dict], List[Dict]]:
+        """
+        Build the batchUpdate requests and value ranges for all tabs.
+
+        Missing sheets are added with a chosen sheetId so the formatting
+        requests in the same batch can refer to them; existing sheets have
+        their values cleared. Data tabs get the styled, frozen header row,
+        with the export time as a note on A1, and a hash of their values
+        in developer metadata. A data tab whose hash matches the last
+        export is left untouched, note included.
+
+        A rewritten tab's stored hash is blanked in the first batch and
+        only set once its values are written, so an export that fails
+        partway never leaves a hash that would skip a half-written tab.
+
+        Args:
+            tabs: (sheet name, values from A1, is data tab, (rows, cols) if created) per tab
+            num_cols: Number of columns in the data tabs
+            sheet_ids: Existing sheet titles -> sheet IDs, from _fetch_existing_sheets
+            content_hashes: Existing sheet titles -> (metadata ID, content hash)
+            timestamp: Export time for the data tab notes
+
+        Returns:
+            Tuple of (batchUpdate requests, values.batchUpdate value ranges,
+                      batchUpdate requests storing the content hashes, to
+                      send after the values)
+        """
+        sheet_ids = dict(sheet_ids)
+        next_sheet_id = max(sheet_ids.values(), default=0) + 1
+
+        requests = []
+        value_ranges = []
+        hash_requests = []
+        for sheet_name, values, is_data_tab, (rows, cols) in tabs:
+            sheet_id = sheet_ids.get(sheet_name)
+            previous_hash = content_hashes.get(sheet_name) if sheet_id is not None else None
+
+            if is_data_tab:
+                content_hash = hashlib.blake2b(repr(values).encode("utf-8"), digest_size=8).hexdigest()
+                if previous_hash is not None and previous_hash[1] == content_hash:
+                    print(f"  {sheet_name}: unchanged, skipped")
+                    continue
+
+            if sheet_id is None:
+                sheet_id = next_sheet_id
+                next_sheet_id += 1
+                sheet_ids[sheet_name] = sheet_id
+                requests.append({"addSheet": {"properties": {
+                    "sheetId": sheet_id,
+                    "title": sheet_name,
+                    "gridProperties": {"rowCount": rows, "columnCount": cols}
+                }}})
+            else:
+                # Clear existing values, like Worksheet.clear()
+                requests.append({"updateCells": {"range": {"sheetId": sheet_id}, "fields": "userEnteredValue"}})
+
+            if is_data_tab:
+                requests.append({"repeatCell": {
+                    "range": {
+                        "sheetId": sheet_id,
+                        "startRowIndex": 0, "endRowIndex": 1,
+                        "startColumnIndex": 0, "endColumnIndex": num_cols
+                    },
+                    "cell": {"userEnteredFormat": HEADER_FORMAT},
+                    "fields": "userEnteredFormat(%s)" % ",".join(HEADER_FORMAT.keys())
+                }})
+                # Freeze header row
+                # Note: Overlap highlighting is handled by conditional formatting rules in the sheet
+                requests.append({"updateSheetProperties": {
+                    "properties": {"sheetId": sheet_id, "gridProperties": {"frozenRowCount": 1}},
+                    "fields": "gridProperties/frozenRowCount"
+                }})
+                requests.append({"updateCells": {
+                    "range": {
+                        "sheetId": sheet_id,
+                        "startRowIndex": 0, "endRowIndex": 1,
+                        "startColumnIndex": 0, "endColumnIndex": 1
+                    },
+                    "rows": [{"values": [{"note": f"Last updated {timestamp}"}]}],
+                    "fields": "note"
+                }})
+                if previous_hash is None:
+                    hash_requests.append({"createDeveloperMetadata": {"developerMetadata": {
+                        "metadataKey": CONTENT_HASH_KEY,
+                        "metadataValue": content_hash,
+                        "location": {"sheetId": sheet_id},
+                        "visibility": "DOCUMENT"
+                    }}})
+                else:
+                    requests.append(self._content_hash_update(previous_hash[0], ""))
+                    hash_requests.append(self._content_hash_update(previous_hash[0], content_hash))
+
+            # Large tabs are split into row chunks of at most UPLOAD_CHUNK_ROWS
+            quoted_name = sheet_name.replace("'", "''")
+            for start in range(0, len(values), UPLOAD_CHUNK_ROWS):
+                value_ranges.append({
+                    "range": f"'{quoted_name}'!A{start + 1}",
+                    "values": values[start:start + UPLOAD_CHUNK_ROWS]
+                })
+
+        return requests, value_ranges, hash_requests
+
+    def _content_hash_update(self, metadata_id: int, content_hash: str) -> Dict:
+        """Build a request setting an existing content hash metadata entry's value"""
+        return {"updateDeveloperMetadata": {
+            "dataFilters": [{"developerMetadataLookup": {"metadataId": metadata_id}}],
+            "developerMetadata": {"metadataValue": content_hash},
+            "fields": "metadataValue"
+        }}
+
+    def _batch_value_ranges(self, value_ranges: List[Dict]) -> Iterator[List[Dict]]:
+        """
+        Group value ranges into values.batchUpdate requests.
+
+        Consecutive ranges are sent together until adding the next one
+        would exceed UPLOAD_CHUNK_ROWS rows.
+
+        Args:
+            value_ranges: Value ranges from _build_batch, each at most UPLOAD_CHUNK_ROWS rows
+
+        Yields:
+            List of value ranges for one request
+        """
+        batch = []
+        batch_rows = 0
+        for value_range in value_ranges:
+            rows = len(value_range["values"])
+            if batch and batch_rows + rows > UPLOAD_CHUNK_ROWS:
+                yield batch
+                batch = []
+                batch_rows = 0
+            batch.append(value_range)
+            batch_rows += rows
+        if batch:
+            yield batch
 
 
 def export_to_google_sheets(
@@ -332,11 +562,12 @@ def export_to_google_sheets(
     config = load_json_file(config_path) if os.path.exists(config_path) else {}
     year_start = config.get("year_range", {}).get("start", 2020)
 
-    # Calculate max career entries
-    max_career = 0
+    # Career entries are cached on each result for the row builder
     for result in results:
-        entries = get_career_entries_with_urls(result.get("career_history", []), year_start)
-        max_career = max(max_career, len(entries))
+        result["_career_entries"] = get_career_entries_with_urls(result.get("career_history", []), year_start)
+
+    # Calculate max career entries
+    max_career = max((len(result["_career_entries"]) for result in results), default=0)
     max_career = max(max_career, 5)  # Minimum 5 columns
 
     # Export to Google Sheets
@@ -6,8 +6,56 @@ Reads the CA and TX Coverage Map Excel file and generates territory_mapping.json
 
 import json
 import os
+import re
 import openpyxl
 from collections import defaultdict
+from typing import Dict, List, Sequence
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    from python_calamine import CalamineWorkbook
+    CALAMINE_AVAILABLE = True
+except ImportError:
+    CALAMINE_AVAILABLE = False
+
+
+# West Region rows that are regional groupings or notes rather than states
+_SKIP_RE = re.compile(r'^(?:AANHPI|Gulf|Moving|North Texas|Northern CA|Southern CA)')
+
+
+def load_sheet_rows(excel_path: str, sheet_names: List[str]) -> Dict[str, List[Sequence]]:
+    """
+    Read every row of the named sheets as sequences of cell values.
+
+    Uses python-calamine when installed, otherwise openpyxl in read-only
+    mode. Rows start at row 1 either way, so rows[n - 1] is Excel row n.
+    Empty cells may come back as None or "".
+
+    Args:
+        excel_path: Path to the Excel workbook
+        sheet_names: Names of the sheets to read
+
+    Returns:
+        Dict of sheet name -> list of rows
+    """
+    if CALAMINE_AVAILABLE:
+        with CalamineWorkbook.from_path(excel_path) as wb:
+            return {
+                name: wb.get_sheet_by_name(name).to_python(skip_empty_area=False)
+                for name in sheet_names
+            }
+
+    wb = openpyxl.load_workbook(excel_path, read_only=True, data_only=True)
+    try:
+        return {name: list(wb[name].iter_rows(values_only=True)) for name in sheet_names}
+    finally:
+        # Read-only workbooks keep the file open until closed
+        wb.close()
 
 
 def import_territories(excel_path: str, output_path: str):
@@ -18,7 +66,11 @@ def import_territories(excel_path: str, output_path: str):
     - State-level territory assignment (for most states)
     - County-level territory assignment (for CA and TX)
     """
-    wb = openpyxl.load_workbook(excel_path)
+    sheets = load_sheet_rows(excel_path, [
+        'West Region FY25',
+        'California Coverage by County',
+        'Texas Coverage by County'
+    ])
 
     territories = {
         "_source": excel_path,
@@ -32,13 +84,12 @@ def import_territories(excel_path: str, output_path: str):
     }
 
     # === Extract West Region state mappings ===
-    ws = wb['West Region FY25']
-    for row in ws.iter_rows(min_row=9, max_row=30, values_only=True):
+    for row in sheets['West Region FY25'][8:30]:
         state = row[1]
         territory = row[2]
         am = row[3]  # Account Manager
 
-        if state and territory and not state.startswith('AANHPI') and not state.startswith('Gulf') and not state.startswith('Moving') and not state.startswith('North Texas') and not state.startswith('Northern CA') and not state.startswith('Southern CA'):
+        if state and territory and not _SKIP_RE.match(state):
             # Clean up state name
             state_clean = state.strip()
             territory_clean = territory.strip()
@@ -57,8 +108,7 @@ def import_territories(excel_path: str, output_path: str):
                 territories["territory_details"][territory_clean]["account_managers"].add(am)
 
     # === Extract California county mappings ===
-    ws = wb['California Coverage by County']
-    for row in ws.iter_rows(min_row=5, values_only=True):
+    for row in sheets['California Coverage by County'][4:]:
         territory = row[2]  # Territory column
         county = row[3]     # County column
         am = row[4]         # Account Manager
@@ -81,8 +131,6 @@ def import_territories(excel_path: str, output_path: str):
 
     # === Extract Texas county mappings ===
     # Texas uses AM names as implicit territories
-    ws = wb['Texas Coverage by County']
-
     # First, map AMs to territory names
     texas_am_territory = {
         "Ryan Dixon": "North Texas",
@@ -92,7 +140,7 @@ def import_territories(excel_path: str, output_path: str):
         "Eric Bolton": "East Texas / Houston"
     }
 
-    for row in ws.iter_rows(min_row=8, values_only=True):
+    for row in sheets['Texas Coverage by County'][7:]:
         county = row[0]
         am = row[1]
 
@@ -126,8 +174,12 @@ def import_territories(excel_path: str, output_path: str):
         territories["state_territories"][state] = territory
 
     # Save to JSON
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(territories, f, indent=2, ensure_ascii=False)
+    if ORJSON_AVAILABLE:
+        data = orjson.dumps(territories, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(territories, indent=2, ensure_ascii=False).encode("utf-8")
+    with open(output_path, 'wb') as f:
+        f.write(data)
 
     print(f"Territory mapping saved to: {output_path}")
     print(f"\nSummary:")
@@ -3,12 +3,16 @@ logger.py - Shared logging utility for NMDP Coach Cross-Reference System
 
 Provides consistent logging across all Python scripts with both console
 and file output. Log files are written to output/logs/[school_name]_[date].log
+by a background listener thread, so log calls only enqueue the record.
 """
 
+import atexit
 import logging
 import os
+import queue
 import sys
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
 from typing import Optional
 
 
@@ -20,6 +24,65 @@ DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
 _logger: Optional[logging.Logger] = None
 _log_file_path: Optional[str] = None
 
+# Background thread writing queued records to the log file
+_listener: Optional[QueueListener] = None
+
+
+def _stop_listener():
+    """Stop the file listener, flushing any queued records."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+
+def _log_directly_in_child():
+    """
+    Write straight to the listener's handlers in a forked child.
+
+    The listener thread does not survive fork, so records queued by the
+    child would never be written.
+    """
+    global _listener
+    if _listener is None:
+        return
+    logger = logging.getLogger("gitgsearch")
+    for handler in list(logger.handlers):
+        if isinstance(handler, QueueHandler):
+            logger.removeHandler(handler)
+    for handler in _listener.handlers:
+        logger.addHandler(handler)
+    _listener = None
+
+
+def _pause_listener_for_fork():
+    """
+    Drain and join the listener thread before fork.
+
+    A child inherits any lock the listener thread holds mid-write (e.g. the
+    file stream's buffer lock) with no thread left to release it, so the
+    thread must not be running while the process forks.
+    """
+    if _listener is not None:
+        _listener.stop()
+
+
+def _resume_listener_after_fork():
+    """Restart the listener thread in the parent once fork has returned."""
+    if _listener is not None:
+        _listener.start()
+
+
+atexit.register(_stop_listener)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(
+        before=_pause_listener_for_fork,
+        after_in_parent=_resume_listener_after_fork,
+        after_in_child=_log_directly_in_child,
+    )
+
 
 def get_logs_dir() -> str:
     """Get the logs directory path, creating it if needed."""
@@ -72,13 +135,16 @@ def setup_logger(
     Returns:
         Configured logger instance
     """
-    global _logger, _log_file_path
+    global _logger, _log_file_path, _listener
 
     # Create logger
     logger = logging.getLogger("gitgsearch")
     logger.setLevel(logging.DEBUG)  # Capture all levels, handlers filter
 
-    # Clear any existing handlers
+    # Close and clear any existing handlers so their files are released now
+    _stop_listener()
+    for handler in logger.handlers:
+        handler.close()
     logger.handlers.clear()
 
     # Create formatter
@@ -99,7 +165,12 @@ def setup_logger(
     file_handler = logging.FileHandler(_log_file_path, mode=file_mode, encoding="utf-8")
     file_handler.setLevel(file_level)
     file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
+
+    # File writes happen on the listener thread
+    log_queue = queue.SimpleQueue()
+    logger.addHandler(QueueHandler(log_queue))
+    _listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+    _listener.start()
 
     _logger = logger
     return logger
@@ -144,28 +215,28 @@ def log_summary(stats: dict):
     logger = get_logger()
     logger.info("Summary:")
     for key, value in stats.items():
-        logger.info(f"  {key}: {value}")
+        logger.info("  %s: %s", key, value)
 
 
 # Convenience functions for quick logging without setup
-def info(message: str):
-    """Log an INFO message."""
-    get_logger().info(message)
+def info(message: str, *args):
+    """Log an INFO message; ``args`` are %-formatted lazily by ``logging``."""
+    get_logger().info(message, *args)
 
 
-def warning(message: str):
-    """Log a WARNING message."""
-    get_logger().warning(message)
+def warning(message: str, *args):
+    """Log a WARNING message; ``args`` are %-formatted lazily by ``logging``."""
+    get_logger().warning(message, *args)
 
 
-def error(message: str):
-    """Log an ERROR message."""
-    get_logger().error(message)
+def error(message: str, *args):
+    """Log an ERROR message; ``args`` are %-formatted lazily by ``logging``."""
+    get_logger().error(message, *args)
 
 
-def debug(message: str):
-    """Log a DEBUG message."""
-    get_logger().debug(message)
+def debug(message: str, *args):
+    """Log a DEBUG message; ``args`` are %-formatted lazily by ``logging``."""
+    get_logger().debug(message, *args)
 
 
 if __name__ == "__main__":
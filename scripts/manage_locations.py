@@ -4,26 +4,124 @@ manage_locations.py - Utility for managing school location data
 Helps add, update, and verify school location mappings.
 """
 
+import csv
 import json
 import os
+import re
 import sys
+from functools import lru_cache
+from heapq import nsmallest
+from typing import Callable, Optional
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+
+def _parse_json_file(path: str) -> dict:
+    """Read and parse a JSON file, with orjson when available."""
+    with open(path, 'rb') as f:
+        raw = f.read()
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
 
 
 def load_json(path: str) -> dict:
     """Load JSON file."""
     if os.path.exists(path):
-        with open(path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return _parse_json_file(path)
     return {}
 
 
+@lru_cache(maxsize=256)
+def _load_json_cached(path: str, mtime_ns: int, size: int) -> dict:
+    """Load a JSON file; the stat fields key the cache so edits are picked up."""
+    return _parse_json_file(path)
+
+
+def load_json_cached(path: str) -> dict:
+    """
+    Load a JSON file, reusing the parsed data while the file is unchanged.
+
+    The same object is returned to every caller, so treat it as read-only;
+    use load_json for data that will be modified and saved.
+    """
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return {}
+    return _load_json_cached(path, stat.st_mtime_ns, stat.st_size)
+
+
 def save_json(path: str, data: dict):
     """Save JSON file with pretty formatting."""
-    with open(path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    if ORJSON_AVAILABLE:
+        raw = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    else:
+        raw = json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+    with open(path, 'wb') as f:
+        f.write(raw)
     print(f"Saved: {path}")
 
 
+def build_alias_matcher(aliases: dict, locations: dict) -> Callable[[str], bool]:
+    """
+    Build a check for whether a school name overlaps an alias of a located school.
+
+    A name matches when any alias of a canonical school that has location
+    data is a substring of the name, or the name is a substring of such an
+    alias. All aliases are searched in one pass: with an Aho-Corasick
+    automaton if pyahocorasick is installed, otherwise with a compiled
+    regex alternation.
+
+    Args:
+        aliases: Alias dictionary (canonical -> [aliases])
+        locations: Location dictionary keyed by canonical name
+
+    Returns:
+        Function taking an uppercase school name and returning True on a match
+    """
+    located_aliases = [
+        alias.upper()
+        for canonical, alias_list in aliases.items()
+        if not canonical.startswith("_") and canonical in locations
+        for alias in alias_list
+    ]
+    if not located_aliases:
+        return lambda upper_name: False
+    if "" in located_aliases:
+        # An empty alias is a substring of every name
+        return lambda upper_name: True
+
+    # Names never contain NUL, so a name found in the joined text lies within one alias
+    joined_aliases = "\0".join(located_aliases)
+
+    if AHOCORASICK_AVAILABLE:
+        automaton = ahocorasick.Automaton()
+        for alias in located_aliases:
+            automaton.add_word(alias, alias)
+        automaton.make_automaton()
+
+        def alias_in_name(upper_name: str) -> bool:
+            return next(automaton.iter(upper_name), None) is not None
+    else:
+        alias_in_name = re.compile("|".join(map(re.escape, located_aliases))).search
+
+    def matches(upper_name: str) -> bool:
+        return bool(alias_in_name(upper_name)) or upper_name in joined_aliases
+
+    return matches
+
+
 def add_school_location(locations_path: str, school_name: str, state: str, county: str):
     """
     Add or update a school's location.
@@ -46,7 +144,8 @@ def add_school_location(locations_path: str, school_name: str, state: str, count
     print(f"Added: {school_key} -> {state}, {county}")
 
 
-def list_missing_locations(cache_dir: str, locations_path: str, aliases_path: str):
+def list_missing_locations(cache_dir: str, locations_path: str, aliases_path: str,
+                           limit: Optional[int] = None):
     """
     List schools in cache that don't have location data.
 
@@ -54,61 +153,64 @@ def list_missing_locations(cache_dir: str, locations_path: str, aliases_path: st
         cache_dir: Path to cache directory
         locations_path: Path to school_locations.json
         aliases_path: Path to school_aliases.json
-    """
-    locations = load_json(locations_path)
-    aliases = load_json(aliases_path)
+        limit: Print only the first N schools alphabetically (all if None)
 
-    # Get all location keys (including aliases)
-    known_schools = set(locations.keys())
-    for canonical, alias_list in aliases.items():
-        if canonical in locations:
-            for alias in alias_list:
-                known_schools.add(alias.upper())
+    Returns:
+        List of every school missing location data
+    """
+    locations = load_json_cached(locations_path)
+    aliases = load_json_cached(aliases_path)
+
+    # Get all location keys (including aliases); exact hits are a single
+    # hash lookup, so the substring matcher only sees the remaining names
+    known_schools = set(locations).union(
+        alias.upper()
+        for canonical, alias_list in aliases.items()
+        if canonical in locations
+        for alias in alias_list
+    )
 
     # Check cached schools
+    alias_matches = build_alias_matcher(aliases, locations)
     missing = []
-    if os.path.exists(cache_dir):
-        for school_dir in os.listdir(cache_dir):
-            school_path = os.path.join(cache_dir, school_dir)
-            if os.path.isdir(school_path):
-                # Try to get actual school name from roster
-                roster_path = os.path.join(school_path, "roster.json")
-                if os.path.exists(roster_path):
-                    roster = load_json(roster_path)
-                    if roster and isinstance(roster, dict):
-                        # Roster is a dict with "school" key
-                        school_name = roster.get("school", roster.get("school_name", school_dir.replace("_", " ").title()))
-                    elif roster and isinstance(roster, list) and len(roster) > 0:
-                        # Roster is a list of coaches
-                        school_name = roster[0].get("current_school", school_dir.replace("_", " ").title())
-                    else:
-                        school_name = school_dir.replace("_", " ").title()
-                else:
-                    school_name = school_dir.replace("_", " ").title()
-
-                # Check if we have location data
-                upper_name = school_name.upper()
-                if upper_name not in known_schools:
-                    # Also check if it matches any alias
-                    found = False
-                    for canonical, alias_list in aliases.items():
-                        if canonical.startswith("_"):
-                            continue
-                        for alias in alias_list:
-                            if alias.upper() in upper_name or upper_name in alias.upper():
-                                if canonical in locations:
-                                    found = True
-                                    break
-                        if found:
-                            break
-
-                    if not found:
-                        missing.append(school_name)
+    try:
+        entries = list(os.scandir(cache_dir))
+    except FileNotFoundError:
+        entries = []
+    for entry in entries:
+        if not entry.is_dir():
+            continue
+        school_dir = entry.name
+        default_name = school_dir.replace("_", " ").title()
+
+        # Try to get actual school name from roster (a missing roster loads as {})
+        roster = load_json_cached(os.path.join(entry.path, "roster.json"))
+        if roster and isinstance(roster, dict):
+            # Roster is a dict with "school" key
+            school_name = roster.get("school", roster.get("school_name", default_name))
+        elif roster and isinstance(roster, list) and len(roster) > 0:
+            # Roster is a list of coaches
+            school_name = roster[0].get("current_school", default_name)
+        else:
+            school_name = default_name
+
+        # Check if we have location data, directly or through an alias
+        upper_name = school_name.upper()
+        if upper_name not in known_schools and not alias_matches(upper_name):
+            missing.append(school_name)
 
     if missing:
         print(f"Schools missing location data ({len(missing)}):")
-        for school in sorted(missing):
+        if limit is not None and limit < len(missing):
+            # Partial selection instead of sorting the whole list
+            shown = nsmallest(limit, missing)
+        else:
+            missing.sort()
+            shown = missing
+        for school in shown:
             print(f"  - {school}")
+        if len(shown) < len(missing):
+            print(f"  ... and {len(missing) - len(shown)} more")
     else:
         print("All cached schools have location data!")
 
@@ -122,6 +224,9 @@ def bulk_add_from_file(locations_path: str, input_file: str):
     Expected format (one per line):
     SCHOOL NAME,State,County
 
+    Fields follow CSV quoting rules, so a school name containing a comma
+    can be written as "NAME, WITH COMMA".
+
     Args:
         locations_path: Path to school_locations.json
         input_file: Path to input file
@@ -136,13 +241,15 @@ def bulk_add_from_file(locations_path: str, input_file: str):
 
             # Try comma first, then tab
             if "," in line:
-                parts = line.split(",")
+                delimiter = ","
             elif "\t" in line:
-                parts = line.split("\t")
+                delimiter = "\t"
             else:
                 print(f"Skipping invalid line: {line}")
                 continue
 
+            parts = next(csv.reader((line,), delimiter=delimiter))
+
             if len(parts) >= 3:
                 school = parts[0].strip().upper()
                 state = parts[1].strip()
@@ -168,7 +275,7 @@ def main():
 
     if len(sys.argv) < 2:
         print("Usage:")
-        print("  python manage_locations.py missing")
+        print("  python manage_locations.py missing [--limit N]")
         print("    - List schools missing location data")
         print()
         print("  python manage_locations.py add <school> <state> <county>")
@@ -181,7 +288,15 @@ def main():
     command = sys.argv[1].lower()
 
     if command == "missing":
-        list_missing_locations(cache_dir, locations_path, aliases_path)
+        limit = None
+        if "--limit" in sys.argv:
+            idx = sys.argv.index("--limit")
+            try:
+                limit = int(sys.argv[idx + 1])
+            except (IndexError, ValueError):
+                print("Usage: python manage_locations.py missing [--limit N]")
+                sys.exit(1)
+        list_missing_locations(cache_dir, locations_path, aliases_path, limit)
 
     elif command == "add":
         if len(sys.argv) < 5:
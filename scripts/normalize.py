@@ -8,14 +8,36 @@ Uses alias lookup, direct matching, and optional fuzzy matching.
 import json
 import re
 import sys
-from typing import Optional, Dict, List, Set, Tuple
+from typing import Iterable, Optional, Dict, List, Set, Tuple
 from difflib import SequenceMatcher
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    from rapidfuzz import fuzz, process
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
+
+# process.cdist returns a numpy matrix, so batch matching also needs numpy
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
 
 def load_json_file(filepath: str) -> Dict:
     """Load a JSON file and return its contents."""
-    with open(filepath, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    with open(filepath, 'rb') as f:
+        raw = f.read()
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
 
 
 def clean_school_name(name: str) -> str:
@@ -26,10 +48,9 @@ def clean_school_name(name: str) -> str:
     - Remove extra whitespace
     - Remove common prefixes/suffixes that vary
     """
-    name = name.upper().strip()
-    # Remove multiple spaces
-    name = re.sub(r'\s+', ' ', name)
-    return name
+    # Trim and collapse runs of whitespace; split() uses the same
+    # whitespace definition as the \s regex class
+    return " ".join(name.upper().split())
 
 
 def build_reverse_alias_map(aliases: Dict[str, List[str]]) -> Dict[str, str]:
@@ -52,26 +73,55 @@ def build_reverse_alias_map(aliases: Dict[str, List[str]]) -> Dict[str, str]:
     return reverse_map
 
 
-def fuzzy_match(name: str, candidates: Set[str], threshold: float = 0.85) -> Optional[Tuple[str, float]]:
+def fuzzy_match(name: str, candidates: Iterable[str], threshold: float = 0.85) -> Optional[Tuple[str, float]]:
     """
     Find the best fuzzy match for a name among candidates.
 
+    Uses RapidFuzz's C++ scorer when installed, otherwise difflib. Both
+    compare uppercased names; RapidFuzz scores by longest common
+    subsequence, so it can rate a pair slightly higher than difflib.
+
     Args:
         name: The name to match
-        candidates: Set of possible matches
+        candidates: Possible matches (pass a list to avoid a copy per call)
         threshold: Minimum similarity ratio (0-1)
 
     Returns:
         Tuple of (best_match, score) if found above threshold, else None
     """
+    name_upper = name.upper()
+
+    if RAPIDFUZZ_AVAILABLE:
+        result = process.extractOne(
+            name_upper, candidates, scorer=fuzz.ratio,
+            processor=str.upper, score_cutoff=threshold * 100
+        )
+        if result is not None:
+            return (result[0], result[1] / 100)
+        return None
+
     best_match = None
     best_score = 0
-
-    name_upper = name.upper()
+    name_len = len(name_upper)
+    matcher = SequenceMatcher(None, name_upper)
 
     for candidate in candidates:
+        candidate_upper = candidate.upper()
+
+        # ratio() is 2*matches/total, so it can never exceed
+        # 2*shorter/total; skip candidates whose length rules them out
+        total = name_len + len(candidate_upper)
+        if total and 2.0 * min(name_len, len(candidate_upper)) / total < threshold:
+            continue
+
+        # quick_ratio() bounds ratio() from above using only character
+        # counts, so it cheaply discards candidates before the full match
+        matcher.set_seq2(candidate_upper)
+        if matcher.quick_ratio() < threshold:
+            continue
+
         # Calculate similarity ratio
-        score = SequenceMatcher(None, name_upper, candidate.upper()).ratio()
+        score = matcher.ratio()
 
         if score > best_score and score >= threshold:
             best_score = score
@@ -82,6 +132,37 @@ def fuzzy_match(name: str, candidates: Set[str], threshold: float = 0.85) -> Opt
     return None
 
 
+NFL_KEYWORDS = [
+    "49ERS", "BEARS", "BENGALS", "BILLS", "BRONCOS", "BROWNS",
+    "BUCCANEERS", "CARDINALS", "CHARGERS", "CHIEFS", "COLTS",
+    "COMMANDERS", "COWBOYS", "DOLPHINS", "EAGLES", "FALCONS",
+    "GIANTS", "JAGUARS", "JETS", "LIONS", "PACKERS", "PANTHERS",
+    "PATRIOTS", "RAIDERS", "RAMS", "RAVENS", "SAINTS", "SEAHAWKS",
+    "STEELERS", "TEXANS", "TITANS", "VIKINGS",
+    "NFL", "NATIONAL FOOTBALL LEAGUE"
+]
+
+NFL_CITIES = [
+    "ARIZONA", "ATLANTA", "BALTIMORE", "BUFFALO", "CAROLINA",
+    "CHICAGO", "CINCINNATI", "CLEVELAND", "DALLAS", "DENVER",
+    "DETROIT", "GREEN BAY", "HOUSTON", "INDIANAPOLIS", "JACKSONVILLE",
+    "KANSAS CITY", "LAS VEGAS", "LOS ANGELES", "MIAMI", "MINNESOTA",
+    "NEW ENGLAND", "NEW ORLEANS", "NEW YORK", "PHILADELPHIA",
+    "PITTSBURGH", "SAN FRANCISCO", "SEATTLE", "TAMPA BAY",
+    "TENNESSEE", "WASHINGTON"
+]
+
+# Keywords match anywhere in the name (plain substrings, no word boundaries)
+_NFL_KEYWORD_PATTERN = "|".join(map(re.escape, NFL_KEYWORDS))
+_NFL_KEYWORD_RE = re.compile(_NFL_KEYWORD_PATTERN)
+_COLLEGE_RE = re.compile("UNIVERSITY|COLLEGE")
+# An NFL city at the start with a team keyword somewhere after it
+_NFL_CITY_TEAM_RE = re.compile(
+    "(?:%s).*?(?:%s)" % ("|".join(map(re.escape, NFL_CITIES)), _NFL_KEYWORD_PATTERN),
+    re.DOTALL
+)
+
+
 class SchoolNormalizer:
     """
     Normalizes school names to canonical NMDP database format.
@@ -98,15 +179,33 @@ class SchoolNormalizer:
         self.nmdp_db = load_json_file(nmdp_db_path)
         self.aliases = load_json_file(aliases_path)
 
-        # Build set of canonical NMDP school names (uppercase)
-        self.nmdp_schools = set(k.upper() for k in self.nmdp_db.keys())
+        # Build set of canonical NMDP school names (uppercase). Names are
+        # interned so the canonical strings handed out are shared objects,
+        # which later dict lookups can match by identity.
+        self.nmdp_schools = set(sys.intern(k.upper()) for k in self.nmdp_db.keys())
+        # Fixed candidate order for fuzzy matching, built once
+        self._nmdp_list = list(self.nmdp_schools)
 
         # Build reverse alias map
-        self.reverse_aliases = build_reverse_alias_map(self.aliases)
+        self.reverse_aliases = {
+            alias: sys.intern(canonical)
+            for alias, canonical in build_reverse_alias_map(self.aliases).items()
+        }
+
+        # Exact and alias matches merged into one table so a cleaned name
+        # resolves with a single probe (exact entries take precedence)
+        self._direct_matches: Dict[str, Tuple[str, str]] = {
+            alias: (canonical, "alias") for alias, canonical in self.reverse_aliases.items()
+        }
+        self._direct_matches.update((school, (school, "exact")) for school in self.nmdp_schools)
 
         # Track fuzzy matches for logging/review
         self.fuzzy_match_log = []
 
+        # Memoized results for repeated school names across coach files
+        self._normalize_cache: Dict[str, Tuple[str, str]] = {}
+        self._nfl_cache: Dict[str, bool] = {}
+
     def normalize(self, name: str, use_fuzzy: bool = False, fuzzy_threshold: float = 0.85) -> Tuple[str, str]:
         """
         Normalize a school name to canonical NMDP format.
@@ -120,20 +219,48 @@ class SchoolNormalizer:
             Tuple of (normalized_name, match_type)
             match_type is one of: "exact", "alias", "fuzzy", "none"
         """
-        cleaned = clean_school_name(name)
+        # Non-fuzzy lookups are pure, so cache them by raw name. Fuzzy lookups
+        # aren't cached since each one is recorded in fuzzy_match_log.
+        if not use_fuzzy:
+            result = self._normalize_cache.get(name)
+            if result is None:
+                result = self._normalize_uncached(name, False, fuzzy_threshold)
+                self._normalize_cache[name] = result
+            return result
+
+        return self._normalize_uncached(name, use_fuzzy, fuzzy_threshold)
+
+    def normalize_cleaned(self, cleaned: str, use_fuzzy: bool = False, fuzzy_threshold: float = 0.85) -> Tuple[str, str]:
+        """
+        Normalize a name that has already been through clean_school_name.
+
+        Skips re-cleaning for callers that clean names themselves; results
+        are not memoized.
+
+        Args:
+            cleaned: Uppercase, whitespace-collapsed school name
+            use_fuzzy: Whether to attempt fuzzy matching as fallback
+            fuzzy_threshold: Minimum similarity for fuzzy match
+
+        Returns:
+            Tuple of (normalized_name, match_type)
+        """
+        return self._match_cleaned(cleaned, cleaned, use_fuzzy, fuzzy_threshold)
 
-        # 1. Direct match to NMDP database
-        if cleaned in self.nmdp_schools:
-            return (cleaned, "exact")
+    def _normalize_uncached(self, name: str, use_fuzzy: bool, fuzzy_threshold: float) -> Tuple[str, str]:
+        """Run the full normalization pipeline for a single name."""
+        return self._match_cleaned(clean_school_name(name), name, use_fuzzy, fuzzy_threshold)
 
-        # 2. Check reverse alias map
-        if cleaned in self.reverse_aliases:
-            canonical = self.reverse_aliases[cleaned]
-            return (canonical, "alias")
+    def _match_cleaned(self, cleaned: str, name: str, use_fuzzy: bool, fuzzy_threshold: float) -> Tuple[str, str]:
+        """Match a cleaned name; name is the original, for the fuzzy match log."""
+        # 1-2. Direct match to NMDP database, then reverse alias map
+        direct = self._direct_matches.get(cleaned)
+        if direct is not None:
+            return direct
 
         # 3. Try fuzzy matching if enabled
         if use_fuzzy:
-            result = fuzzy_match(cleaned, self.nmdp_schools, fuzzy_threshold)
+            result = fuzzy_match(cleaned, self._nmdp_list, fuzzy_threshold)
             if result:
                 match, score = result
                 self.fuzzy_match_log.append({
@@ -157,16 +284,69 @@ class SchoolNormalizer:
         Returns:
             List of dicts with original, normalized, and match_type
         """
-        results = []
-        for name in names:
-            normalized, match_type = self.normalize(name, use_fuzzy)
-            results.append({
+        # Exact and alias matches come from cached dict lookups; only the
+        # names still unmatched go through fuzzy matching
+        matches = [self.normalize(name) for name in names]
+        if use_fuzzy:
+            residual = [i for i, (_, match_type) in enumerate(matches) if match_type == "none"]
+            if residual:
+                self._fuzzy_match_residual(names, matches, residual)
+
+        return [
+            {
                 "original": name,
                 "normalized": normalized,
                 "match_type": match_type,
                 "in_nmdp_db": normalized in self.nmdp_schools
-            })
-        return results
+            }
+            for name, (normalized, match_type) in zip(names, matches)
+        ]
+
+    def _fuzzy_match_residual(
+        self,
+        names: List[str],
+        matches: List[Tuple[str, str]],
+        residual: List[int],
+        fuzzy_threshold: float = 0.85
+    ):
+        """
+        Fuzzy match the names at the residual positions, updating matches in place.
+
+        With rapidfuzz and numpy every residual name is scored in one cdist
+        call; otherwise each distinct cleaned name goes through fuzzy_match
+        once. Either way the results and fuzzy_match_log entries are the
+        same as calling normalize(name, use_fuzzy=True) per name.
+        """
+        queries = [matches[i][0] for i in residual]
+
+        if RAPIDFUZZ_AVAILABLE and NUMPY_AVAILABLE:
+            scores = process.cdist(
+                queries, self._nmdp_list,
+                scorer=fuzz.ratio, score_cutoff=fuzzy_threshold * 100,
+                dtype=np.float64, workers=-1
+            )
+            # argmax keeps the first of equal scores, like extractOne; scores
+            # under the cutoff come back as 0
+            best = [
+                (self._nmdp_list[j], float(row[j]) / 100) if row[j] else None
+                for j, row in zip(scores.argmax(axis=1), scores)
+            ]
+        else:
+            found = {}
+            for query in queries:
+                if query not in found:
+                    found[query] = fuzzy_match(query, self._nmdp_list, fuzzy_threshold)
+            best = [found[query] for query in queries]
+
+        for i, result in zip(residual, best):
+            if result:
+                match, score = result
+                self.fuzzy_match_log.append({
+                    "original": names[i],
+                    "matched_to": match,
+                    "score": score
+                })
+                matches[i] = (match, "fuzzy")
 
     def get_fuzzy_match_log(self) -> List[Dict]:
         """Return log of fuzzy matches for review."""
@@ -183,47 +363,61 @@ class SchoolNormalizer:
         NFL teams won't be in the NMDP database, so this helps
         distinguish "no match because NFL" from "no match because unknown college".
         """
-        nfl_keywords = [
-            "49ERS", "BEARS", "BENGALS", "BILLS", "BRONCOS", "BROWNS",
-            "BUCCANEERS", "CARDINALS", "CHARGERS", "CHIEFS", "COLTS",
-            "COMMANDERS", "COWBOYS", "DOLPHINS", "EAGLES", "FALCONS",
-            "GIANTS", "JAGUARS", "JETS", "LIONS", "PACKERS", "PANTHERS",
-            "PATRIOTS", "RAIDERS", "RAMS", "RAVENS", "SAINTS", "SEAHAWKS",
-            "STEELERS", "TEXANS", "TITANS", "VIKINGS",
-            "NFL", "NATIONAL FOOTBALL LEAGUE"
-        ]
-
-        nfl_cities = [
-            "ARIZONA", "ATLANTA", "BALTIMORE", "BUFFALO", "CAROLINA",
-            "CHICAGO", "CINCINNATI", "CLEVELAND", "DALLAS", "DENVER",
-            "DETROIT", "GREEN BAY", "HOUSTON", "INDIANAPOLIS", "JACKSONVILLE",
-            "KANSAS CITY", "LAS VEGAS", "LOS ANGELES", "MIAMI", "MINNESOTA",
-            "NEW ENGLAND", "NEW ORLEANS", "NEW YORK", "PHILADELPHIA",
-            "PITTSBURGH", "SAN FRANCISCO", "SEATTLE", "TAMPA BAY",
-            "TENNESSEE", "WASHINGTON"
-        ]
-
+        result = self._nfl_cache.get(name)
+        if result is None:
+            result = self._is_nfl_team_uncached(name)
+            self._nfl_cache[name] = result
+        return result
+
+    def _is_nfl_team_uncached(self, name: str) -> bool:
+        """Keyword/city scan behind is_nfl_team."""
         name_upper = name.upper()
 
         # Check for NFL team names
-        for keyword in nfl_keywords:
-            if keyword in name_upper:
-                # Make sure it's not a college with similar name
-                if "UNIVERSITY" not in name_upper and "COLLEGE" not in name_upper:
-                    return True
+        if not _NFL_KEYWORD_RE.search(name_upper):
+            return False
+
+        # Make sure it's not a college with similar name
+        if not _COLLEGE_RE.search(name_upper):
+            return True
 
         # Check for NFL city + common suffix patterns
-        for city in nfl_cities:
-            if name_upper.startswith(city):
-                remainder = name_upper[len(city):].strip()
-                for keyword in nfl_keywords:
-                    if keyword in remainder:
-                        return True
+        return _NFL_CITY_TEAM_RE.match(name_upper) is not None
+
 
-        return False
+# Reverse alias maps built by normalize_school_name, keyed by id() of the
+# aliases dict. The dict itself is kept alongside so its id can't be reused.
+_reverse_alias_cache: Dict[int, Tuple[Dict, Dict[str, str]]] = {}
+
+
+def get_reverse_alias_map(aliases: Dict[str, List[str]]) -> Dict[str, str]:
+    """
+    Return the reverse alias map for an aliases dict, building it on first use.
 
+    The map is cached per dict object, so mutate a copy rather than an
+    aliases dict that has already been looked up.
 
-def normalize_school_name(name: str, aliases: Dict, nmdp_schools: Set) -> str:
+    Args:
+        aliases: Dict with canonical names as keys, lists of aliases as values
+
+    Returns:
+        Dict mapping each alias (uppercase) to its canonical name
+    """
+    cached = _reverse_alias_cache.get(id(aliases))
+    if cached is None or cached[0] is not aliases:
+        if len(_reverse_alias_cache) >= 4:
+            _reverse_alias_cache.clear()
+        cached = (aliases, build_reverse_alias_map(aliases))
+        _reverse_alias_cache[id(aliases)] = cached
+    return cached[1]
+
+
+def normalize_school_name(
+    name: str,
+    aliases: Dict,
+    nmdp_schools: Set,
+    reverse_aliases: Optional[Dict[str, str]] = None
+) -> str:
     """
     Standalone function to normalize a single school name.
 
@@ -233,6 +427,7 @@ def normalize_school_name(name: str, aliases: Dict, nmdp_schools: Set) -> str:
         name: School name to normalize
         aliases: Alias dictionary (canonical -> [aliases])
         nmdp_schools: Set of canonical NMDP school names
+        reverse_aliases: Prebuilt reverse alias map (looked up from aliases if omitted)
 
     Returns:
         Normalized school name (uppercase)
@@ -243,8 +438,9 @@ def normalize_school_name(name: str, aliases: Dict, nmdp_schools: Set) -> str:
     if cleaned in nmdp_schools:
         return cleaned
 
-    # Build reverse alias map and check
-    reverse_aliases = build_reverse_alias_map(aliases)
+    # Check the reverse alias map, built once per aliases dict
+    if reverse_aliases is None:
+        reverse_aliases = get_reverse_alias_map(aliases)
     if cleaned in reverse_aliases:
         return reverse_aliases[cleaned]
 
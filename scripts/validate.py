@@ -5,16 +5,35 @@ Validates coach career data against required schema before cross-referencing.
 Returns validation status and list of errors/warnings.
 """
 
+import glob
+import os
 import re
 import json
 import sys
-from typing import Tuple, List, Dict, Any
+from concurrent.futures import ProcessPoolExecutor
+from typing import Tuple, List, Dict, Any, Optional
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Import ijson (optional - streams roster coaches when available)
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
 
 # Valid research status values
-VALID_STATUSES = ["FOUND", "PARTIAL", "NOT_FOUND", "AMBIGUOUS"]
+# (frozensets for lookups, the ordered tuples for error messages)
+VALID_STATUSES_DISPLAY = ("FOUND", "PARTIAL", "NOT_FOUND", "AMBIGUOUS")
+VALID_STATUSES = frozenset(VALID_STATUSES_DISPLAY)
 
 # Valid source types for roster entries
-VALID_SOURCE_TYPES = ["official_roster", "news_report", "departure_reported"]
+VALID_SOURCE_TYPES_DISPLAY = ("official_roster", "news_report", "departure_reported")
+VALID_SOURCE_TYPES = frozenset(VALID_SOURCE_TYPES_DISPLAY)
 
 # Required fields for coach data
 REQUIRED_FIELDS = ["name", "current_position", "current_school", "career_history", "research_status"]
@@ -22,13 +41,20 @@ REQUIRED_FIELDS = ["name", "current_position", "current_school", "career_history
 # Required fields for each career entry
 CAREER_ENTRY_FIELDS = ["school", "position", "years"]
 
+# Cache layout: cache/<school>/roster.json and cache/<school>/coaches/*.json,
+# where coaches/all_coaches.json may hold every coach as one JSON array
+ROSTER_FILENAME = "roster.json"
+COACHES_DIRNAME = "coaches"
+COMBINED_COACHES_FILENAME = "all_coaches.json"
+
 # Year format pattern: YYYY-YYYY or YYYY-present
 YEAR_PATTERN = r"^\d{4}-(present|\d{4})$"
+_YEAR_RE = re.compile(YEAR_PATTERN, re.IGNORECASE)
 
 
 def validate_year_format(years: str) -> bool:
     """Check if year string matches expected format."""
-    return bool(re.match(YEAR_PATTERN, years, re.IGNORECASE))
+    return _YEAR_RE.match(years) is not None
 
 
 def validate_career_entry(entry: Dict[str, Any], index: int) -> List[str]:
@@ -53,12 +79,15 @@ def validate_career_entry(entry: Dict[str, Any], index: int) -> List[str]:
     return errors, warnings
 
 
-def validate_coach_data(data: Dict[str, Any]) -> Tuple[bool, List[str], List[str]]:
+def validate_coach_data(data: Dict[str, Any], fast_fail: bool = False) -> Tuple[bool, List[str], List[str]]:
     """
     Validate coach data against required schema.
 
     Args:
         data: Coach data dictionary
+        fast_fail: Return as soon as a check (the required-field pass,
+            research_status, or one career entry) reports errors, instead
+            of collecting every error; for batch runs that only need is_valid
 
     Returns:
         Tuple of (is_valid, errors, warnings)
@@ -76,16 +105,24 @@ def validate_coach_data(data: Dict[str, Any]) -> Tuple[bool, List[str], List[str
         elif data[field] is None or (isinstance(data[field], str) and not data[field].strip()):
             if field != "career_history":  # career_history can be empty list
                 errors.append(f"Required field '{field}' is empty")
+    if fast_fail and errors:
+        return False, errors, warnings
 
     # Validate research_status
     if "research_status" in data and data["research_status"]:
-        if data["research_status"] not in VALID_STATUSES:
-            errors.append(f"Invalid research_status: '{data['research_status']}' (valid: {VALID_STATUSES})")
+        # Non-string values (possibly unhashable) are never valid
+        status = data["research_status"]
+        if not isinstance(status, str) or status not in VALID_STATUSES:
+            errors.append(f"Invalid research_status: '{status}' (valid: {list(VALID_STATUSES_DISPLAY)})")
+            if fast_fail:
+                return False, errors, warnings
 
     # Validate career_history
     if "career_history" in data:
         if not isinstance(data["career_history"], list):
             errors.append("career_history must be a list")
+            if fast_fail:
+                return False, errors, warnings
         else:
             for i, entry in enumerate(data["career_history"]):
                 if not isinstance(entry, dict):
@@ -94,6 +131,8 @@ def validate_coach_data(data: Dict[str, Any]) -> Tuple[bool, List[str], List[str
                     entry_errors, entry_warnings = validate_career_entry(entry, i)
                     errors.extend(entry_errors)
                     warnings.extend(entry_warnings)
+                if fast_fail and errors:
+                    return False, errors, warnings
 
     # Check for empty career history with FOUND status
     if data.get("research_status") == "FOUND" and not data.get("career_history"):
@@ -116,6 +155,23 @@ def validate_roster_data(data: Dict[str, Any]) -> Tuple[bool, List[str], List[st
     errors = []
     warnings = []
 
+    _validate_roster_fields(data, errors, warnings)
+
+    if "coaches" in data:
+        if not isinstance(data["coaches"], list):
+            errors.append("coaches must be a list")
+        elif len(data["coaches"]) == 0:
+            warnings.append("coaches list is empty")
+        else:
+            for i, coach in enumerate(data["coaches"]):
+                _validate_roster_coach(coach, i, errors, warnings)
+
+    is_valid = len(errors) == 0
+    return is_valid, errors, warnings
+
+
+def _validate_roster_fields(data: Dict[str, Any], errors: List[str], warnings: List[str]):
+    """Check a roster's top-level fields, appending to errors and warnings."""
     required_fields = ["school", "fetched_date", "coaches"]
 
     for field in required_fields:
@@ -126,35 +182,126 @@ def validate_roster_data(data: Dict[str, Any]) -> Tuple[bool, List[str], List[st
     if "official_roster_url" not in data or not data["official_roster_url"]:
         warnings.append("Missing official_roster_url for roster")
 
-    if "coaches" in data:
-        if not isinstance(data["coaches"], list):
-            errors.append("coaches must be a list")
-        elif len(data["coaches"]) == 0:
-            warnings.append("coaches list is empty")
-        else:
-            for i, coach in enumerate(data["coaches"]):
-                if not isinstance(coach, dict):
-                    errors.append(f"Coach entry {i}: must be a dictionary")
-                else:
-                    if "name" not in coach or not coach["name"]:
-                        errors.append(f"Coach entry {i}: missing name")
-                    if "position" not in coach or not coach["position"]:
-                        errors.append(f"Coach entry {i}: missing position")
 
-                    # Validate source_type field
-                    if "source_type" not in coach or not coach["source_type"]:
-                        warnings.append(f"Coach entry {i} ({coach.get('name', 'unknown')}): missing source_type")
-                    elif coach["source_type"] not in VALID_SOURCE_TYPES:
-                        errors.append(f"Coach entry {i} ({coach.get('name', 'unknown')}): invalid source_type '{coach['source_type']}' (valid: {VALID_SOURCE_TYPES})")
+def _validate_roster_coach(coach: Any, i: int, errors: List[str], warnings: List[str]):
+    """Check a single roster coach entry, appending to errors and warnings."""
+    if not isinstance(coach, dict):
+        errors.append(f"Coach entry {i}: must be a dictionary")
+        return
+
+    if "name" not in coach or not coach["name"]:
+        errors.append(f"Coach entry {i}: missing name")
+    if "position" not in coach or not coach["position"]:
+        errors.append(f"Coach entry {i}: missing position")
+
+    # Validate source_type field
+    if "source_type" not in coach or not coach["source_type"]:
+        warnings.append(f"Coach entry {i} ({coach.get('name', 'unknown')}): missing source_type")
+    elif not isinstance(coach["source_type"], str) or coach["source_type"] not in VALID_SOURCE_TYPES:
+        errors.append(f"Coach entry {i} ({coach.get('name', 'unknown')}): invalid source_type '{coach['source_type']}' (valid: {list(VALID_SOURCE_TYPES_DISPLAY)})")
+
+    # Validate source_url for each coach
+    if "source_url" not in coach or not coach["source_url"]:
+        warnings.append(f"Coach entry {i} ({coach.get('name', 'unknown')}): missing source_url")
+
+
+def _build_streamed_value(events, event: str, value: Any) -> Any:
+    """Build one JSON value from ijson parse events, given its first event."""
+    if event not in ("start_map", "start_array"):
+        return value
+    builder = ijson.common.ObjectBuilder()
+    builder.event(event, value)
+    depth = 1
+    for _, event, value in events:
+        builder.event(event, value)
+        if event in ("start_map", "start_array"):
+            depth += 1
+        elif event in ("end_map", "end_array"):
+            depth -= 1
+            if depth == 0:
+                return builder.value
+
+
+def validate_roster_stream(f) -> Optional[Tuple[bool, List[str], List[str]]]:
+    """
+    Validate a roster file while streaming it with ijson.
+
+    Only one coach entry is held in memory at a time. Produces the same
+    result as validate_roster_data on the loaded file.
 
-                    # Validate source_url for each coach
-                    if "source_url" not in coach or not coach["source_url"]:
-                        warnings.append(f"Coach entry {i} ({coach.get('name', 'unknown')}): missing source_url")
+    Args:
+        f: Roster JSON file opened in binary mode
+
+    Returns:
+        Tuple of (is_valid, errors, warnings), or None if the file's
+        top-level value is not an object
+    """
+    events = ijson.parse(f, use_float=True)
+    _, event, _ = next(events)
+    if event != "start_map":
+        return None
+
+    fields = {}
+    coaches_streamed = False
+    coach_count = 0
+    coach_errors = []
+    coach_warnings = []
+
+    for prefix, event, value in events:
+        if prefix != "" or event != "map_key":
+            continue
+        key = value
+        _, event, value = next(events)
+        if key != "coaches":
+            fields[key] = _build_streamed_value(events, event, value)
+            continue
+
+        # A repeated key replaces the earlier value, as with json.load
+        coach_count = 0
+        coach_errors = []
+        coach_warnings = []
+        coaches_streamed = event == "start_array"
+        if not coaches_streamed:
+            fields[key] = _build_streamed_value(events, event, value)
+            continue
+
+        fields[key] = None
+        for _, event, value in events:
+            if event == "end_array":
+                break
+            coach = _build_streamed_value(events, event, value)
+            _validate_roster_coach(coach, coach_count, coach_errors, coach_warnings)
+            coach_count += 1
+
+    errors = []
+    warnings = []
+    _validate_roster_fields(fields, errors, warnings)
+
+    if coaches_streamed:
+        if coach_count == 0:
+            warnings.append("coaches list is empty")
+        errors.extend(coach_errors)
+        warnings.extend(coach_warnings)
+    elif "coaches" in fields:
+        errors.append("coaches must be a list")
 
     is_valid = len(errors) == 0
     return is_valid, errors, warnings
 
 
+def _read_json(filepath: str) -> Tuple[Any, Optional[str]]:
+    """Parse a JSON file, returning (data, None) or (None, error message)."""
+    try:
+        with open(filepath, 'rb') as f:
+            raw = f.read()
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
+        return (orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)), None
+    except FileNotFoundError:
+        return None, f"File not found: {filepath}"
+    except json.JSONDecodeError as e:
+        return None, f"Invalid JSON: {e}"
+
+
 def validate_file(filepath: str, data_type: str = "coach") -> Tuple[bool, List[str], List[str]]:
     """
     Validate a JSON file.
@@ -166,13 +313,24 @@ def validate_file(filepath: str, data_type: str = "coach") -> Tuple[bool, List[s
     Returns:
         Tuple of (is_valid, errors, warnings)
     """
-    try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-    except FileNotFoundError:
-        return False, [f"File not found: {filepath}"], []
-    except json.JSONDecodeError as e:
-        return False, [f"Invalid JSON: {e}"], []
+    # Rosters are streamed when ijson is installed
+    if data_type == "roster" and IJSON_AVAILABLE:
+        try:
+            with open(filepath, 'rb') as f:
+                result = validate_roster_stream(f)
+        except FileNotFoundError:
+            return False, [f"File not found: {filepath}"], []
+        except ijson.JSONError as e:
+            return False, [f"Invalid JSON: {e}"], []
+        if result is not None:
+            return result
+
+    data, error = _read_json(filepath)
+    if error:
+        return False, [error], []
+
+    if not isinstance(data, dict):
+        return False, [f"Expected a JSON object, got {type(data).__name__}"], []
 
     if data_type == "coach":
         return validate_coach_data(data)
@@ -182,17 +340,110 @@ def validate_file(filepath: str, data_type: str = "coach") -> Tuple[bool, List[s
         return False, [f"Unknown data_type: {data_type}"], []
 
 
+def _tree_paths(root: str, data_type: str) -> List[str]:
+    """
+    Find the files under root that hold data of the given type.
+
+    Coach files live in a coaches/ directory and rosters are named
+    roster.json; anything else in the cache tree (coach_index.json,
+    cross-reference caches) is neither and is left out.
+    """
+    paths = glob.glob(os.path.join(root, "**", "*.json"), recursive=True)
+    if data_type == "coach":
+        paths = [path for path in paths
+                 if os.path.basename(os.path.dirname(os.path.abspath(path))) == COACHES_DIRNAME]
+    elif data_type == "roster":
+        paths = [path for path in paths if os.path.basename(path) == ROSTER_FILENAME]
+    return sorted(paths)
+
+
+def _validate_tree_file(filepath: str, data_type: str) -> List[Tuple[str, bool, List[str], List[str]]]:
+    """
+    Validate one file found by validate_tree.
+
+    A combined all_coaches.json is expanded into one result per coach,
+    labelled "<path>[<index>]"; any other file gives a single result.
+    """
+    if data_type != "coach" or os.path.basename(filepath) != COMBINED_COACHES_FILENAME:
+        return [(filepath, *validate_file(filepath, data_type))]
+
+    data, error = _read_json(filepath)
+    if error:
+        return [(filepath, False, [error], [])]
+    if not isinstance(data, list):
+        return [(filepath, False, [f"Expected a JSON array, got {type(data).__name__}"], [])]
+
+    results = []
+    for i, entry in enumerate(data):
+        label = f"{filepath}[{i}]"
+        if isinstance(entry, dict):
+            results.append((label, *validate_coach_data(entry)))
+        else:
+            results.append((label, False, [f"Expected a JSON object, got {type(entry).__name__}"], []))
+    return results
+
+
+def validate_tree(root: str, data_type: str = "coach",
+                  max_workers: Optional[int] = None) -> List[Tuple[str, bool, List[str], List[str]]]:
+    """
+    Validate every coach or roster file under a directory, in parallel.
+
+    Parsing and checking are CPU-bound, so files are spread across
+    worker processes. Files are picked by data type: coach data is every
+    *.json in a coaches/ directory (all_coaches.json checked per entry),
+    roster data every roster.json.
+
+    Args:
+        root: Cache directory (or a single school's or coaches/ directory)
+        data_type: "coach" or "roster"
+        max_workers: Number of worker processes (defaults to CPU count)
+
+    Returns:
+        List of (path, is_valid, errors, warnings) tuples, sorted by path;
+        all_coaches.json entries are reported as "<path>[<index>]"
+    """
+    paths = _tree_paths(root, data_type)
+    data_types = [data_type] * len(paths)
+    max_workers = max_workers or os.cpu_count() or 1
+
+    if max_workers > 1 and len(paths) > 1:
+        # Files are small, so hand them to workers in chunks to amortize IPC
+        chunksize = max(1, len(paths) // (max_workers * 4))
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(_validate_tree_file, paths, data_types, chunksize=chunksize))
+    else:
+        results = list(map(_validate_tree_file, paths, data_types))
+
+    return [result for file_results in results for result in file_results]
+
+
 if __name__ == "__main__":
-    """CLI usage: python validate.py <filepath> [coach|roster]"""
+    """CLI usage: python validate.py <filepath|directory> [coach|roster]"""
     if len(sys.argv) < 2:
-        print("Usage: python validate.py <filepath> [coach|roster]")
-        print("  filepath: Path to JSON file to validate")
+        print("Usage: python validate.py <filepath|directory> [coach|roster]")
+        print("  filepath: Path to JSON file to validate, or a directory to")
+        print("            validate every coach (or roster) file under it")
         print("  type: 'coach' (default) or 'roster'")
         sys.exit(1)
 
     filepath = sys.argv[1]
     data_type = sys.argv[2] if len(sys.argv) > 2 else "coach"
 
+    if os.path.isdir(filepath):
+        tree_results = validate_tree(filepath, data_type)
+        invalid = 0
+        for path, is_valid, errors, warnings in tree_results:
+            if is_valid:
+                continue
+            invalid += 1
+            print(f"{path}:")
+            for error in errors:
+                print(f"  - {error}")
+
+        print(f"\nValidated {len(tree_results)} {data_type} files: "
+              f"{len(tree_results) - invalid} valid, {invalid} invalid")
+        sys.exit(0 if invalid == 0 else 1)
+
     is_valid, errors, warnings = validate_file(filepath, data_type)
 
     print(f"Validating: {filepath}")
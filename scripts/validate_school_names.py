@@ -6,14 +6,24 @@ Validates that all school names in target list have matching aliases.
 import json
 import os
 import sys
+from functools import lru_cache
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 PROJECT_ROOT = os.path.dirname(SCRIPT_DIR)
 
 
 def load_json(path: str) -> dict:
-    with open(path, "r") as f:
-        return json.load(f)
+    with open(path, "rb") as f:
+        raw = f.read()
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
 
 
 def build_alias_lookup(aliases: dict) -> dict:
@@ -34,12 +44,26 @@ def build_alias_lookup(aliases: dict) -> dict:
     return lookup
 
 
+@lru_cache(maxsize=8)
+def _alias_lookup_cached(aliases_path: str, mtime_ns: int, size: int) -> dict:
+    """Build the alias lookup for a file; the stat fields key the cache so edits are picked up."""
+    return build_alias_lookup(load_json(aliases_path))
+
+
+def load_alias_lookup(aliases_path: str) -> dict:
+    """
+    Load an aliases file as a lookup, reusing it while the file is unchanged.
+
+    The returned dict is shared between calls, so treat it as read-only.
+    """
+    stat = os.stat(aliases_path)
+    return _alias_lookup_cached(aliases_path, stat.st_mtime_ns, stat.st_size)
+
+
 def validate_schools(target_path: str, aliases_path: str) -> tuple[list, list]:
     """Validate school names against aliases. Returns (matched, unmatched)."""
     targets = load_json(target_path)
-    aliases = load_json(aliases_path)
-
-    lookup = build_alias_lookup(aliases)
+    lookup = load_alias_lookup(aliases_path)
 
     matched = []
     unmatched = []
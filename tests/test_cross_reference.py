@@ -11,7 +11,13 @@ import os
 # Add scripts directory to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts'))
 
-from cross_reference import parse_year_range, year_to_academic_year
+from cross_reference import (
+    parse_year_range,
+    year_to_academic_year,
+    build_nmdp_year_index,
+    build_nmdp_year_bounds,
+    ALL_SCHOOLS_KEY,
+)
 
 
 class TestParseYearRange:
@@ -75,6 +81,14 @@ class TestParseYearRange:
         result = parse_year_range("  2020-2022  ")
         assert result == [2020, 2021, 2022]
 
+    def test_repeated_calls_return_fresh_lists(self):
+        """Results are memoized, but callers must get a list they can mutate safely."""
+        first = parse_year_range("2020-2022", current_year=2026)
+        first.append(1999)
+        second = parse_year_range("2020-2022", current_year=2026)
+        assert second == [2020, 2021, 2022]
+        assert second is not first
+
 
 class TestYearToAcademicYear:
     """Tests for year_to_academic_year function."""
@@ -94,6 +108,33 @@ class TestYearToAcademicYear:
         assert len(result) == 9  # "YYYY-YYYY"
 
 
+class TestBuildNmdpYearIndex:
+    """Tests for build_nmdp_year_index function."""
+
+    def test_start_years(self):
+        """Academic years should map to their sorted starting calendar years."""
+        index = build_nmdp_year_index({"SCHOOL X": ["2022-2023", "2020-2021"]})
+        assert index == {"SCHOOL X": (2020, 2022)}
+
+    def test_malformed_years_ignored(self):
+        """Entries that aren't consecutive 'YYYY-YYYY' years can never match."""
+        index = build_nmdp_year_index({"SCHOOL X": ["2020-2022", "bad", "2021-2022"]})
+        assert index["SCHOOL X"] == (2021,)
+
+    def test_year_bounds(self):
+        """Bounds are tracked per school and across all schools."""
+        index = build_nmdp_year_index({
+            "SCHOOL X": ["2020-2021", "2022-2023"],
+            "SCHOOL Y": ["2024-2025"],
+            "SCHOOL Z": ["bad"],
+        })
+        bounds = build_nmdp_year_bounds(index)
+        assert bounds["SCHOOL X"] == (2020, 2022)
+        assert bounds["SCHOOL Y"] == (2024, 2024)
+        assert "SCHOOL Z" not in bounds
+        assert bounds[ALL_SCHOOLS_KEY] == (2020, 2024)
+
+
 class TestIntegration:
     """Integration tests combining parse and convert."""
 
@@ -133,29 +174,33 @@ class TestIntegration:
         assert len(overlap) == 0
 
 
+# Test methods per class in definition order, collected once for run_tests()
+_TEST_TABLE = [
+    (cls, tuple(name for name in vars(cls) if name.startswith('test_')))
+    for cls in (TestParseYearRange, TestYearToAcademicYear, TestBuildNmdpYearIndex, TestIntegration)
+]
+
+
 def run_tests():
     """Run all tests manually (without pytest)."""
-    test_classes = [TestParseYearRange, TestYearToAcademicYear, TestIntegration]
-
     passed = 0
     failed = 0
 
-    for test_class in test_classes:
+    for test_class, method_names in _TEST_TABLE:
         instance = test_class()
-        for method_name in dir(instance):
-            if method_name.startswith('test_'):
-                try:
-                    getattr(instance, method_name)()
-                    print(f"  PASS: {test_class.__name__}.{method_name}")
-                    passed += 1
-                except AssertionError as e:
-                    print(f"  FAIL: {test_class.__name__}.{method_name}")
-                    print(f"        {e}")
-                    failed += 1
-                except Exception as e:
-                    print(f"  ERROR: {test_class.__name__}.{method_name}")
-                    print(f"         {e}")
-                    failed += 1
+        for method_name in method_names:
+            try:
+                getattr(instance, method_name)()
+                print(f"  PASS: {test_class.__name__}.{method_name}")
+                passed += 1
+            except AssertionError as e:
+                print(f"  FAIL: {test_class.__name__}.{method_name}")
+                print(f"        {e}")
+                failed += 1
+            except Exception as e:
+                print(f"  ERROR: {test_class.__name__}.{method_name}")
+                print(f"         {e}")
+                failed += 1
 
     print(f"\nResults: {passed} passed, {failed} failed")
     return failed == 0
@@ -0,0 +1,159 @@
+"""
+test_google_sheets_export.py - Unit tests for google_sheets_export.py
+
+Run with: python3 -m pytest tests/test_google_sheets_export.py -v
+Or:       python3 tests/test_google_sheets_export.py
+"""
+
+import sys
+import os
+
+# Add scripts directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+
+from google_sheets_export import GoogleSheetsExporter, CONTENT_HASH_KEY
+
+
+NUM_COLS = 3
+MASTER_VALUES = [["Coach", "School", "Overlap"], ["Jane Doe", "University of Oregon", "YES"]]
+SUMMARY_VALUES = [["Summary"], ["Total", 1]]
+
+
+def build_batch(tabs, sheet_ids=None, content_hashes=None):
+    """Run _build_batch without touching the network."""
+    exporter = GoogleSheetsExporter(creds_path="unused.json", sheet_id="unused")
+    return exporter._build_batch(tabs, NUM_COLS, sheet_ids or {}, content_hashes or {}, "2026-01-26 12:00")
+
+
+def master_tab(values=MASTER_VALUES, name="Master Results"):
+    """A data tab as export_results builds it."""
+    return (name, values, True, (len(values) + 10, NUM_COLS))
+
+
+def master_hash():
+    """Content hash _build_batch stores for MASTER_VALUES."""
+    _, _, hash_requests = build_batch([master_tab()])
+    return hash_requests[0]["createDeveloperMetadata"]["developerMetadata"]["metadataValue"]
+
+
+def request_types(requests):
+    """The request kind (its single key) of each batchUpdate request."""
+    return [next(iter(request)) for request in requests]
+
+
+class TestBuildBatch:
+    """Tests for GoogleSheetsExporter._build_batch."""
+
+    def test_unchanged_tab_omitted(self):
+        """A data tab whose stored hash matches is left out entirely."""
+        requests, value_ranges, hash_requests = build_batch(
+            [master_tab()],
+            sheet_ids={"Master Results": 5},
+            content_hashes={"Master Results": (77, master_hash())}
+        )
+
+        assert requests == []
+        assert value_ranges == []
+        assert hash_requests == []
+
+    def test_new_tab_hash_created_after_values(self):
+        """A new tab is added now; its hash is only created in hash_requests."""
+        requests, value_ranges, hash_requests = build_batch([master_tab()], sheet_ids={"Summary": 3})
+
+        assert requests[0]["addSheet"]["properties"]["title"] == "Master Results"
+        assert requests[0]["addSheet"]["properties"]["sheetId"] == 4
+        assert "createDeveloperMetadata" not in request_types(requests)
+        assert "updateDeveloperMetadata" not in request_types(requests)
+
+        assert len(hash_requests) == 1
+        metadata = hash_requests[0]["createDeveloperMetadata"]["developerMetadata"]
+        assert metadata["metadataKey"] == CONTENT_HASH_KEY
+        assert metadata["location"] == {"sheetId": 4}
+        assert metadata["metadataValue"]
+
+        assert value_ranges == [{"range": "'Master Results'!A1", "values": MASTER_VALUES}]
+
+    def test_changed_tab_hash_blanked_then_set(self):
+        """An existing tab's hash is blanked in requests and set in hash_requests."""
+        new_values = MASTER_VALUES + [["John Roe", "Tulane University", "NO"]]
+        requests, value_ranges, hash_requests = build_batch(
+            [master_tab(new_values)],
+            sheet_ids={"Master Results": 5},
+            content_hashes={"Master Results": (77, master_hash())}
+        )
+
+        assert "addSheet" not in request_types(requests)
+        assert requests[0] == {"updateCells": {"range": {"sheetId": 5}, "fields": "userEnteredValue"}}
+
+        metadata_updates = [r["updateDeveloperMetadata"] for r in requests if "updateDeveloperMetadata" in r]
+        assert len(metadata_updates) == 1
+        assert metadata_updates[0]["dataFilters"] == [{"developerMetadataLookup": {"metadataId": 77}}]
+        assert metadata_updates[0]["developerMetadata"] == {"metadataValue": ""}
+
+        assert len(hash_requests) == 1
+        update = hash_requests[0]["updateDeveloperMetadata"]
+        assert update["dataFilters"] == [{"developerMetadataLookup": {"metadataId": 77}}]
+        assert update["developerMetadata"]["metadataValue"] not in ("", master_hash())
+
+        assert value_ranges == [{"range": "'Master Results'!A1", "values": new_values}]
+
+    def test_added_sheet_ids_do_not_collide(self):
+        """New tabs get sheet IDs above every existing one, in tab order."""
+        requests, _, hash_requests = build_batch(
+            [master_tab(), master_tab(name="West"), ("Summary", SUMMARY_VALUES, False, (50, 10))],
+            sheet_ids={"Summary": 7, "Old Tab": 2}
+        )
+
+        added = {r["addSheet"]["properties"]["title"]: r["addSheet"]["properties"]["sheetId"]
+                 for r in requests if "addSheet" in r}
+        assert added == {"Master Results": 8, "West": 9}
+        assert [r["createDeveloperMetadata"]["developerMetadata"]["location"]["sheetId"]
+                for r in hash_requests] == [8, 9]
+
+    def test_summary_tab_has_no_hash(self):
+        """The non-data Summary tab is always rewritten and never hashed."""
+        requests, value_ranges, hash_requests = build_batch(
+            [("Summary", SUMMARY_VALUES, False, (50, 10))], sheet_ids={"Summary": 7}
+        )
+
+        assert request_types(requests) == ["updateCells"]
+        assert hash_requests == []
+        assert value_ranges == [{"range": "'Summary'!A1", "values": SUMMARY_VALUES}]
+
+
+# Test methods per class in definition order, collected once for run_tests()
+_TEST_TABLE = [
+    (cls, tuple(name for name in vars(cls) if name.startswith('test_')))
+    for cls in (TestBuildBatch,)
+]
+
+
+def run_tests():
+    """Run all tests manually (without pytest)."""
+    passed = 0
+    failed = 0
+
+    for test_class, method_names in _TEST_TABLE:
+        instance = test_class()
+        for method_name in method_names:
+            try:
+                getattr(instance, method_name)()
+                print(f"  PASS: {test_class.__name__}.{method_name}")
+                passed += 1
+            except AssertionError as e:
+                print(f"  FAIL: {test_class.__name__}.{method_name}")
+                print(f"        {e}")
+                failed += 1
+            except Exception as e:
+                print(f"  ERROR: {test_class.__name__}.{method_name}")
+                print(f"         {e}")
+                failed += 1
+
+    print(f"\nResults: {passed} passed, {failed} failed")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    print("Running google_sheets_export.py tests...\n")
+    success = run_tests()
+    sys.exit(0 if success else 1)
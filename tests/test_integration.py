@@ -11,6 +11,21 @@ import os
 import json
 import tempfile
 import shutil
+from functools import lru_cache
+from types import SimpleNamespace
+
+try:
+    import pytest
+except ImportError:
+    # Minimal stand-in so the module still imports for run_tests(); it
+    # records the cases the same way pytest does (func.pytestmark)
+    def _parametrize(argnames, argvalues, ids=None):
+        def decorate(func):
+            func.pytestmark = [SimpleNamespace(name="parametrize", args=(argnames, argvalues))]
+            return func
+        return decorate
+
+    pytest = SimpleNamespace(mark=SimpleNamespace(parametrize=_parametrize))
 
 # Add scripts directory to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts'))
@@ -24,7 +39,13 @@ from cross_reference import (
 )
 from normalize import SchoolNormalizer, normalize_school_name
 from generate_csv import generate_csv_report, generate_summary_stats, format_career_history
-from cache_utils import get_cache_status, get_cache_completeness, is_cache_stale
+from cache_utils import (
+    get_cache_status,
+    get_cache_status_many,
+    get_cache_completeness,
+    is_cache_stale,
+    is_cache_stale_fast
+)
 
 # Paths relative to test file
 TEST_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -37,6 +58,45 @@ NMDP_DB_PATH = os.path.join(DATA_DIR, "gitg_school_years.json")
 ALIASES_PATH = os.path.join(DATA_DIR, "school_aliases.json")
 CONFIG_PATH = os.path.join(PROJECT_DIR, "config.json")
 
+OREGON_COACHES_DIR = os.path.join(CACHE_DIR, "university_of_oregon", "coaches")
+COLORADO_COACHES_DIR = os.path.join(CACHE_DIR, "university_of_colorado", "coaches")
+
+
+@lru_cache(maxsize=None)
+def cross_reference_cached(coaches_dir):
+    """
+    Run cross_reference_all_coaches once per coaches directory.
+
+    The inputs are read-only fixtures, so tests share one result list;
+    callers must not modify it.
+    """
+    return cross_reference_all_coaches(
+        coaches_dir, NMDP_DB_PATH, ALIASES_PATH, CONFIG_PATH
+    )
+
+
+@lru_cache(maxsize=None)
+def cross_reference_indexed(coaches_dir):
+    """
+    Shared cross-reference results plus the lookups tests need.
+
+    Returns:
+        SimpleNamespace with results, by_name (coach name -> result) and
+        with_overlap (results that have an NMDP overlap)
+    """
+    results = cross_reference_cached(coaches_dir)
+    return SimpleNamespace(
+        results=results,
+        by_name={r["coach_name"]: r for r in results},
+        with_overlap=[r for r in results if r["has_overlap"]],
+    )
+
+
+@lru_cache(maxsize=None)
+def shared_normalizer():
+    """Return one SchoolNormalizer for all tests (normalize() only reads its tables)."""
+    return SchoolNormalizer(NMDP_DB_PATH, ALIASES_PATH)
+
 
 class TestOregonIntegration:
     """
@@ -72,78 +132,51 @@ class TestOregonIntegration:
 
     def test_oregon_cache_exists(self):
         """Oregon cache should exist and be complete."""
-        coaches_dir = os.path.join(CACHE_DIR, "university_of_oregon", "coaches")
-        assert os.path.exists(coaches_dir), f"Oregon cache not found at {coaches_dir}"
+        assert os.path.exists(OREGON_COACHES_DIR), f"Oregon cache not found at {OREGON_COACHES_DIR}"
 
     def test_cross_reference_coach_count(self):
         """Cross-reference should process all 24 Oregon coaches."""
-        coaches_dir = os.path.join(CACHE_DIR, "university_of_oregon", "coaches")
-
-        results = cross_reference_all_coaches(
-            coaches_dir, NMDP_DB_PATH, ALIASES_PATH, CONFIG_PATH
-        )
+        results = cross_reference_cached(OREGON_COACHES_DIR)
 
         assert len(results) == self.EXPECTED_COACH_COUNT, \
             f"Expected {self.EXPECTED_COACH_COUNT} coaches, got {len(results)}"
 
     def test_overlap_count(self):
         """Should find exactly 8 coaches with NMDP overlaps."""
-        coaches_dir = os.path.join(CACHE_DIR, "university_of_oregon", "coaches")
-
-        results = cross_reference_all_coaches(
-            coaches_dir, NMDP_DB_PATH, ALIASES_PATH, CONFIG_PATH
-        )
-
-        coaches_with_overlap = [r for r in results if r["has_overlap"]]
+        coaches_with_overlap = cross_reference_indexed(OREGON_COACHES_DIR).with_overlap
 
         assert len(coaches_with_overlap) == self.EXPECTED_OVERLAP_COUNT, \
             f"Expected {self.EXPECTED_OVERLAP_COUNT} overlaps, got {len(coaches_with_overlap)}"
 
-    def test_specific_overlaps_found(self):
-        """Verify specific known overlaps are detected."""
-        coaches_dir = os.path.join(CACHE_DIR, "university_of_oregon", "coaches")
+    @pytest.mark.parametrize(
+        "coach_name,expected_schools", list(EXPECTED_OVERLAPS.items()), ids=list(EXPECTED_OVERLAPS)
+    )
+    def test_specific_overlaps_found(self, coach_name, expected_schools):
+        """Verify a specific known overlap is detected."""
+        results_by_name = cross_reference_indexed(OREGON_COACHES_DIR).by_name
 
-        results = cross_reference_all_coaches(
-            coaches_dir, NMDP_DB_PATH, ALIASES_PATH, CONFIG_PATH
-        )
+        assert coach_name in results_by_name, f"Coach {coach_name} not found in results"
 
-        # Build lookup by coach name
-        results_by_name = {r["coach_name"]: r for r in results}
+        result = results_by_name[coach_name]
+        assert result["has_overlap"], f"{coach_name} should have overlap but doesn't"
 
-        for coach_name, expected_schools in self.EXPECTED_OVERLAPS.items():
-            assert coach_name in results_by_name, f"Coach {coach_name} not found in results"
+        found_schools = [o["school"] for o in result["overlaps"]]
+        for expected_school in expected_schools:
+            assert expected_school in found_schools, \
+                f"{coach_name} missing expected overlap with {expected_school}. Found: {found_schools}"
 
-            result = results_by_name[coach_name]
-            assert result["has_overlap"], f"{coach_name} should have overlap but doesn't"
+    @pytest.mark.parametrize("coach_name", EXPECTED_NO_OVERLAPS)
+    def test_no_false_positives(self, coach_name):
+        """Verify a coach without overlaps doesn't get a false positive."""
+        result = cross_reference_indexed(OREGON_COACHES_DIR).by_name.get(coach_name)
 
-            found_schools = [o["school"] for o in result["overlaps"]]
-            for expected_school in expected_schools:
-                assert expected_school in found_schools, \
-                    f"{coach_name} missing expected overlap with {expected_school}. Found: {found_schools}"
-
-    def test_no_false_positives(self):
-        """Verify coaches without overlaps don't have false positives."""
-        coaches_dir = os.path.join(CACHE_DIR, "university_of_oregon", "coaches")
-
-        results = cross_reference_all_coaches(
-            coaches_dir, NMDP_DB_PATH, ALIASES_PATH, CONFIG_PATH
-        )
-
-        results_by_name = {r["coach_name"]: r for r in results}
-
-        for coach_name in self.EXPECTED_NO_OVERLAPS:
-            if coach_name in results_by_name:
-                result = results_by_name[coach_name]
-                assert not result["has_overlap"], \
-                    f"{coach_name} should NOT have overlap but found: {result.get('overlaps', [])}"
+        if result is not None:
+            assert not result["has_overlap"], \
+                f"{coach_name} should NOT have overlap but found: {result.get('overlaps', [])}"
 
     def test_summary_stats(self):
         """Test summary statistics generation."""
-        coaches_dir = os.path.join(CACHE_DIR, "university_of_oregon", "coaches")
-
-        results = cross_reference_all_coaches(
-            coaches_dir, NMDP_DB_PATH, ALIASES_PATH, CONFIG_PATH
-        )
+        results = cross_reference_cached(OREGON_COACHES_DIR)
 
         stats = generate_summary_stats(results)
 
@@ -166,13 +199,11 @@ class TestColoradoIntegration:
 
     def test_colorado_cache_exists(self):
         """Colorado cache should exist."""
-        coaches_dir = os.path.join(CACHE_DIR, "university_of_colorado", "coaches")
-        assert os.path.exists(coaches_dir), f"Colorado cache not found"
+        assert os.path.exists(COLORADO_COACHES_DIR), f"Colorado cache not found"
 
     def test_all_coaches_json_format(self):
         """Colorado uses all_coaches.json format - verify it's handled."""
-        coaches_dir = os.path.join(CACHE_DIR, "university_of_colorado", "coaches")
-        all_coaches_path = os.path.join(coaches_dir, "all_coaches.json")
+        all_coaches_path = os.path.join(COLORADO_COACHES_DIR, "all_coaches.json")
 
         assert os.path.exists(all_coaches_path), "all_coaches.json not found"
 
@@ -183,40 +214,45 @@ class TestColoradoIntegration:
 
     def test_cross_reference_handles_combined_format(self):
         """Cross-reference should handle all_coaches.json format."""
-        coaches_dir = os.path.join(CACHE_DIR, "university_of_colorado", "coaches")
-
-        results = cross_reference_all_coaches(
-            coaches_dir, NMDP_DB_PATH, ALIASES_PATH, CONFIG_PATH
-        )
+        results = cross_reference_cached(COLORADO_COACHES_DIR)
 
         assert len(results) == self.EXPECTED_COACH_COUNT, \
             f"Expected {self.EXPECTED_COACH_COUNT} coaches from combined file, got {len(results)}"
 
+    def test_parallel_matches_sequential(self):
+        """Process-pool cross-reference should match the sequential results."""
+        sequential = cross_reference_cached(COLORADO_COACHES_DIR)
+        parallel = cross_reference_all_coaches(
+            COLORADO_COACHES_DIR, NMDP_DB_PATH, ALIASES_PATH, CONFIG_PATH, max_workers=2
+        )
+
+        assert parallel == sequential
+
 
 class TestNormalization:
     """Test school name normalization end-to-end."""
 
-    def test_alias_resolution(self):
-        """Test that aliases resolve correctly."""
-        normalizer = SchoolNormalizer(NMDP_DB_PATH, ALIASES_PATH)
-
-        test_cases = [
-            ("CU Boulder", "UNIVERSITY OF COLORADO-BOULDER"),
-            ("University of Colorado", "UNIVERSITY OF COLORADO-BOULDER"),
-            ("Hawaii", "UNIVERSITY OF HAWAII AT MANOA"),
-            ("University of Hawaii", "UNIVERSITY OF HAWAII AT MANOA"),
-            ("Oregon State", "OREGON STATE UNIVERSITY"),
-            ("Tulane", "TULANE UNIVERSITY"),
-        ]
+    ALIAS_CASES = [
+        ("CU Boulder", "UNIVERSITY OF COLORADO-BOULDER"),
+        ("University of Colorado", "UNIVERSITY OF COLORADO-BOULDER"),
+        ("Hawaii", "UNIVERSITY OF HAWAII AT MANOA"),
+        ("University of Hawaii", "UNIVERSITY OF HAWAII AT MANOA"),
+        ("Oregon State", "OREGON STATE UNIVERSITY"),
+        ("Tulane", "TULANE UNIVERSITY"),
+    ]
 
-        for input_name, expected in test_cases:
-            result, match_type = normalizer.normalize(input_name)
-            assert result == expected, \
-                f"'{input_name}' should normalize to '{expected}', got '{result}'"
+    @pytest.mark.parametrize("input_name,expected", ALIAS_CASES, ids=[case[0] for case in ALIAS_CASES])
+    def test_alias_resolution(self, input_name, expected):
+        """Test that an alias resolves correctly."""
+        normalizer = shared_normalizer()
+
+        result, match_type = normalizer.normalize(input_name)
+        assert result == expected, \
+            f"'{input_name}' should normalize to '{expected}', got '{result}'"
 
     def test_no_fuzzy_false_positives(self):
         """Verify fuzzy matching is disabled - no false positives."""
-        normalizer = SchoolNormalizer(NMDP_DB_PATH, ALIASES_PATH)
+        normalizer = shared_normalizer()
 
         # These should NOT match anything (fuzzy matching disabled)
         no_match_cases = [
@@ -251,17 +287,33 @@ class TestCacheUtilities:
         assert status["exists"] == False
         assert status["recommendation"] == "no_cache"
 
+    def test_cache_stale_fast(self):
+        """mtime-based staleness: missing roster is stale, a fresh write is not."""
+        assert is_cache_stale_fast(os.path.join(CACHE_DIR, "fake_university", "roster.json"))
+
+        with tempfile.NamedTemporaryFile(suffix='.json', delete=False) as f:
+            temp_path = f.name
+        try:
+            assert not is_cache_stale_fast(temp_path, staleness_days=30)
+        finally:
+            os.remove(temp_path)
+
+    def test_cache_status_many_matches_single(self):
+        """Batch status lookup should match per-school get_cache_status."""
+        schools = ["University of Oregon", "Fake University"]
+        statuses = get_cache_status_many(schools, CACHE_DIR)
+
+        assert list(statuses.keys()) == schools
+        for school in schools:
+            assert statuses[school] == get_cache_status(school, CACHE_DIR)
+
 
 class TestCSVGeneration:
     """Test CSV output generation."""
 
     def test_csv_generation(self):
         """Test that CSV can be generated without errors."""
-        coaches_dir = os.path.join(CACHE_DIR, "university_of_oregon", "coaches")
-
-        results = cross_reference_all_coaches(
-            coaches_dir, NMDP_DB_PATH, ALIASES_PATH, CONFIG_PATH
-        )
+        results = cross_reference_cached(OREGON_COACHES_DIR)
 
         # Generate to temp file
         with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
@@ -273,13 +325,13 @@ class TestCSVGeneration:
 
             assert os.path.exists(output_path)
 
-            # Verify file has content
+            # Verify file has content; only the first two lines are read
             with open(output_path, 'r') as f:
-                lines = f.readlines()
-                assert len(lines) > 1, "CSV should have header + data rows"
+                header = f.readline().strip()
+                has_data = f.readline() != ""
+                assert header and has_data, "CSV should have header + data rows"
 
                 # Check header
-                header = lines[0].strip()
                 assert "Coach Name" in header
                 assert "NMDP Overlap" in header
                 assert "Data Quality" in header
@@ -301,41 +353,55 @@ class TestCSVGeneration:
         assert "2022-2026" in result or "2022-" in result
 
 
-def run_tests():
-    """Run all tests manually (without pytest)."""
-    test_classes = [
+# Test methods per class in definition order, collected once for run_tests()
+_TEST_TABLE = [
+    (cls, tuple(name for name in vars(cls) if name.startswith('test_')))
+    for cls in (
         TestOregonIntegration,
         TestColoradoIntegration,
         TestNormalization,
         TestCacheUtilities,
         TestCSVGeneration,
-    ]
+    )
+]
 
+
+def run_tests():
+    """Run all tests manually (without pytest)."""
     passed = 0
     failed = 0
     errors = []
 
-    for test_class in test_classes:
+    for test_class, method_names in _TEST_TABLE:
         print(f"\n{test_class.__name__}")
         print("-" * 40)
 
         instance = test_class()
-        for method_name in sorted(dir(instance)):
-            if method_name.startswith('test_'):
+        for method_name in method_names:
+            # Parametrized tests run once per case, as under pytest
+            calls = [(method_name, ())]
+            for mark in getattr(getattr(test_class, method_name), "pytestmark", []):
+                if mark.name == "parametrize":
+                    argnames, cases = mark.args[:2]
+                    if "," not in argnames:
+                        cases = [(case,) for case in cases]
+                    calls = [(f"{method_name}[{case[0]}]", case) for case in cases]
+
+            for test_name, args in calls:
                 try:
-                    getattr(instance, method_name)()
-                    print(f"  PASS: {method_name}")
+                    getattr(instance, method_name)(*args)
+                    print(f"  PASS: {test_name}")
                     passed += 1
                 except AssertionError as e:
-                    print(f"  FAIL: {method_name}")
+                    print(f"  FAIL: {test_name}")
                     print(f"        {e}")
                     failed += 1
-                    errors.append((test_class.__name__, method_name, str(e)))
+                    errors.append((test_class.__name__, test_name, str(e)))
                 except Exception as e:
-                    print(f"  ERROR: {method_name}")
+                    print(f"  ERROR: {test_name}")
                     print(f"         {type(e).__name__}: {e}")
                     failed += 1
-                    errors.append((test_class.__name__, method_name, f"{type(e).__name__}: {e}"))
+                    errors.append((test_class.__name__, test_name, f"{type(e).__name__}: {e}"))
 
     print("\n" + "=" * 50)
     print(f"Results: {passed} passed, {failed} failed")
@@ -0,0 +1,221 @@
+"""
+test_validate.py - Unit tests for validate.py
+
+Run with: python3 -m pytest tests/test_validate.py -v
+Or:       python3 tests/test_validate.py
+"""
+
+import sys
+import os
+import io
+import json
+import tempfile
+import shutil
+
+import pytest
+
+# Add scripts directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+
+from validate import validate_tree, validate_roster_data, validate_roster_stream
+
+
+VALID_COACH = {
+    "name": "Jane Doe",
+    "current_position": "Defensive Coordinator",
+    "current_school": "University of Oregon",
+    "career_history": [
+        {"school": "University of Oregon", "position": "Defensive Coordinator", "years": "2022-present"},
+        {"school": "Oregon State University", "position": "Linebackers Coach", "years": "2019-2021"},
+    ],
+    "research_status": "FOUND",
+}
+
+VALID_ROSTER = {
+    "school": "University of Oregon",
+    "fetched_date": "2026-01-26",
+    "official_roster_url": "https://example.com/roster",
+    "coaches": [
+        {
+            "name": "Jane Doe",
+            "position": "Defensive Coordinator",
+            "source_type": "official_roster",
+            "source_url": "https://example.com/roster",
+        },
+    ],
+}
+
+
+def write_json(path, data):
+    """Write data as JSON, creating parent directories."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+
+
+class TestValidateTree:
+    """Tests for validate_tree on a small cache directory."""
+
+    def setup_method(self):
+        """Build a valid two-school cache, including the generated sidecar files."""
+        self.cache_dir = tempfile.mkdtemp()
+
+        oregon = os.path.join(self.cache_dir, "university_of_oregon")
+        write_json(os.path.join(oregon, "roster.json"), VALID_ROSTER)
+        write_json(os.path.join(oregon, "coaches", "jane_doe.json"), VALID_COACH)
+        write_json(os.path.join(oregon, "coaches", "john_roe.json"), dict(VALID_COACH, name="John Roe"))
+        write_json(os.path.join(oregon, "coach_index.json"), {"signature": [], "names": ["Jane Doe"]})
+        write_json(os.path.join(oregon, "xref_0123abcd.json"), [])
+
+        colorado = os.path.join(self.cache_dir, "university_of_colorado")
+        write_json(os.path.join(colorado, "roster.json"), dict(VALID_ROSTER, school="University of Colorado"))
+        write_json(os.path.join(colorado, "coaches", "all_coaches.json"),
+                   [VALID_COACH, dict(VALID_COACH, name="John Roe")])
+
+    def teardown_method(self):
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+    def test_coach_files_all_valid(self):
+        """Only coach files are checked, and a healthy cache has no invalid ones."""
+        results = validate_tree(self.cache_dir, "coach", max_workers=1)
+
+        invalid = [(path, errors) for path, is_valid, errors, _ in results if not is_valid]
+        assert invalid == [], f"Expected every coach file to be valid, got {invalid}"
+        paths = [os.path.relpath(path, self.cache_dir) for path, *_ in results]
+        assert paths == [
+            os.path.join("university_of_colorado", "coaches", "all_coaches.json[0]"),
+            os.path.join("university_of_colorado", "coaches", "all_coaches.json[1]"),
+            os.path.join("university_of_oregon", "coaches", "jane_doe.json"),
+            os.path.join("university_of_oregon", "coaches", "john_roe.json"),
+        ], f"Unexpected coach paths: {paths}"
+
+    def test_roster_files_all_valid(self):
+        """Only roster.json files are checked as rosters."""
+        results = validate_tree(self.cache_dir, "roster", max_workers=1)
+
+        invalid = [(path, errors) for path, is_valid, errors, _ in results if not is_valid]
+        assert invalid == [], f"Expected every roster to be valid, got {invalid}"
+        paths = [os.path.relpath(path, self.cache_dir) for path, *_ in results]
+        assert paths == [
+            os.path.join("university_of_colorado", "roster.json"),
+            os.path.join("university_of_oregon", "roster.json"),
+        ], f"Unexpected roster paths: {paths}"
+
+    def test_parallel_matches_sequential(self):
+        """Worker processes should produce the same results as a single process."""
+        assert validate_tree(self.cache_dir, "coach", max_workers=2) == \
+            validate_tree(self.cache_dir, "coach", max_workers=1)
+
+    def test_invalid_combined_entry_reported(self):
+        """A bad all_coaches.json entry is reported by its index."""
+        path = os.path.join(self.cache_dir, "university_of_colorado", "coaches", "all_coaches.json")
+        write_json(path, [VALID_COACH, {"name": "No Fields"}])
+
+        results = {os.path.relpath(p, self.cache_dir): is_valid
+                   for p, is_valid, _, _ in validate_tree(self.cache_dir, "coach", max_workers=1)}
+        assert results[os.path.join("university_of_colorado", "coaches", "all_coaches.json[0]")]
+        assert not results[os.path.join("university_of_colorado", "coaches", "all_coaches.json[1]")]
+
+
+NESTED_COACH = {
+    "name": "John Roe",
+    "position": "Offensive Line Coach",
+    "source_type": "news_report",
+    "source_url": "https://example.com/news",
+    "details": {"previous": [{"school": "Tulane University", "years": [2019, 2020]}], "rating": 4.5,
+                "extra": {"empty": {}, "list": [[], [None, True, False]]}},
+}
+
+# Raw roster JSON for the streaming tests; raw text so a repeated key
+# survives until the parser sees it
+STREAM_CASES = {
+    "valid": json.dumps(VALID_ROSTER),
+    "coaches_not_list": json.dumps(dict(VALID_ROSTER, coaches={"name": "Jane Doe"})),
+    "coaches_empty": json.dumps(dict(VALID_ROSTER, coaches=[])),
+    "duplicate_coaches_key": (
+        '{"school": "University of Oregon", "coaches": [{"name": "Bad Entry"}, 3], '
+        '"fetched_date": "2026-01-26", "coaches": %s}' % json.dumps(VALID_ROSTER["coaches"])
+    ),
+    "duplicate_coaches_key_not_list": (
+        '{"school": "University of Oregon", "fetched_date": "2026-01-26", '
+        '"coaches": %s, "coaches": "none"}' % json.dumps(VALID_ROSTER["coaches"])
+    ),
+    "nested_coach_objects": json.dumps(dict(
+        VALID_ROSTER, official_roster_url=None,
+        coaches=[NESTED_COACH, {"position": "Analyst", "details": {"a": [1, {"b": 2}]}}, ["not", "a", "dict"]]
+    )),
+}
+
+
+class TestValidateRosterStream:
+    """validate_roster_stream should match validate_roster_data on the loaded file."""
+
+    @pytest.mark.parametrize("case", list(STREAM_CASES))
+    def test_matches_validate_roster_data(self, case):
+        """Streaming and loading the same roster report the same result."""
+        pytest.importorskip("ijson")
+        raw = STREAM_CASES[case]
+
+        expected = validate_roster_data(json.loads(raw))
+        streamed = validate_roster_stream(io.BytesIO(raw.encode("utf-8")))
+
+        assert streamed == expected, f"{case}: streamed {streamed}, loaded {expected}"
+
+    def test_non_object_roster_not_streamed(self):
+        """A top-level array is left to validate_file's loaded-data check."""
+        pytest.importorskip("ijson")
+
+        assert validate_roster_stream(io.BytesIO(b"[]")) is None
+
+
+# Test methods per class in definition order, collected once for run_tests()
+_TEST_TABLE = [
+    (cls, tuple(name for name in vars(cls) if name.startswith('test_')))
+    for cls in (TestValidateTree, TestValidateRosterStream)
+]
+
+
+def run_tests():
+    """Run all tests manually (without pytest)."""
+    passed = 0
+    failed = 0
+
+    for test_class, method_names in _TEST_TABLE:
+        instance = test_class()
+        for method_name in method_names:
+            setup = getattr(instance, "setup_method", None)
+            teardown = getattr(instance, "teardown_method", None)
+            # Parametrized tests run once per case, as under pytest
+            calls = [(method_name, ())]
+            for mark in getattr(getattr(test_class, method_name), "pytestmark", []):
+                if mark.name == "parametrize":
+                    calls = [(f"{method_name}[{case}]", (case,)) for case in mark.args[1]]
+            for test_name, args in calls:
+                try:
+                    if setup:
+                        setup()
+                    getattr(instance, method_name)(*args)
+                    print(f"  PASS: {test_class.__name__}.{test_name}")
+                    passed += 1
+                except pytest.skip.Exception as e:
+                    print(f"  SKIP: {test_class.__name__}.{test_name} ({e})")
+                except AssertionError as e:
+                    print(f"  FAIL: {test_class.__name__}.{test_name}")
+                    print(f"        {e}")
+                    failed += 1
+                except Exception as e:
+                    print(f"  ERROR: {test_class.__name__}.{test_name}")
+                    print(f"         {e}")
+                    failed += 1
+                finally:
+                    if teardown:
+                        teardown()
+
+    print(f"\nResults: {passed} passed, {failed} failed")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    print("Running validate.py tests...\n")
+    success = run_tests()
+    sys.exit(0 if success else 1)